@@ -0,0 +1,33 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+"""Performance benchmarks for ``human-friendly_pedantic-timedelta``.
+
+The modules herein follow the `asv <https://asv.readthedocs.io/>`__ layout
+(``time_*`` functions, and classes with ``time_*`` methods, optional
+``setup`` methods, and ``params``), so they can be run by asv, or offline,
+without extra dependencies, using::
+
+    $ python -m benchmarks.run --output .benchmarks/HEAD.json
+"""
@@ -0,0 +1,58 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Benchmarks for summarizing many time durations."""
+
+import math
+import random
+
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.aggregate import DurationAggregator
+
+
+class TimeAggregate(object):
+    def setup(self):
+        rnd = random.Random(23)
+        self.seconds = [rnd.lognormvariate(4, 2.5) for _ in range(10000)]
+        self.aggregator = DurationAggregator()
+        self.aggregator.update(self.seconds)
+
+    def time_add(self):
+        aggregator = DurationAggregator()
+        for secs in self.seconds:
+            aggregator.add(secs)
+
+    def time_update(self):
+        DurationAggregator().update(self.seconds)
+
+    def time_summary(self):
+        self.aggregator.summary()
+
+    def time_sort_baseline(self):
+        # The all-in-memory approach that the aggregator replaces.
+        ordered = sorted(PedanticTimedelta(seconds=secs) for secs in self.seconds)
+        for percent in DurationAggregator.DEFAULT_PERCENTILES:
+            index = max(1, math.ceil(percent * len(ordered) / 100)) - 1
+            ordered[index].time_format_scaled()
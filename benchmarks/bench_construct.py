@@ -0,0 +1,75 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+"""Benchmarks for PedanticTimedelta construction."""
+
+from datetime import timedelta
+from fractions import Fraction
+
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.big import BigTimedelta
+
+_ONE_THIRD = Fraction(1, 3)
+
+
+def time_timedelta_baseline():
+    timedelta(hours=1, seconds=5)
+
+
+def time_new_stock_units():
+    PedanticTimedelta(hours=1, seconds=5)
+
+
+def time_new_extended_units():
+    PedanticTimedelta(years=1, months=2, fortnights=1, hours=1, seconds=5)
+
+
+def time_new_big_stock_units():
+    BigTimedelta(hours=1, seconds=5)
+
+
+def time_new_big_geological_units():
+    BigTimedelta(eons=2, megaannums=3, years=1)
+
+
+class TimeExactUnitConversion(object):
+    """Compare the exact unit conversion with the (default) float one."""
+
+    params = [False, True]
+    param_names = ['exact']
+
+    def setup(self, exact):
+        PedanticTimedelta.EXACT_UNIT_CONVERSION = exact
+
+    def teardown(self, exact):
+        PedanticTimedelta.EXACT_UNIT_CONVERSION = False
+
+    def time_new_int_units(self, exact):
+        PedanticTimedelta(years=1, months=2, fortnights=1, hours=1, seconds=5)
+
+    def time_new_float_units(self, exact):
+        PedanticTimedelta(years=1.5, months=2.25, hours=1, seconds=5)
+
+    def time_new_fraction_units(self, exact):
+        PedanticTimedelta(months=_ONE_THIRD, hours=1)
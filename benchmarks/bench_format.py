@@ -0,0 +1,128 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+"""Benchmarks for formatting time durations."""
+
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.big import BigTimedelta
+from pedantic_timedelta.cache import FormatCache
+from pedantic_timedelta.formatter import DurationFormatter
+
+
+class TimeFormatScaled(object):
+    params = list(range(
+        PedanticTimedelta.UNIT_NAME_INDEX_0, PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+    ))
+    param_names = ['abbreviate']
+
+    def setup(self, abbreviate):
+        self.ptd = PedanticTimedelta(seconds=12345.678)
+        # Warm the memoized plural forms.
+        self.ptd.time_format_scaled(abbreviate=abbreviate)
+
+    def time_format_scaled(self, abbreviate):
+        self.ptd.time_format_scaled(abbreviate=abbreviate)
+
+    def time_new_and_format_scaled(self, abbreviate):
+        PedanticTimedelta(seconds=12345.678).time_format_scaled(abbreviate=abbreviate)
+
+
+class TimeFormatSeconds(object):
+    def setup(self):
+        PedanticTimedelta.format_seconds(0.734)
+
+    def time_format_seconds(self):
+        PedanticTimedelta.format_seconds(0.734)
+
+    def time_format_elapsed(self):
+        PedanticTimedelta.time_format_elapsed(1000.0, 1150.0)
+
+    def time_format_elapsed_now(self):
+        PedanticTimedelta.time_format_elapsed(1000.0)
+
+    def time_format_nanoseconds(self):
+        PedanticTimedelta.format_nanoseconds(734000000)
+
+    def time_format_elapsed_ns(self):
+        PedanticTimedelta.time_format_elapsed_ns(1000000000000, 1150000000000)
+
+    def time_format_elapsed_ns_now(self):
+        PedanticTimedelta.time_format_elapsed_ns(1000000000000)
+
+
+class TimeBigTimedelta(object):
+    def setup(self):
+        self.big = BigTimedelta(gigaannums=1.5)
+        self.big.time_format_scaled()
+
+    def time_format_scaled(self):
+        self.big.time_format_scaled()
+
+    def time_add_and_format_scaled(self):
+        (self.big + self.big).time_format_scaled()
+
+
+class TimePluralize(object):
+    def setup(self):
+        PedanticTimedelta._plural_forms('second', PedanticTimedelta.UNIT_NAME_ABBREV)
+
+    def time_pluralize_memoized(self):
+        PedanticTimedelta._pluralize_periodify(
+            2.5, 'sec', 'second', PedanticTimedelta.UNIT_NAME_ABBREV,
+        )
+
+    def time_pluralize_inflector(self):
+        PedanticTimedelta._pluralize_periodify_inflector(
+            2.5, 'sec', 'second', PedanticTimedelta.UNIT_NAME_ABBREV,
+        )
+
+
+class TimeDurationFormatter(object):
+    def setup(self):
+        self.formatter = DurationFormatter()
+        self.seconds = [secs * 1.37 for secs in range(1000)]
+        self.formatter(0.734)
+
+    def time_formatter_call(self):
+        self.formatter(0.734)
+
+    def time_formatter_map(self):
+        self.formatter.map(self.seconds)
+
+    def time_iter_format(self):
+        list(PedanticTimedelta.iter_format(self.seconds))
+
+
+class TimeFormatCache(object):
+    def setup(self):
+        self.cache = FormatCache()
+        self.ptd = PedanticTimedelta(seconds=30)
+        self.cache.format_seconds(30)
+        self.cache.format_seconds(self.ptd)
+
+    def time_cache_hit_seconds(self):
+        self.cache.format_seconds(30)
+
+    def time_cache_hit_timedelta(self):
+        self.cache.format_seconds(self.ptd)
@@ -0,0 +1,53 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Benchmarks for parsing formatted time durations."""
+
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.parser import parse, parse_many, parse_seconds
+
+
+class TimeParse(object):
+    def setup(self):
+        self.texts = list(PedanticTimedelta.iter_format(
+            secs * 1.37 for secs in range(1000)
+        ))
+        # Warm the unit names table.
+        parse_seconds(self.texts[0])
+
+    def time_parse(self):
+        parse('2.50 mins.')
+
+    def time_parse_seconds(self):
+        parse_seconds('2.50 mins.')
+
+    def time_parse_composite(self):
+        parse_seconds('3 days 4 hours 12 mins.')
+
+    def time_parse_many(self):
+        parse_many(self.texts)
+
+    def time_parse_many_as_seconds(self):
+        parse_many(self.texts, as_seconds=True)
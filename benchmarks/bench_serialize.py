@@ -0,0 +1,63 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Benchmarks for pickling, copying, and packing time durations."""
+
+import copy
+import pickle
+from datetime import timedelta
+
+from pedantic_timedelta import PedanticTimedelta
+
+
+class TimeSerialize(object):
+    def setup(self):
+        self.ptd = PedanticTimedelta(days=3, seconds=5)
+        self.ptds = [PedanticTimedelta(seconds=secs * 1.37) for secs in range(10000)]
+        self.timedeltas = [timedelta(seconds=secs * 1.37) for secs in range(10000)]
+        self.pickled = pickle.dumps(self.ptds, pickle.HIGHEST_PROTOCOL)
+        self.pickled_timedeltas = pickle.dumps(self.timedeltas, pickle.HIGHEST_PROTOCOL)
+        self.packed = PedanticTimedelta.pack_many(self.ptds)
+
+    def time_copy(self):
+        copy.copy(self.ptd)
+
+    def time_deepcopy(self):
+        copy.deepcopy(self.ptd)
+
+    def time_pickle_dumps(self):
+        pickle.dumps(self.ptds, pickle.HIGHEST_PROTOCOL)
+
+    def time_pickle_loads(self):
+        pickle.loads(self.pickled)
+
+    def time_pickle_loads_plain_timedeltas(self):
+        pickle.loads(self.pickled_timedeltas)
+
+    def time_pack_many(self):
+        PedanticTimedelta.pack_many(self.ptds)
+
+    def time_unpack_many(self):
+        PedanticTimedelta.unpack_many(self.packed)
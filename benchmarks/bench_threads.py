@@ -0,0 +1,78 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Benchmarks for formatting from many threads at once.
+
+Each benchmark does the same total amount of work, split across
+``threads`` threads. On a free-threaded Python build, the time should
+drop as threads are added (up to the number of cores); with the GIL,
+it stays about the same.
+"""
+
+import threading
+
+from pedantic_timedelta import PedanticTimedelta
+
+TOTAL_VALUES = 8192
+
+
+def run_in_threads(threads, target):
+    barrier = threading.Barrier(threads)
+    per_thread = TOTAL_VALUES // threads
+
+    def work():
+        barrier.wait()
+        target(per_thread)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def format_values(count):
+    format_seconds = PedanticTimedelta.format_seconds
+    for secs in range(count):
+        format_seconds(secs * 1.37)
+
+
+def construct_and_format_values(count):
+    for secs in range(count):
+        PedanticTimedelta(seconds=secs * 1.37).time_format_scaled()
+
+
+class TimeThreads(object):
+    params = [1, 2, 4, 8, 32]
+    param_names = ['threads']
+
+    def setup(self, threads):
+        format_values(1)
+
+    def time_format_seconds(self, threads):
+        run_in_threads(threads, format_values)
+
+    def time_construct_and_format(self, threads):
+        run_in_threads(threads, construct_and_format_values)
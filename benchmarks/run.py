@@ -0,0 +1,197 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+"""Run the benchmarks (without asv), and save or compare the results.
+
+Run from the project root, e.g.::
+
+    # Save results for the current commit.
+    $ python -m benchmarks.run --output .benchmarks/before.json
+    # ... make changes ...
+    # Compare against the saved results (exits 1 on a regression).
+    $ python -m benchmarks.run --compare .benchmarks/before.json
+
+Results are saved as JSON, keyed by benchmark name, with the best
+(i.e., minimum) time per call, in seconds, of several repeats.
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from functools import partial
+
+import benchmarks
+
+RESULTS_VERSION = 1
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run_benchmarks(collect_benchmarks(args.match), args.repeat)
+    report = {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+    if args.output:
+        output_dir = os.path.dirname(args.output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressed = compare_results(baseline['results'], results, args.threshold)
+        return 1 if regressed else 0
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Run pedantic_timedelta benchmarks.')
+    parser.add_argument(
+        '-k', '--match', default='',
+        help='only run benchmarks whose name contains this string',
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='number of timing repeats (best is kept; default: 5)',
+    )
+    parser.add_argument('-o', '--output', help='save results to this JSON file')
+    parser.add_argument('-c', '--compare', help='compare against this JSON file')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=1.5,
+        help='slowdown ratio reported as a regression (default: 1.5)',
+    )
+    return parser.parse_args(argv)
+
+
+def collect_benchmarks(match=''):
+    """Return (name, setup, func, teardown) for each benchmark, à la asv."""
+    collected = []
+    package_path = os.path.dirname(benchmarks.__file__)
+    for module_info in pkgutil.iter_modules([package_path]):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module('benchmarks.' + module_info.name)
+        for name, obj in sorted(vars(module).items()):
+            if name.startswith('time_') and inspect.isfunction(obj):
+                collected.append((
+                    '{}.{}'.format(module_info.name, name), None, obj, None,
+                ))
+            elif inspect.isclass(obj) and obj.__module__ == module.__name__:
+                collected.extend(collect_class(module_info.name, obj))
+    return [bench for bench in collected if match in bench[0]]
+
+
+def collect_class(module_name, bench_cls):
+    collected = []
+    params = getattr(bench_cls, 'params', None)
+    param_names = getattr(bench_cls, 'param_names', ['param'])
+    methods = inspect.getmembers(bench_cls, inspect.isfunction)
+    for method_name, _method in sorted(methods):
+        if not method_name.startswith('time_'):
+            continue
+        for param_args in ([(param, ) for param in params] if params else [()]):
+            instance = bench_cls()
+            name = '{}.{}.{}'.format(module_name, bench_cls.__name__, method_name)
+            if param_args:
+                name += '({}={!r})'.format(param_names[0], param_args[0])
+            setup = getattr(instance, 'setup', None)
+            teardown = getattr(instance, 'teardown', None)
+            collected.append((
+                name,
+                partial(setup, *param_args) if setup else None,
+                partial(getattr(instance, method_name), *param_args),
+                partial(teardown, *param_args) if teardown else None,
+            ))
+    return collected
+
+
+def run_benchmarks(collected, repeat):
+    results = {}
+    for name, setup, func, teardown in collected:
+        if setup is not None:
+            setup()
+        try:
+            timer = timeit.Timer(func)
+            number, _time_taken = timer.autorange()
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+        finally:
+            if teardown is not None:
+                teardown()
+        results[name] = {'seconds': best, 'number': number, 'repeat': repeat}
+        print('{:<70} {:>12}'.format(name, format_time(best)))
+    return results
+
+
+def compare_results(baseline, results, threshold):
+    """Print the change in each benchmark, and return True on any regression."""
+    regressed = False
+    print()
+    print('{:<70} {:>12} {:>12} {:>7}'.format('benchmark', 'before', 'after', 'ratio'))
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        before = baseline[name]['seconds']
+        ratio = result['seconds'] / before
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        print('{:<70} {:>12} {:>12} {:>6.2f}x{}'.format(
+            name, format_time(before), format_time(result['seconds']), ratio, flag,
+        ))
+    return regressed
+
+
+def format_time(seconds):
+    for scale, unit in ((1e-9, 'ns'), (1e-6, 'µs'), (1e-3, 'ms')):
+        if seconds < scale * 1000:
+            return '{:.2f} {}'.format(seconds / scale, unit)
+    return '{:.2f} s'.format(seconds)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -24,14 +24,84 @@
 
 """A Human-friendly Pedantic `timedelta` formatter."""
 
-from gettext import gettext as _
-
+import array
+import os
+import struct
+import sys
 import time
+from bisect import bisect_right
+from collections import namedtuple
+from collections.abc import Mapping
 from datetime import timedelta
-from inflector import Inflector, English
+from math import gcd
+from types import MappingProxyType
+
+# This module avoids importing gettext and inflector until a name is
+# first formatted, so that importing this package stays cheap for the many
+# short-lived CLI tools that use it (but might not format a duration).
+
+
+def N_(message):
+    """Mark *message* for translation, but do not translate it (yet)."""
+    return message
+
+
+class _LazyUnitNames(Mapping):
+    """Read-only UNIT_NAMES mapping that translates all names on first use."""
+
+    __slots__ = ('_untranslated', '_translated')
+
+    def __init__(self, untranslated):
+        self._untranslated = untranslated
+        self._translated = None
+
+    def _unit_names(self):
+        translated = self._translated
+        if translated is None:
+            from gettext import gettext as _
+            translated = {
+                unit: tuple(_(name) for name in names)
+                for unit, names in self._untranslated.items()
+            }
+            self._translated = translated
+        return translated
+
+    def __getitem__(self, unit):
+        return self._unit_names()[unit]
+
+    def __contains__(self, unit):
+        return unit in self._untranslated
+
+    def __iter__(self):
+        return iter(self._untranslated)
+
+    def __len__(self):
+        return len(self._untranslated)
+
+    def __repr__(self):
+        return repr(self._unit_names())
 
-import logging
-log = logging.getLogger('timedelta_wrap')
+
+# The units that time_format_scaled may use (see set_unit_ladder).
+# - lkup_units and s_scales are ordered smallest to largest, and thresholds
+#   is s_scales[1:]. A value is formatted using the unit at index
+#   bisect_right(thresholds, secs), i.e., the largest unit of which there
+#   is at least 1 (or the smallest unit, for values less than 1 of it).
+# - composite is the (lkup_unit, microseconds-per-unit) pairs, ordered
+#   largest to smallest, used by format_composite.
+# - ns_scales and ns_thresholds are s_scales and thresholds in (integer)
+#   nanoseconds, used by format_nanoseconds.
+_UnitLadder = namedtuple(
+    '_UnitLadder',
+    ('lkup_units', 's_scales', 'thresholds', 'composite', 'ns_scales', 'ns_thresholds'),
+)
+
+try:
+    _perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # pragma: no cover
+    # Python < 3.7.
+    def _perf_counter_ns():
+        return int(time.perf_counter() * 1000000000)
 
 
 class PedanticTimedelta(timedelta):
@@ -48,6 +118,18 @@ class PedanticTimedelta(timedelta):
         the same number of days, this class fudges the calculation,
         allowing one to specify imprecise time deltas.
 
+    .. NOTE::
+
+        Formatting and construction are thread-safe, and take no locks,
+        including on free-threaded Python builds. The shared lookup tables
+        (:py:attr:`UNIT_NAMES`, :py:attr:`UNIT_SECONDS`, the unit ladder,
+        and the plural forms table) are read-only, and are replaced as a
+        whole (by :py:meth:`set_unit_ladder` or
+        :py:meth:`refresh_plural_forms`), never modified in place, so each
+        thread sees either the old table or the new one. Tables that are
+        built lazily, on first use, might be built by more than one thread
+        at once, but the results are the same.
+
     :cvar DAYS_IN_YEAR: Mean tropical year (using Laskar's expression)
                         on January 1, 2000.
 
@@ -85,15 +167,22 @@ class PedanticTimedelta(timedelta):
     SECS_IN_MONTH = SECS_IN_YEAR / 12.0  # 2629743.7608
     """SECS_IN_YEAR / 12.0"""
 
-    UNIT_NAMES = {
-        # indices:    0            1       2        3         4          5         6
-        'year':   (_('year'),   _('y'), _('yr'), _('yēr'), _('yrs.'), _('yr'),  _('year')),  # noqa
-        'month':  (_('month'),  _('m'), _('mo'), _('mon'), _('mos.'), _('mon'), _('month')), # noqa
-        'day':    (_('day'),    _('d'), _('dā'), _('day'), _('days'), _('day'), _('day')),   # noqa
-        'hour':   (_('hour'),   _('H'), _('hr'), _('our'), _('hrs.'), _('hr'),  _('hour')),  # noqa
-        'minute': (_('minute'), _('M'), _('m.'), _('min'), _('mins'), _('min'), _('min')),   # noqa
-        'second': (_('second'), _('S'), _('s.'), _('sec'), _('secs'), _('sec'), _('sec')),   # noqa
-    }
+    UNIT_NAMES = _LazyUnitNames({
+        # indices:          0                  1        2         3          4           5          6  # noqa
+        'millennium':  (N_('millennium'),  N_('K'), N_('ky'), N_('mil'), N_('mils'), N_('mil'), N_('millennium')),  # noqa
+        'century':     (N_('century'),     N_('C'), N_('cy'), N_('cen'), N_('cens'), N_('cen'), N_('century')),     # noqa
+        'decade':      (N_('decade'),      N_('D'), N_('dy'), N_('dec'), N_('decs'), N_('dec'), N_('decade')),      # noqa
+        'year':        (N_('year'),        N_('y'), N_('yr'), N_('yēr'), N_('yrs.'), N_('yr'),  N_('year')),        # noqa
+        'month':       (N_('month'),       N_('m'), N_('mo'), N_('mon'), N_('mos.'), N_('mon'), N_('month')),       # noqa
+        'fortnight':   (N_('fortnight'),   N_('F'), N_('fn'), N_('fnt'), N_('fnts'), N_('fn'),  N_('fortnight')),   # noqa
+        'week':        (N_('week'),        N_('w'), N_('wk'), N_('wek'), N_('wks.'), N_('wk'),  N_('week')),        # noqa
+        'day':         (N_('day'),         N_('d'), N_('dā'), N_('day'), N_('days'), N_('day'), N_('day')),         # noqa
+        'hour':        (N_('hour'),        N_('H'), N_('hr'), N_('our'), N_('hrs.'), N_('hr'),  N_('hour')),        # noqa
+        'minute':      (N_('minute'),      N_('M'), N_('m.'), N_('min'), N_('mins'), N_('min'), N_('min')),         # noqa
+        'second':      (N_('second'),      N_('S'), N_('s.'), N_('sec'), N_('secs'), N_('sec'), N_('sec')),         # noqa
+        'millisecond': (N_('millisecond'), N_('ṃ'), N_('ms'), N_('mls'), N_('msec'), N_('ms'),  N_('ms')),          # noqa
+        'microsecond': (N_('microsecond'), N_('µ'), N_('µs'), N_('µsc'), N_('µsec'), N_('µs'),  N_('µs')),          # noqa
+    })
     UNIT_NAME_FULL = 0
     UNIT_NAME_ONECH = 1
     UNIT_NAME_TWOCH = 2
@@ -103,10 +192,127 @@ class PedanticTimedelta(timedelta):
     UNIT_NAME_ABBREV = 6
     #
     UNIT_NAME_INDEX_0 = 0
-    UNIT_NAME_INDEX_N = len(UNIT_NAMES['year']) - 1
+    UNIT_NAME_INDEX_N = UNIT_NAME_ABBREV
+
+    _PLURALIZED_ABBREVS = (UNIT_NAME_FULL, UNIT_NAME_BRIEF, UNIT_NAME_ABBREV)
+
+    PLURALIZE_WITH_INFLECTOR = False
+    """
+    Set True to pluralize unit names using Inflector on every format call,
+    rather than using the table of precomputed forms (see
+    :py:meth:`refresh_plural_forms`).
+    """
+
+    EXACT_UNIT_CONVERSION = False
+    """
+    Set True to have the constructor convert its arguments to microseconds
+    using exact (integer and :class:`fractions.Fraction`) arithmetic,
+    rounding only once, to the nearest microsecond (half to even). Otherwise,
+    months, years, etc., are converted to days using float arithmetic,
+    whose error can build up when summing many values. Float arguments
+    are converted exactly (e.g., ``0.1`` is not quite one tenth), but
+    :class:`fractions.Fraction` and :class:`decimal.Decimal` arguments
+    are also accepted.
+    """
+
+    FORMAT_CACHE = None
+    """
+    Set to a :py:class:`pedantic_timedelta.cache.FormatCache` to memoize the
+    results of :py:meth:`time_format_scaled` (see
+    :py:func:`pedantic_timedelta.cache.enable_format_cache`).
+    """
+
+    # Populated by refresh_plural_forms() on first use, and again whenever
+    # UNIT_NAMES is replaced. A (unit_names, plural_forms) tuple, where
+    # unit_names is the UNIT_NAMES object from which the table was built,
+    # and plural_forms is a read-only mapping of
+    # (lkup_unit, abbreviate) → (tm_unit, singular, plural).
+    _PLURAL_FORMS = (None, None)
+
+    UNIT_SECONDS = MappingProxyType({
+        'millennium': 1000 * SECS_IN_YEAR,
+        'century': 100 * SECS_IN_YEAR,
+        'decade': 10 * SECS_IN_YEAR,
+        'year': SECS_IN_YEAR,
+        'month': SECS_IN_MONTH,
+        'fortnight': 14 * SECS_IN_DAY,
+        'week': 7 * SECS_IN_DAY,
+        'day': SECS_IN_DAY,
+        'hour': 60.0 * 60.0,
+        'minute': 60.0,
+        'second': 1.0,
+        'millisecond': 0.001,
+        'microsecond': 0.000001,
+    })
+    """Number of seconds in each unit named in :py:attr:`UNIT_NAMES` (read-only)."""
+
+    DEFAULT_UNIT_LADDER = ('second', 'minute', 'hour', 'day', 'month', 'year')
+    """Units used by :py:meth:`time_format_scaled` unless
+    :py:meth:`set_unit_ladder` is called."""
+
+    # A _UnitLadder, populated by set_unit_ladder() after the class is created.
+    # - The ladder is replaced as a whole and never modified, so a reader
+    #   never sees a half-updated ladder.
+    _UNIT_LADDER = None
+
+    # Days in each of the units that __new__ accepts beyond timedelta's own,
+    # in the order of _extended_as_days' arguments.
+    # Ref: https://en.wikipedia.org/wiki/Unit_of_time
+    _EXTENDED_UNIT_DAYS = (
+        14,                             # fortnights
+        DAYS_IN_MONTH,                  # months
+        0.25 * DAYS_IN_YEAR,            # seasons
+        DAYS_IN_YEAR,                   # years
+        2 * DAYS_IN_YEAR,               # bienniums
+        10 * DAYS_IN_YEAR,              # decades
+        50 * DAYS_IN_YEAR,              # jubilees
+        100 * DAYS_IN_YEAR,             # centuries
+        1000 * DAYS_IN_YEAR,            # millenniums
+        1000000 * DAYS_IN_YEAR,         # ages
+        1000000 * DAYS_IN_YEAR,         # megaannums
+        10000000 * DAYS_IN_YEAR,        # epochs
+        100000000 * DAYS_IN_YEAR,       # eras
+        500000000 * DAYS_IN_YEAR,       # eons
+        1000000000 * DAYS_IN_YEAR,      # gigaannums
+    )
+
+    # Microseconds in each of __new__'s arguments, in order, for
+    # EXACT_UNIT_CONVERSION. Laskar's year, 365.242189 days, is a whole
+    # number of microseconds, as are its twelfth (a month) and its quarter.
+    _US_IN_DAY = SECS_IN_DAY * 1000000
+    _US_IN_YEAR = round(DAYS_IN_YEAR * 1000000) * SECS_IN_DAY
+    _EXACT_UNIT_MICROSECONDS = (
+        _US_IN_DAY,                     # days
+        1000000,                        # seconds
+        1,                              # microseconds
+        1000,                           # milliseconds
+        60 * 1000000,                   # minutes
+        60 * 60 * 1000000,              # hours
+        7 * _US_IN_DAY,                 # weeks
+        14 * _US_IN_DAY,                # fortnights
+        _US_IN_YEAR // 12,              # months
+        _US_IN_YEAR // 4,               # seasons
+        _US_IN_YEAR,                    # years
+        2 * _US_IN_YEAR,                # bienniums
+        10 * _US_IN_YEAR,               # decades
+        50 * _US_IN_YEAR,               # jubilees
+        100 * _US_IN_YEAR,              # centuries
+        1000 * _US_IN_YEAR,             # millenniums
+        1000000 * _US_IN_YEAR,          # ages
+        1000000 * _US_IN_YEAR,          # megaannums
+        10000000 * _US_IN_YEAR,         # epochs
+        100000000 * _US_IN_YEAR,        # eras
+        500000000 * _US_IN_YEAR,        # eons
+        1000000000 * _US_IN_YEAR,       # gigaannums
+    )
 
     # ***
 
+    # Cache the seconds value and the unit choice on the instance, but do not
+    # give each instance a __dict__ (and keep instances immutable, like their
+    # parent: see __setattr__). Both slots are populated lazily, on first use.
+    __slots__ = ('_total_seconds', '_unit_and_scale')
+
     # We override __new__ and not __init__ because we want to be
     # called before timedelta.__init__.
     def __new__(
@@ -149,7 +355,8 @@ class PedanticTimedelta(timedelta):
         (Note that all arguments are optional and default to 0.
         Arguments may be integers or floats, and may be positive or negative.
         Only days, seconds and microseconds are stored internally.
-        Other arguments are converted to those units and added together.)
+        Other arguments are converted to those units and added together,
+        using float arithmetic, unless :py:attr:`EXACT_UNIT_CONVERSION` is set.)
 
         :param fortnights: 14 days each.
         :param months: Approximated as :py:attr:`DAYS_IN_MONTH`.
@@ -183,81 +390,100 @@ class PedanticTimedelta(timedelta):
         :type eons: float
         :type gigaannums: float
         """
-        def new_timedelta():
-            totaled_days = as_days()
-            must_not_be_more_than_2737909_years(totaled_days)
-            return new_object(totaled_days)
-
-        def as_days():
-            totaled_days = days
-            # Ref: https://en.wikipedia.org/wiki/Unit_of_time
-            # FIXME: 2015.02.04: Needs testing, especially because overflows
-            #        might mean parent class can only represent so many days.
-            n_years = 0
-            n_years +=   1000000000 * gigaannums    # noqa: E222
-            n_years +=    500000000 * eons          # noqa: E222
-            n_years +=    100000000 * eras          # noqa: E222
-            n_years +=     10000000 * epochs        # noqa: E222
-            n_years +=      1000000 * megaannums    # noqa: E222
-            n_years +=      1000000 * ages          # noqa: E222
-            n_years +=         1000 * millenniums   # noqa: E222
-            n_years +=          100 * centuries     # noqa: E222
-            n_years +=           50 * jubilees      # noqa: E222
-            n_years +=           10 * decades       # noqa: E222
-            n_years +=            2 * bienniums     # noqa: E222
-            n_years +=            1 * years         # noqa: E222
-            n_years +=         0.25 * seasons       # noqa: E222
-            n_days = n_years * PedanticTimedelta.DAYS_IN_YEAR
-            n_days += PedanticTimedelta.DAYS_IN_MONTH * months
-            n_days +=            14 * fortnights    # noqa: E222
-            totaled_days += n_days
-            return totaled_days
-
-        def must_not_be_more_than_2737909_years(totaled_days):
-            # Watch out for OverflowError.
-            #   >>> timedelta(math.pow(2,31))
-            #   OverflowError: normalized days too large to fit in a C int
-            # Also note different (but similar) errors, one being more helpful.
-            #   >>> timedelta(math.pow(2,30))
-            #   OverflowError: days=1073741824; must have magnitude <= 999999999
-            # Checking the more better error message:
-            #   >>> timedelta(999999999)
-            #   datetime.timedelta(999999999)
-            #   >>> timedelta(1000000000)
-            #   OverflowError: days=1000000000; must have magnitude <= 999999999
-            #
-            # BUG nnnn/WONTFIX: Support any int and not just C ints.
-            #     999999999/365.242189 = 2737909.3
-            #     so we can only support megaannums and nothing more.
-            #     (At least total_seconds() works 'til infinity!)
-            if totaled_days > 999999999:
-                raise ValueError(
-                    'pedantic_timedelta:'
-                    ' That many days is not supported.'
-                    ' Try <= 999999999'
-                )
-
-        def new_object(totaled_days):
-            td_cls = cls
-            if td_cls is None:
-                td_cls = timedelta
-            return timedelta.__new__(
-                td_cls,
-                days=totaled_days,
-                seconds=seconds,
-                microseconds=microseconds,
-                milliseconds=milliseconds,
-                minutes=minutes,
-                hours=hours,
-                weeks=weeks
+        if PedanticTimedelta.EXACT_UNIT_CONVERSION:
+            days, microseconds = divmod(
+                PedanticTimedelta._exact_microseconds((
+                    days, seconds, microseconds, milliseconds, minutes, hours,
+                    weeks, fortnights, months, seasons, years, bienniums,
+                    decades, jubilees, centuries, millenniums, ages,
+                    megaannums, epochs, eras, eons, gigaannums,
+                )),
+                PedanticTimedelta._US_IN_DAY,
+            )
+            seconds = milliseconds = minutes = hours = weeks = 0
+        # Skip the extended units' arithmetic when only stock timedelta
+        # arguments are used (and avoid building any lists or tuples).
+        elif (
+            fortnights or months or seasons or years or bienniums or decades
+            or jubilees or centuries or millenniums or ages or megaannums
+            or epochs or eras or eons or gigaannums
+        ):
+            days += PedanticTimedelta._extended_as_days(
+                fortnights, months, seasons, years, bienniums, decades,
+                jubilees, centuries, millenniums, ages, megaannums,
+                epochs, eras, eons, gigaannums,
             )
+        # Watch out for OverflowError.
+        #   >>> timedelta(math.pow(2,31))
+        #   OverflowError: normalized days too large to fit in a C int
+        # Also note different (but similar) errors, one being more helpful.
+        #   >>> timedelta(math.pow(2,30))
+        #   OverflowError: days=1073741824; must have magnitude <= 999999999
+        # Checking the more better error message:
+        #   >>> timedelta(999999999)
+        #   datetime.timedelta(999999999)
+        #   >>> timedelta(1000000000)
+        #   OverflowError: days=1000000000; must have magnitude <= 999999999
+        #
+        # BUG nnnn/WONTFIX: Support any int and not just C ints.
+        #     999999999/365.242189 = 2737909.3
+        #     so we can only support megaannums and nothing more.
+        #     (At least total_seconds() works 'til infinity!)
+        #     See pedantic_timedelta.big.BigTimedelta for larger durations.
+        if days > 999999999:
+            raise ValueError(
+                'pedantic_timedelta:'
+                ' That many days is not supported.'
+                ' Try <= 999999999, or use pedantic_timedelta.big.BigTimedelta'
+            )
+        return timedelta.__new__(
+            cls or timedelta,
+            days, seconds, microseconds, milliseconds, minutes, hours, weeks,
+        )
+
+    @staticmethod
+    def _extended_as_days(*counts):
+        return _sum_products(PedanticTimedelta._EXTENDED_UNIT_DAYS, counts)
 
-        return new_timedelta()
+    @staticmethod
+    def _exact_microseconds(counts):
+        # Sum the counts as one rational, total / denominator, using ints
+        # (which Fractions would, too, but more slowly), and round once.
+        total = 0
+        denominator = 1
+        units_microseconds = PedanticTimedelta._EXACT_UNIT_MICROSECONDS
+        for us_per_unit, count in zip(units_microseconds, counts):
+            if not count:
+                continue
+            if type(count) is int:
+                total += us_per_unit * count * denominator
+                continue
+            if type(count) is float:
+                numerator, count_denominator = count.as_integer_ratio()
+            else:
+                from fractions import Fraction
+                count = Fraction(count)
+                numerator, count_denominator = count.numerator, count.denominator
+            if denominator % count_denominator:
+                # Float denominators are powers of 2, so this is usually just
+                # a scale up to the larger one.
+                common = denominator // gcd(denominator, count_denominator)
+                total *= count_denominator // (denominator // common)
+                denominator = common * count_denominator
+            total += us_per_unit * numerator * (denominator // count_denominator)
+        if denominator == 1:
+            return total
+        # Round half to even, as timedelta does.
+        quotient, remainder = divmod(total, denominator)
+        remainder *= 2
+        if remainder > denominator or (remainder == denominator and quotient % 2):
+            quotient += 1
+        return quotient
 
     # ***
 
     @staticmethod
-    def time_format_elapsed(secs_then, secs_now=None):
+    def time_format_elapsed(secs_then, secs_now=None, clock=None):
         """Format elapsed time pedantically.
 
         :param secs_then: seconds at time of event (e.g., ``time.time()``).
@@ -265,19 +491,99 @@ class PedanticTimedelta(timedelta):
 
         :param secs_now: seconds from which to calculate elapsed time.
              Defaults to now if not specified (in which case `secs_then`
-             should be represented as seconds since epoch).
+             should be represented as seconds since epoch, or per *clock*).
         :type secs_now: float
 
+        :param clock: Function that returns now, if *secs_now* is not
+            specified. Defaults to ``time.time``. Use ``time.monotonic``
+            for elapsed times that are not affected by wall clock changes
+            (but see :py:meth:`time_format_elapsed_ns`).
+        :type clock: callable
+
         :return: elapsed time formatted using single unit of time
         :rtype: string
         """
         if secs_now is None:
-            secs_now = time.time()
-        secs_elapsed = secs_now - secs_then
-        tdw = PedanticTimedelta(seconds=secs_elapsed)
-        return tdw.time_format_scaled()[0]
+            secs_now = clock() if clock is not None else time.time()
+        # (format_seconds rounds to whole microseconds, as a timedelta would.)
+        return PedanticTimedelta.format_seconds(secs_now - secs_then)[0]
+
+    @staticmethod
+    def time_format_elapsed_ns(
+        ns_then,
+        ns_now=None,
+        clock=None,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+    ):
+        """Format elapsed time pedantically, from integer nanosecond timestamps.
+
+        The timestamps are subtracted as integers, and the difference is
+        scaled to the chosen unit with a single (correctly rounded) integer
+        division, so no precision is lost, no matter how large the
+        timestamps are.
+
+        >>> ns_then = time.perf_counter_ns()
+        >>> PedanticTimedelta.time_format_elapsed_ns(ns_then, ns_then + 90 * 10 ** 9)
+        '1.50 mins.'
+
+        :param ns_then: nanoseconds at time of event
+            (e.g., ``time.perf_counter_ns()``).
+        :type ns_then: int
+
+        :param ns_now: nanoseconds from which to calculate elapsed time.
+            Defaults to now, per *clock*.
+        :type ns_now: int
+
+        :param clock: Function that returns now, in integer nanoseconds, if
+            *ns_now* is not specified. Defaults to ``time.perf_counter_ns``.
+            Also consider ``time.monotonic_ns``, or ``time.time_ns`` (if
+            *ns_then* is nanoseconds since epoch).
+        :type clock: callable
 
-    def _validate_abbreviate(self, abbreviate=None):
+        :param field_width: See :py:meth:`time_format_scaled`.
+        :param precision: See :py:meth:`time_format_scaled`.
+        :param abbreviate: See :py:meth:`time_format_scaled`.
+
+        :return: elapsed time formatted using single unit of time
+        :rtype: string
+        """
+        if ns_now is None:
+            ns_now = clock() if clock is not None else _perf_counter_ns()
+        return PedanticTimedelta.format_nanoseconds(
+            ns_now - ns_then, field_width, precision, abbreviate,
+        )[0]
+
+    @staticmethod
+    def format_nanoseconds(ns, field_width=0, precision=2, abbreviate=None):
+        """Format an integer number of nanoseconds, like :py:meth:`format_seconds`.
+
+        The unit is chosen by comparing *ns* to the unit thresholds in
+        integer nanoseconds, so there is no float conversion until the
+        final, scaled value.
+
+        :param ns: Time duration in nanoseconds.
+        :type ns: int
+
+        See :py:meth:`time_format_scaled` for the other parameters.
+
+        :return: tuple containing (formatted time, nanoseconds in unit,
+            time unit)
+        :rtype: tuple(string, int, time-unit)
+
+        >>> PedanticTimedelta.format_nanoseconds(150 * 10 ** 9)
+        ('2.50 mins.', 60000000000, 'min')
+        """
+        ladder = PedanticTimedelta._UNIT_LADDER
+        unit_index = bisect_right(ladder.ns_thresholds, ns)
+        return PedanticTimedelta._format_scaled(
+            ns, ladder.lkup_units[unit_index], ladder.ns_scales[unit_index],
+            field_width, precision, abbreviate,
+        )
+
+    @staticmethod
+    def _validate_abbreviate(abbreviate=None):
         if abbreviate is None:
             # This is how code worked before abbrevs were added.
             return PedanticTimedelta.UNIT_NAME_ABBREV
@@ -288,6 +594,55 @@ class PedanticTimedelta(timedelta):
             return PedanticTimedelta.UNIT_NAME_FULL
         return abbreviate
 
+    def __setattr__(self, name, value):
+        """Raise AttributeError: instances are immutable."""
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        """Raise AttributeError: instances are immutable."""
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__name__)
+        )
+
+    def __reduce__(self):
+        """Pickle as (days, seconds, microseconds), unpickled by timedelta.__new__."""
+        # Unpickle using timedelta.__new__ directly, skipping our __new__'s
+        # (Python) argument handling, which would otherwise take about
+        # two thirds of the time. (Like timedelta's, do not pickle the
+        # cached _total_seconds and _unit_and_scale.)
+        return (
+            timedelta.__new__,
+            (type(self), self.days, self.seconds, self.microseconds),
+        )
+
+    def __copy__(self):
+        """Return self: instances are immutable."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return self: instances are immutable."""
+        return self
+
+    def total_seconds(self):
+        """Return the total number of seconds in the duration.
+
+        Same as :meth:`datetime.timedelta.total_seconds`, but computed
+        only once per instance.
+        """
+        try:
+            return self._total_seconds
+        except AttributeError:
+            secs = timedelta.total_seconds(self)
+            object.__setattr__(self, '_total_seconds', secs)
+            return secs
+
+    @staticmethod
+    def _choose_unit(secs, ladder):
+        unit_index = bisect_right(ladder[2], secs)
+        return ladder[0][unit_index], ladder[1][unit_index]
+
     def _determine_unit_and_scale(self):
         """Determine best time unit to use to represent time duration.
 
@@ -295,27 +650,18 @@ class PedanticTimedelta(timedelta):
         represent a time value as 1 of more of a unit, e.g., 1 second, 59
         minutes, 15 days, but never 61 seconds, 90 minutes, 35 days, etc.
 
-        :param abbreviate: Whether to use 2- or 3-character abbreviations.
-        :type abbreviate: bool
+        The choice is made once per instance and remembered (unless
+        :py:meth:`set_unit_ladder` is called to change the units).
         """
-        if self.total_seconds() >= PedanticTimedelta.SECS_IN_YEAR:
-            lkup_unit = 'year'
-            s_scale = PedanticTimedelta.SECS_IN_YEAR
-        elif self.total_seconds() >= PedanticTimedelta.SECS_IN_MONTH:
-            lkup_unit = 'month'
-            s_scale = PedanticTimedelta.SECS_IN_MONTH
-        elif self.total_seconds() >= PedanticTimedelta.SECS_IN_DAY:
-            lkup_unit = 'day'
-            s_scale = PedanticTimedelta.SECS_IN_DAY
-        elif self.total_seconds() >= (60 * 60):  # secs/min * mins/hour = secs/hour
-            lkup_unit = 'hour'
-            s_scale = 60.0 * 60.0  # secs_in_hour
-        elif self.total_seconds() >= 60:  # secs/min = secs/min
-            lkup_unit = 'minute'
-            s_scale = 60.0  # secs_in_minute
-        else:
-            lkup_unit = 'second'
-            s_scale = 1.0  # secs_in_second
+        ladder = PedanticTimedelta._UNIT_LADDER
+        try:
+            cached_ladder, lkup_unit, s_scale = self._unit_and_scale
+            if cached_ladder is ladder:
+                return lkup_unit, s_scale
+        except AttributeError:
+            pass
+        lkup_unit, s_scale = PedanticTimedelta._choose_unit(self.total_seconds(), ladder)
+        object.__setattr__(self, '_unit_and_scale', (ladder, lkup_unit, s_scale))
         return lkup_unit, s_scale
 
     def _units_and_scale(self, abbreviate=None):
@@ -324,12 +670,22 @@ class PedanticTimedelta(timedelta):
         tm_unit = PedanticTimedelta.UNIT_NAMES[lkup_unit][abbreviate]
         return tm_unit, s_scale, lkup_unit, abbreviate
 
-    def _pluralize_periodify(self, adj_time, tm_unit, lkup_unit, abbreviate):
-        if abbreviate in (
-            PedanticTimedelta.UNIT_NAME_FULL,
-            PedanticTimedelta.UNIT_NAME_BRIEF,
-            PedanticTimedelta.UNIT_NAME_ABBREV,
-        ):
+    @staticmethod
+    def _pluralize_periodify(adj_time, tm_unit, lkup_unit, abbreviate):
+        if not PedanticTimedelta.PLURALIZE_WITH_INFLECTOR:
+            unit_name, singular, plural = PedanticTimedelta._plural_forms(
+                lkup_unit, abbreviate,
+            )
+            if unit_name == tm_unit:
+                return plural if adj_time > 1 else singular
+        return PedanticTimedelta._pluralize_periodify_inflector(
+            adj_time, tm_unit, lkup_unit, abbreviate,
+        )
+
+    @staticmethod
+    def _pluralize_periodify_inflector(adj_time, tm_unit, lkup_unit, abbreviate):
+        if abbreviate in PedanticTimedelta._PLURALIZED_ABBREVS:
+            from inflector import English, Inflector
             # (lb): I timeit'd Inflector().pluralize vs. inflectr=Inflector();
             # inflectr.pluralize. Creating object ahead of time is not faster.
             tm_units = Inflector(English).conditional_plural(adj_time, tm_unit)
@@ -341,6 +697,137 @@ class PedanticTimedelta(timedelta):
             tm_units = tm_unit
         return tm_units
 
+    @staticmethod
+    def set_unit_ladder(units=None, unit_names=None):
+        """Choose the time units that :py:meth:`time_format_scaled` may use.
+
+        The units are kept in a sorted table, and the unit for a value is
+        found with a binary search, so it costs about the same to choose
+        from many units as it does to choose from a few. The ladder is
+        shared by all subclasses (as is :py:attr:`UNIT_NAMES`).
+
+        >>> PedanticTimedelta.set_unit_ladder(
+        ...     ('millisecond', 'second', 'minute', 'hour', 'day', 'week'))
+        >>> PedanticTimedelta(days=45).time_format_scaled()
+        ('6.43 weeks', 604800, 'week')
+        >>> PedanticTimedelta.set_unit_ladder()
+
+        :param units: The units to use, in any order. Each item is either
+            the name of a unit in :py:attr:`UNIT_SECONDS`, or a
+            (name, seconds-per-unit) tuple. If not specified, restores
+            :py:attr:`DEFAULT_UNIT_LADDER`.
+        :type units: iterable of str or tuple(str, float)
+
+        :param unit_names: Unit names to add to (or replace in)
+            :py:attr:`UNIT_NAMES`, keyed by unit, each a tuple of
+            names for each *abbreviate* index.
+        :type unit_names: dict
+
+        :raises ValueError: If a unit is unknown, has no names, is not a
+            positive duration, or has the same duration as another unit.
+        """
+        if unit_names:
+            combined = dict(PedanticTimedelta.UNIT_NAMES)
+            combined.update(
+                (lkup_unit, tuple(names)) for lkup_unit, names in unit_names.items()
+            )
+            PedanticTimedelta.UNIT_NAMES = MappingProxyType(combined)
+        if units is None:
+            units = PedanticTimedelta.DEFAULT_UNIT_LADDER
+        ladder = []
+        for unit in units:
+            if isinstance(unit, str):
+                lkup_unit, s_scale = unit, PedanticTimedelta.UNIT_SECONDS.get(unit)
+            else:
+                lkup_unit, s_scale = unit
+            if s_scale is None or lkup_unit not in PedanticTimedelta.UNIT_NAMES:
+                raise ValueError(
+                    'pedantic_timedelta: Unknown unit: {}'.format(lkup_unit)
+                )
+            if not s_scale > 0:
+                raise ValueError(
+                    'pedantic_timedelta: Unit must be positive: {}'.format(lkup_unit)
+                )
+            ladder.append((s_scale, lkup_unit))
+        if not ladder:
+            raise ValueError('pedantic_timedelta: Specify at least one unit')
+        ladder.sort()
+        s_scales = tuple(s_scale for s_scale, _lkup_unit in ladder)
+        if len(set(s_scales)) != len(s_scales):
+            raise ValueError('pedantic_timedelta: Units must not be the same size')
+        lkup_units = tuple(lkup_unit for _s_scale, lkup_unit in ladder)
+        composite = tuple(
+            (lkup_unit, round(s_scale * 1000000))
+            for s_scale, lkup_unit in reversed(ladder)
+            if s_scale >= 0.000001
+        )
+        ns_scales = tuple(round(s_scale * 1000000000) for s_scale in s_scales)
+        PedanticTimedelta._UNIT_LADDER = _UnitLadder(
+            lkup_units, s_scales, s_scales[1:], composite, ns_scales, ns_scales[1:],
+        )
+
+    @staticmethod
+    def get_unit_ladder():
+        """Return the units that :py:meth:`time_format_scaled` may use.
+
+        :return: (unit, seconds-per-unit) tuples, smallest unit first.
+        :rtype: tuple
+        """
+        ladder = PedanticTimedelta._UNIT_LADDER
+        return tuple(zip(ladder.lkup_units, ladder.s_scales))
+
+    @staticmethod
+    def refresh_plural_forms():
+        """Rebuild the memoized pluralization table from :py:attr:`UNIT_NAMES`.
+
+        The singular and plural (and trailing-period) form of every unit name
+        is computed once, when first needed, so that formatting does not run
+        the (regex-based) Inflector on every call. The default
+        :py:attr:`UNIT_NAMES` is read-only: to change the names, pass them to
+        :py:meth:`set_unit_ladder` (as *unit_names*), or assign a new mapping
+        to :py:attr:`UNIT_NAMES`, and the table is rebuilt automatically.
+        If you then edit an assigned dict in place, call this method to
+        rebuild the table (or set :py:attr:`PLURALIZE_WITH_INFLECTOR` to
+        pluralize live on every call).
+
+        :return: Mapping of (unit, abbreviate) → (name, singular, plural).
+        :rtype: types.MappingProxyType
+        """
+        unit_names = PedanticTimedelta.UNIT_NAMES
+        plural_forms = {}
+        for lkup_unit, names in unit_names.items():
+            for abbreviate, tm_unit in enumerate(names):
+                plural_forms[(lkup_unit, abbreviate)] = (
+                    tm_unit,
+                    PedanticTimedelta._pluralize_periodify_inflector(
+                        1, tm_unit, lkup_unit, abbreviate,
+                    ),
+                    PedanticTimedelta._pluralize_periodify_inflector(
+                        2, tm_unit, lkup_unit, abbreviate,
+                    ),
+                )
+        plural_forms = MappingProxyType(plural_forms)
+        PedanticTimedelta._PLURAL_FORMS = (unit_names, plural_forms)
+        return plural_forms
+
+    @staticmethod
+    def _plural_forms(lkup_unit, abbreviate):
+        if PedanticTimedelta.PLURALIZE_WITH_INFLECTOR:
+            tm_unit = PedanticTimedelta.UNIT_NAMES[lkup_unit][abbreviate]
+            return (
+                tm_unit,
+                PedanticTimedelta._pluralize_periodify_inflector(
+                    1, tm_unit, lkup_unit, abbreviate,
+                ),
+                PedanticTimedelta._pluralize_periodify_inflector(
+                    2, tm_unit, lkup_unit, abbreviate,
+                ),
+            )
+        unit_names, plural_forms = PedanticTimedelta._PLURAL_FORMS
+        if unit_names is not PedanticTimedelta.UNIT_NAMES:
+            plural_forms = PedanticTimedelta.refresh_plural_forms()
+        return plural_forms[(lkup_unit, abbreviate)]
+
     def time_format_scaled(self, field_width=0, precision=2, abbreviate=None):
         """Format time duration using appropriate precision and time unit.
 
@@ -371,14 +858,513 @@ class PedanticTimedelta(timedelta):
         >>> PedanticTimedelta(days=0.33).time_format_scaled()
         ('7.92 hours', 3600.0, 'hour')
         """
-        tm_unit, s_scale, lkup_unit, abbreviate = self._units_and_scale(abbreviate)
-        adj_time = self.total_seconds() / s_scale
-        tm_units = self._pluralize_periodify(adj_time, tm_unit, lkup_unit, abbreviate)
+        cache = PedanticTimedelta.FORMAT_CACHE
+        if cache is not None:
+            return cache.format_seconds(self, field_width, precision, abbreviate)
+        lkup_unit, s_scale = self._determine_unit_and_scale()
+        return PedanticTimedelta._format_scaled(
+            self.total_seconds(), lkup_unit, s_scale, field_width, precision, abbreviate,
+        )
+
+    @staticmethod
+    def format_seconds(secs, field_width=0, precision=2, abbreviate=None):
+        """Format a number of seconds using appropriate precision and time unit.
+
+        Fast path equivalent of
+        ``PedanticTimedelta(seconds=secs).time_format_scaled(...)``
+        that formats the float directly, without creating a ``timedelta``
+        object. Like a ``timedelta``, *secs* is first rounded to whole
+        microseconds (half to even).
+
+        :param secs: Time duration in seconds.
+        :type secs: float
+
+        See :py:meth:`time_format_scaled` for the other parameters
+        and the return value.
+
+        >>> PedanticTimedelta.format_seconds(150)
+        ('2.50 mins.', 60.0, 'min')
+        """
+        # (Adding 0.0 makes a -0.0 0.0, which would format as "-0.00 sec.")
+        secs = round(secs, 6) + 0.0
+        ladder = PedanticTimedelta._UNIT_LADDER
+        unit_index = bisect_right(ladder[2], secs)
+        return PedanticTimedelta._format_scaled(
+            secs, ladder[0][unit_index], ladder[1][unit_index],
+            field_width, precision, abbreviate,
+        )
+
+    @staticmethod
+    def _format_scaled(secs, lkup_unit, s_scale, field_width, precision, abbreviate):
+        if PedanticTimedelta.PLURALIZE_WITH_INFLECTOR:
+            abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+            adj_time = secs / s_scale
+            tm_unit = PedanticTimedelta.UNIT_NAMES[lkup_unit][abbreviate]
+            tm_units = PedanticTimedelta._pluralize_periodify_inflector(
+                adj_time, tm_unit, lkup_unit, abbreviate,
+            )
+            time_fmtd = '{:{}.{}f} {}'.format(adj_time, field_width, precision, tm_units)
+            return time_fmtd, s_scale, tm_unit
+        unit_names, plural_forms = PedanticTimedelta._PLURAL_FORMS
+        if unit_names is not PedanticTimedelta.UNIT_NAMES:
+            plural_forms = PedanticTimedelta.refresh_plural_forms()
+        return _format_scaled_core(
+            secs, lkup_unit, s_scale, field_width, precision, abbreviate, plural_forms,
+        )
+
+    def time_format_composite(self, max_units=3, abbreviate=None, separator=' '):
+        """Format the instance's time using multiple units, largest first.
+
+        E.g., "3 days 4 hours 12 mins." See :py:meth:`format_composite`.
+
+        >>> PedanticTimedelta(days=3, hours=4, minutes=12).time_format_composite()
+        '3 days 4 hours 12 mins.'
+        """
+        microseconds = (
+            (self.days * PedanticTimedelta.SECS_IN_DAY + self.seconds) * 1000000
+            + self.microseconds
+        )
+        return PedanticTimedelta.format_composite(
+            microseconds,
+            max_units=max_units,
+            abbreviate=abbreviate,
+            separator=separator,
+        )
+
+    @staticmethod
+    def format_composite(microseconds, max_units=3, abbreviate=None, separator=' '):
+        """Format a number of microseconds using multiple units, largest first.
+
+        The duration is broken down using the units of the unit ladder (see
+        :py:meth:`set_unit_ladder`), e.g., years, months, days, hours, minutes,
+        and seconds, where a year is :py:attr:`SECS_IN_YEAR` seconds long, and
+        a month is :py:attr:`SECS_IN_MONTH`. The math is done using integer
+        microseconds, with one ``divmod`` per unit, so the result is exact.
+
+        Components start at the largest unit of which there is at least 1,
+        and span at most *max_units* consecutive units. Components with a
+        count of 0 are omitted, and any remainder is truncated (not rounded).
+
+        :param microseconds: Time duration in (integer) microseconds.
+        :param max_units: Maximum number of (consecutive) units to use.
+        :param abbreviate: See :py:meth:`time_format_scaled`.
+        :param separator: String used to join the components.
+
+        :type microseconds: int
+        :type max_units: int
+        :type abbreviate: int
+        :type separator: str
+
+        :return: formatted time
+        :rtype: str
+
+        >>> PedanticTimedelta.format_composite(93600000000, abbreviate=5)
+        '1 day 2 hrs.'
+        """
+        if max_units < 1:
+            raise ValueError('pedantic_timedelta: max_units must be 1 or more')
+        abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        plural_forms = PedanticTimedelta._plural_forms
+        remainder = round(microseconds)
+        sign = ''
+        if remainder < 0:
+            sign = '-'
+            remainder = -remainder
+        composite = PedanticTimedelta._UNIT_LADDER.composite
+        parts = []
+        units_left = max_units
+        for lkup_unit, us_per_unit in composite:
+            if not parts and remainder < us_per_unit:
+                # Skip units larger than the duration.
+                continue
+            count, remainder = divmod(remainder, us_per_unit)
+            if count:
+                _tm_unit, singular, plural = plural_forms(lkup_unit, abbreviate)
+                parts.append('{} {}'.format(count, plural if count > 1 else singular))
+            units_left -= 1
+            if not units_left:
+                break
+        if not parts:
+            _tm_unit, singular, _plural = plural_forms(composite[-1][0], abbreviate)
+            return '0 {}'.format(singular)
+        return sign + separator.join(parts)
+
+    # ***
+
+    @staticmethod
+    def format_many(seconds_array, field_width=0, precision=2, abbreviate=None):
+        """Format many time durations at once.
+
+        Vectorized equivalent of calling :py:meth:`time_format_scaled`
+        on a ``PedanticTimedelta(seconds=secs)`` for each value, but
+        without creating a ``timedelta`` object per value.
+
+        If NumPy is installed (``pip install
+        human-friendly_pedantic-timedelta[numpy]``), the units are chosen
+        using ``numpy.searchsorted``, and the strings are built using
+        NumPy's vectorized string operations. Otherwise, the values
+        are formatted one at a time.
+
+        Note that values are not rounded to microseconds first, as they
+        would be by :py:class:`datetime.timedelta`.
+
+        :param seconds_array: A NumPy array, or any buffer-protocol object
+            or sequence, of float seconds.
+        :param field_width: See :py:meth:`time_format_scaled`.
+        :param precision: See :py:meth:`time_format_scaled`.
+        :param abbreviate: See :py:meth:`time_format_scaled`.
+
+        :return: tuple containing (formatted times, seconds in units,
+            time units), as NumPy arrays if NumPy is installed,
+            otherwise as lists.
+        :rtype: tuple(array, array, array)
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            return PedanticTimedelta._format_many_iter(
+                seconds_array, field_width, precision, abbreviate,
+            )
+
+        lkup_units, s_scales, thresholds = PedanticTimedelta._UNIT_LADDER[:3]
+        secs = np.asarray(seconds_array, dtype=np.float64)
+        unit_indices = np.searchsorted(np.array(thresholds), secs, side='right')
+        scales = np.array(s_scales)[unit_indices]
+        return PedanticTimedelta._format_many_numpy(
+            np, secs / scales, scales, unit_indices, lkup_units,
+            field_width, precision, abbreviate,
+        )
+
+    @staticmethod
+    def format_many_ns(
+        ns_array, field_width=0, precision=2, abbreviate=None, ns_per_value=1,
+    ):
+        """Format many time durations, given in integer nanoseconds.
+
+        The integer equivalent of :py:meth:`format_many`, e.g., for the
+        ``int64`` data of a NumPy ``timedelta64[ns]`` array: the units are
+        chosen by comparing integers (see :py:meth:`format_nanoseconds`).
+
+        For coarser integers, e.g., the data of a ``timedelta64[s]`` array,
+        pass the nanoseconds in each integer as ``ns_per_value``, rather than
+        scaling the integers up to nanoseconds, which could overflow ``int64``:
+        the unit thresholds are scaled down to the integers' unit instead.
+
+        :param ns_array: A NumPy array, or any buffer-protocol object
+            or sequence, of integer nanoseconds.
+        :param field_width: See :py:meth:`time_format_scaled`.
+        :param precision: See :py:meth:`time_format_scaled`.
+        :param abbreviate: See :py:meth:`time_format_scaled`.
+        :param ns_per_value: The nanoseconds in each integer.
+        :type ns_per_value: int
+
+        :return: tuple containing (formatted times, nanoseconds in units,
+            time units), as NumPy arrays if NumPy is installed,
+            otherwise as lists.
+        :rtype: tuple(array, array, array)
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            formatted = [
+                PedanticTimedelta.format_nanoseconds(
+                    int(value) * ns_per_value, field_width, precision, abbreviate,
+                )
+                for value in ns_array
+            ]
+            return tuple(list(column) for column in zip(*formatted)) or ([], [], [])
+
+        ladder = PedanticTimedelta._UNIT_LADDER
+        values = np.asarray(ns_array, dtype=np.int64)
+        # A value meets a threshold if value * ns_per_value >= threshold, i.e.,
+        # if value >= ceil(threshold / ns_per_value). Thresholds beyond the
+        # int64 range (e.g., a millennium, in nanoseconds) are never met.
+        int64_max = np.iinfo(np.int64).max
+        thresholds = np.array(
+            [
+                threshold
+                for threshold in (
+                    -(-ns_threshold // ns_per_value)
+                    for ns_threshold in ladder.ns_thresholds
+                )
+                if threshold <= int64_max
+            ],
+            dtype=np.int64,
+        )
+        unit_indices = np.searchsorted(thresholds, values, side='right')
+        ns_scales = ladder.ns_scales
+        scales = np.array(
+            ns_scales, dtype=np.int64 if ns_scales[-1] <= int64_max else object,
+        )[unit_indices]
+        value_scales = np.array(
+            [ns_scale / ns_per_value for ns_scale in ns_scales], dtype=np.float64,
+        )
+        adj_times = values / value_scales[unit_indices]
+        return PedanticTimedelta._format_many_numpy(
+            np, adj_times, scales, unit_indices, ladder.lkup_units,
+            field_width, precision, abbreviate,
+        )
+
+    @staticmethod
+    def _format_many_numpy(
+        np,
+        adj_times,
+        scales,
+        unit_indices,
+        lkup_units,
+        field_width,
+        precision,
+        abbreviate,
+    ):
+        all_forms = PedanticTimedelta._ladder_plural_forms(lkup_units, abbreviate)
+        tm_units = np.array([forms[0] for forms in all_forms])
+        singulars = np.array([forms[1] for forms in all_forms])
+        plurals = np.array([forms[2] for forms in all_forms])
+        units = np.where(adj_times > 1, plurals[unit_indices], singulars[unit_indices])
+        template = '%{}.{}f'.format(field_width, precision)
+        times_fmtd = np.char.add(
+            np.char.add(np.char.mod(template, adj_times), ' '), units,
+        )
+        return times_fmtd, scales, tm_units[unit_indices]
+
+    @staticmethod
+    def _ladder_plural_forms(lkup_units, abbreviate):
+        abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        return [
+            PedanticTimedelta._plural_forms(lkup_unit, abbreviate)
+            for lkup_unit in lkup_units
+        ]
+
+    @staticmethod
+    def _format_many_iter(seconds_array, field_width, precision, abbreviate):
+        lkup_units, s_scales, thresholds = PedanticTimedelta._UNIT_LADDER[:3]
+        all_forms = PedanticTimedelta._ladder_plural_forms(lkup_units, abbreviate)
+        template = '{{:{}.{}f}} {{}}'.format(field_width, precision)
+        times_fmtd = []
+        scales = []
+        tm_units = []
+        for secs in seconds_array:
+            unit_index = bisect_right(thresholds, secs)
+            s_scale = s_scales[unit_index]
+            tm_unit, singular, plural = all_forms[unit_index]
+            adj_time = secs / s_scale
+            times_fmtd.append(
+                template.format(adj_time, plural if adj_time > 1 else singular)
+            )
+            scales.append(s_scale)
+            tm_units.append(tm_unit)
+        return times_fmtd, scales, tm_units
+
+    @staticmethod
+    def iter_format(iterable_of_seconds, field_width=0, precision=2, abbreviate=None):
+        """Lazily format time durations, one at a time.
+
+        A generator equivalent of calling :py:meth:`format_seconds` on each
+        value, but the format options are prepared just once, and only the
+        formatted string is generated (not the scale nor the unit).
+        Memory use is constant, regardless of the number of values.
+        (As with :py:meth:`format_many`, values are not rounded to
+        microseconds first.)
+
+        :param iterable_of_seconds: Any iterable of (float) seconds.
+        :param field_width: See :py:meth:`time_format_scaled`.
+        :param precision: See :py:meth:`time_format_scaled`.
+        :param abbreviate: See :py:meth:`time_format_scaled`.
+
+        :return: Generator of formatted times.
+        :rtype: iterator of str
+
+        >>> list(PedanticTimedelta.iter_format([90, 1.5]))
+        ['1.50 mins.', '1.50 secs.']
+        """
+        lkup_units, s_scales, thresholds = PedanticTimedelta._UNIT_LADDER[:3]
+        all_forms = PedanticTimedelta._ladder_plural_forms(lkup_units, abbreviate)
         template = '{{:{}.{}f}} {{}}'.format(field_width, precision)
-        time_fmtd = template.format(adj_time, tm_units)
-        return time_fmtd, s_scale, tm_unit
+        for secs in iterable_of_seconds:
+            unit_index = bisect_right(thresholds, secs)
+            adj_time = secs / s_scales[unit_index]
+            _tm_unit, singular, plural = all_forms[unit_index]
+            yield template.format(adj_time, plural if adj_time > 1 else singular)
+
+    @staticmethod
+    def iter_format_stream(
+        stream,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+        chunk_size=65536,
+    ):
+        """Lazily format the time durations read from a text or binary stream.
+
+        Reads newline-delimited (or any whitespace-delimited) numbers of
+        seconds from *stream*, *chunk_size* characters (or bytes) at a time,
+        and generates their formatted strings (see :py:meth:`iter_format`).
+
+        :param stream: Text or binary file-like object with a ``read`` method.
+        :param chunk_size: Number of characters (or bytes) to read at once.
+
+        See :py:meth:`time_format_scaled` for the other parameters.
+
+        :return: Generator of formatted times.
+        :rtype: iterator of str
+
+        :raises ValueError: If the stream contains something not a number.
+        """
+        return PedanticTimedelta.iter_format(
+            PedanticTimedelta._iter_stream_seconds(stream, chunk_size),
+            field_width=field_width,
+            precision=precision,
+            abbreviate=abbreviate,
+        )
+
+    @staticmethod
+    def _iter_stream_seconds(stream, chunk_size):
+        remainder = None
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            if remainder:
+                tokens = (remainder + chunk).split()
+            else:
+                tokens = chunk.split()
+            # Hold on to the last number until the next chunk, in case
+            # the chunk boundary falls in the middle of the number.
+            if tokens and not chunk[-1:].isspace():
+                remainder = tokens.pop()
+            else:
+                remainder = None
+            # Convert the numbers en bloc (float() parses str and bytes alike).
+            yield from map(float, tokens)
+        if remainder:
+            yield float(remainder)
+
+    # ***
+
+    @staticmethod
+    def pack_many(durations):
+        """Pack time durations into a compact, portable bytes object.
+
+        Each duration takes 12 bytes: its days, as a 32-bit integer, and its
+        remaining microseconds, as a 64-bit integer (little-endian, in two
+        arrays), so every :class:`datetime.timedelta` is packed exactly.
+        Unpack using :py:meth:`unpack_many`. This is several times smaller,
+        and faster to pickle, than a list of durations (e.g., to send
+        results between the processes of a ``multiprocessing.Pool``).
+
+        >>> packed = PedanticTimedelta.pack_many([timedelta(days=-1, seconds=5)])
+        >>> len(packed), PedanticTimedelta.unpack_many(packed)
+        (24, [PedanticTimedelta(days=-1, seconds=5)])
+
+        :param durations: :class:`datetime.timedelta` objects.
+        :type durations: iterable
+
+        :rtype: bytes
+        """
+        if not isinstance(durations, (list, tuple)):
+            durations = list(durations)
+        days = array.array('i', [delta.days for delta in durations])
+        day_microseconds = array.array('q', [
+            delta.seconds * 1000000 + delta.microseconds for delta in durations
+        ])
+        if sys.byteorder != 'little':  # pragma: no cover
+            days.byteswap()
+            day_microseconds.byteswap()
+        return b''.join((
+            _PACK_HEADER.pack(_PACK_MAGIC, len(days)),
+            days.tobytes(),
+            day_microseconds.tobytes(),
+        ))
+
+    @staticmethod
+    def unpack_many(packed):
+        """Unpack the time durations packed by :py:meth:`pack_many`.
+
+        :param packed: Packed durations.
+        :type packed: bytes-like object
+
+        :return: list of durations
+        :rtype: list(PedanticTimedelta)
+
+        :raises ValueError: if *packed* is not durations packed by
+            :py:meth:`pack_many`.
+        """
+        packed = memoryview(packed).cast('B')
+        header_size = _PACK_HEADER.size
+        if len(packed) >= header_size:
+            magic, count = _PACK_HEADER.unpack_from(packed)
+        if (
+            len(packed) < header_size
+            or magic != _PACK_MAGIC
+            or len(packed) != header_size + 12 * count
+        ):
+            raise ValueError('pedantic_timedelta: Not durations from pack_many')
+        days = array.array('i')
+        days.frombytes(packed[header_size:header_size + 4 * count])
+        day_microseconds = array.array('q')
+        day_microseconds.frombytes(packed[header_size + 4 * count:])
+        if sys.byteorder != 'little':  # pragma: no cover
+            days.byteswap()
+            day_microseconds.byteswap()
+        new = timedelta.__new__
+        return [
+            new(PedanticTimedelta, day, 0, microseconds)
+            for day, microseconds in zip(days, day_microseconds)
+        ]
 
     # ***
 
+
+# The header of pack_many's output: magic and version, and duration count.
+_PACK_MAGIC = b'PTD\x01'
+_PACK_HEADER = struct.Struct('<4sQ')
+
+
+# ***
+
+# The formatting and constructor cores, in pure Python. The compiled
+# accelerator, pedantic_timedelta._speedups, implements the same functions,
+# and is used instead, if it was built (and if PEDANTIC_TIMEDELTA_PURE_PYTHON
+# is not set in the environment, e.g., to test these functions).
+
+
+def _format_scaled_py(
+    secs, lkup_unit, s_scale, field_width, precision, abbreviate, plural_forms,
+):
+    abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+    tm_unit, singular, plural = plural_forms[(lkup_unit, abbreviate)]
+    adj_time = secs / s_scale
+    tm_units = plural if adj_time > 1 else singular
+    time_fmtd = '{:{}.{}f} {}'.format(adj_time, field_width, precision, tm_units)
+    return time_fmtd, s_scale, tm_unit
+
+
+def _sum_products_py(factors, counts):
+    total = 0
+    for factor, count in zip(factors, counts):
+        if count:
+            total += factor * count
+    return total
+
+
+# (Do not bind _speedups before importing it, or the import finds the
+# package attribute, and not the submodule.)
+if os.environ.get('PEDANTIC_TIMEDELTA_PURE_PYTHON'):
+    _speedups = None
+else:
+    try:
+        from . import _speedups
+    except ImportError:
+        _speedups = None
+
+if _speedups is not None:
+    _format_scaled_core = _speedups.format_scaled
+    _sum_products = _speedups.sum_products
+else:
+    _format_scaled_core = _format_scaled_py
+    _sum_products = _sum_products_py
+
+PedanticTimedelta.set_unit_ladder()
+
 # ***
 
@@ -0,0 +1,376 @@
+/* This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+ *
+ *   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+ *
+ * Copyright © 2018-2020 Landon Bouma. All rights reserved.
+ *
+ * Permission is hereby granted,  free of charge,  to any person obtaining a
+ * copy of this software and associated documentation files (the "Software"),
+ * to deal in the Software without restriction, including without limitation
+ * the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+ * and/or  sell copies  of the Software,  and to permit persons  to whom the
+ * Software  is  furnished  to do so,  subject  to  the following conditions:
+ *
+ * The  above  copyright  notice  and  this  permission  notice  shall  be
+ * included  in  all  copies  or  substantial  portions  of  the  Software.
+ *
+ * THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+ * EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+ * IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+ * CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+ * TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+ * SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+ */
+
+/*
+ * Compiled accelerator for the formatting and constructor hot paths.
+ *
+ * Each function here is equivalent to the pure-Python function of the same
+ * name (plus a "_py" suffix) in pedantic_timedelta/__init__.py, which is
+ * used instead if this module is not built. Keep the two in sync.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* Mirror PedanticTimedelta's UNIT_NAME_* constants (checked by the tests). */
+#define UNIT_NAME_FULL 0
+#define UNIT_NAME_ABBREV 6
+#define UNIT_NAME_INDEX_0 0
+#define UNIT_NAME_INDEX_N UNIT_NAME_ABBREV
+
+/* Widths and precisions beyond these are formatted the slow way. */
+#define MAX_FAST_WIDTH 1024
+#define MAX_FAST_PRECISION 64
+
+static PyObject *one;
+
+/* Return PedanticTimedelta._validate_abbreviate(abbreviate). */
+static PyObject *
+validate_abbreviate(PyObject *abbreviate)
+{
+    int is_out;
+
+    if (abbreviate == Py_None) {
+        return PyLong_FromLong(UNIT_NAME_ABBREV);
+    }
+    if (PyLong_CheckExact(abbreviate)) {
+        int overflow;
+        long value = PyLong_AsLongAndOverflow(abbreviate, &overflow);
+        if (value == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (overflow || value < UNIT_NAME_INDEX_0 || value > UNIT_NAME_INDEX_N) {
+            return PyLong_FromLong(UNIT_NAME_FULL);
+        }
+        Py_INCREF(abbreviate);
+        return abbreviate;
+    }
+    /* Any other type, compared as Python would. */
+    {
+        PyObject *bound = PyLong_FromLong(UNIT_NAME_INDEX_0);
+        if (bound == NULL) {
+            return NULL;
+        }
+        is_out = PyObject_RichCompareBool(abbreviate, bound, Py_LT);
+        Py_DECREF(bound);
+    }
+    if (is_out == 0) {
+        PyObject *bound = PyLong_FromLong(UNIT_NAME_INDEX_N);
+        if (bound == NULL) {
+            return NULL;
+        }
+        is_out = PyObject_RichCompareBool(abbreviate, bound, Py_GT);
+        Py_DECREF(bound);
+    }
+    if (is_out < 0) {
+        return NULL;
+    }
+    if (is_out) {
+        return PyLong_FromLong(UNIT_NAME_FULL);
+    }
+    Py_INCREF(abbreviate);
+    return abbreviate;
+}
+
+/* Return the value of an int in [0, limit], or -1 if it is anything else. */
+static Py_ssize_t
+small_int_or_minus_one(PyObject *obj, Py_ssize_t limit)
+{
+    Py_ssize_t value;
+
+    if (!PyLong_CheckExact(obj)) {
+        return -1;
+    }
+    value = PyLong_AsSsize_t(obj);
+    if (value == -1 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return -1;
+    }
+    if (value < 0 || value > limit) {
+        return -1;
+    }
+    return value;
+}
+
+/* Return '{:{}.{}f} {}'.format(adj_time, field_width, precision, tm_units),
+ * the fast way, for the usual float, int, int, and str arguments. */
+static PyObject *
+format_fast(double adj_time, Py_ssize_t width, int precision, PyObject *tm_units)
+{
+    char *number;
+    Py_ssize_t number_len, pad, units_len, index;
+    Py_UCS4 maxchar;
+    PyObject *text;
+    int kind;
+    void *data;
+
+    /* The same conversion that float.__format__ uses. */
+    number = PyOS_double_to_string(adj_time, 'f', precision, 0, NULL);
+    if (number == NULL) {
+        return NULL;
+    }
+    number_len = (Py_ssize_t)strlen(number);
+    pad = width > number_len ? width - number_len : 0;
+    units_len = PyUnicode_GET_LENGTH(tm_units);
+    maxchar = PyUnicode_MAX_CHAR_VALUE(tm_units);
+    if (maxchar < 127) {
+        maxchar = 127;
+    }
+    text = PyUnicode_New(pad + number_len + 1 + units_len, maxchar);
+    if (text == NULL) {
+        PyMem_Free(number);
+        return NULL;
+    }
+    kind = PyUnicode_KIND(text);
+    data = PyUnicode_DATA(text);
+    for (index = 0; index < pad; index++) {
+        PyUnicode_WRITE(kind, data, index, ' ');
+    }
+    for (index = 0; index < number_len; index++) {
+        PyUnicode_WRITE(kind, data, pad + index, (Py_UCS4)(unsigned char)number[index]);
+    }
+    PyUnicode_WRITE(kind, data, pad + number_len, ' ');
+    PyMem_Free(number);
+    if (PyUnicode_CopyCharacters(text, pad + number_len + 1, tm_units, 0, units_len) < 0) {
+        Py_DECREF(text);
+        return NULL;
+    }
+    return text;
+}
+
+/* The same, for any other arguments, by way of Python's own formatting. */
+static PyObject *
+format_slow(PyObject *adj_time, PyObject *field_width, PyObject *precision,
+            PyObject *tm_units)
+{
+    PyObject *template, *text;
+
+    template = PyUnicode_FromString("{:{}.{}f} {}");
+    if (template == NULL) {
+        return NULL;
+    }
+    text = PyObject_CallMethod(
+        template, "format", "OOOO", adj_time, field_width, precision, tm_units);
+    Py_DECREF(template);
+    return text;
+}
+
+PyDoc_STRVAR(format_scaled_doc,
+"format_scaled(secs, lkup_unit, s_scale, field_width, precision, abbreviate,\n"
+"              plural_forms)\n"
+"--\n"
+"\n"
+"Format secs in the given unit, as (formatted time, s_scale, time unit).");
+
+static PyObject *
+format_scaled(PyObject *module, PyObject *args)
+{
+    PyObject *secs, *lkup_unit, *s_scale, *field_width, *precision, *abbreviate;
+    PyObject *plural_forms;
+    PyObject *key = NULL, *forms = NULL, *adj_time = NULL, *text = NULL;
+    PyObject *tm_unit, *tm_units, *result = NULL;
+    Py_ssize_t width, digits;
+    int is_plural;
+
+    if (!PyArg_UnpackTuple(
+            args, "format_scaled", 7, 7, &secs, &lkup_unit, &s_scale,
+            &field_width, &precision, &abbreviate, &plural_forms)) {
+        return NULL;
+    }
+
+    abbreviate = validate_abbreviate(abbreviate);
+    if (abbreviate == NULL) {
+        return NULL;
+    }
+    key = PyTuple_Pack(2, lkup_unit, abbreviate);
+    Py_DECREF(abbreviate);
+    if (key == NULL) {
+        return NULL;
+    }
+    forms = PyObject_GetItem(plural_forms, key);
+    if (forms == NULL) {
+        goto done;
+    }
+    if (!PyTuple_CheckExact(forms) || PyTuple_GET_SIZE(forms) != 3) {
+        Py_SETREF(forms, PySequence_Tuple(forms));
+        if (forms == NULL) {
+            goto done;
+        }
+        if (PyTuple_GET_SIZE(forms) != 3) {
+            PyErr_SetString(PyExc_ValueError, "expected 3 plural forms");
+            goto done;
+        }
+    }
+    tm_unit = PyTuple_GET_ITEM(forms, 0);
+
+    adj_time = PyNumber_TrueDivide(secs, s_scale);
+    if (adj_time == NULL) {
+        goto done;
+    }
+    if (PyFloat_CheckExact(adj_time)) {
+        is_plural = PyFloat_AS_DOUBLE(adj_time) > 1.0;
+    }
+    else {
+        is_plural = PyObject_RichCompareBool(adj_time, one, Py_GT);
+        if (is_plural < 0) {
+            goto done;
+        }
+    }
+    tm_units = PyTuple_GET_ITEM(forms, is_plural ? 2 : 1);
+
+    width = small_int_or_minus_one(field_width, MAX_FAST_WIDTH);
+    digits = small_int_or_minus_one(precision, MAX_FAST_PRECISION);
+    if (
+        PyFloat_CheckExact(adj_time)
+        && width >= 0
+        && digits >= 0
+        && PyUnicode_CheckExact(tm_units)
+    ) {
+        text = format_fast(PyFloat_AS_DOUBLE(adj_time), width, (int)digits, tm_units);
+    }
+    else {
+        text = format_slow(adj_time, field_width, precision, tm_units);
+    }
+    if (text == NULL) {
+        goto done;
+    }
+    result = PyTuple_Pack(3, text, s_scale, tm_unit);
+
+done:
+    Py_XDECREF(text);
+    Py_XDECREF(adj_time);
+    Py_XDECREF(forms);
+    Py_DECREF(key);
+    return result;
+}
+
+PyDoc_STRVAR(sum_products_doc,
+"sum_products(factors, counts)\n"
+"--\n"
+"\n"
+"Return the sum of factor * count, for each nonzero count.");
+
+static PyObject *
+sum_products(PyObject *module, PyObject *args)
+{
+    PyObject *factors, *counts, *factors_seq = NULL, *counts_seq = NULL;
+    PyObject *total;
+    Py_ssize_t size, index;
+
+    if (!PyArg_UnpackTuple(args, "sum_products", 2, 2, &factors, &counts)) {
+        return NULL;
+    }
+    total = PyLong_FromLong(0);
+    if (total == NULL) {
+        return NULL;
+    }
+    factors_seq = PySequence_Fast(factors, "factors must be a sequence");
+    if (factors_seq == NULL) {
+        goto error;
+    }
+    counts_seq = PySequence_Fast(counts, "counts must be a sequence");
+    if (counts_seq == NULL) {
+        goto error;
+    }
+    size = PySequence_Fast_GET_SIZE(factors_seq);
+    if (PySequence_Fast_GET_SIZE(counts_seq) < size) {
+        size = PySequence_Fast_GET_SIZE(counts_seq);
+    }
+    for (index = 0; index < size; index++) {
+        PyObject *count = PySequence_Fast_GET_ITEM(counts_seq, index);
+        PyObject *product;
+        int is_nonzero = PyObject_IsTrue(count);
+        if (is_nonzero < 0) {
+            goto error;
+        }
+        if (!is_nonzero) {
+            continue;
+        }
+        product = PyNumber_Multiply(
+            PySequence_Fast_GET_ITEM(factors_seq, index), count);
+        if (product == NULL) {
+            goto error;
+        }
+        Py_SETREF(total, PyNumber_InPlaceAdd(total, product));
+        Py_DECREF(product);
+        if (total == NULL) {
+            goto error;
+        }
+    }
+    Py_DECREF(factors_seq);
+    Py_DECREF(counts_seq);
+    return total;
+
+error:
+    Py_XDECREF(factors_seq);
+    Py_XDECREF(counts_seq);
+    Py_XDECREF(total);
+    return NULL;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"format_scaled", format_scaled, METH_VARARGS, format_scaled_doc},
+    {"sum_products", sum_products, METH_VARARGS, sum_products_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "pedantic_timedelta._speedups",
+    "Compiled accelerator for pedantic_timedelta (see its _*_py functions).",
+    -1,
+    speedups_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *module;
+
+    if (one == NULL) {
+        one = PyLong_FromLong(1);
+        if (one == NULL) {
+            return NULL;
+        }
+    }
+    module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+#ifdef Py_GIL_DISABLED
+    /* The functions keep no state, so need no locks. */
+    PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED);
+#endif
+    if (
+        PyModule_AddIntConstant(module, "UNIT_NAME_FULL", UNIT_NAME_FULL) < 0
+        || PyModule_AddIntConstant(module, "UNIT_NAME_ABBREV", UNIT_NAME_ABBREV) < 0
+        || PyModule_AddIntConstant(module, "UNIT_NAME_INDEX_0", UNIT_NAME_INDEX_0) < 0
+        || PyModule_AddIntConstant(module, "UNIT_NAME_INDEX_N", UNIT_NAME_INDEX_N) < 0
+    ) {
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,429 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Streaming summaries (count, mean, percentiles) of many time durations."""
+
+import array
+import math
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import timedelta
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'DurationAggregator',
+)
+
+
+class DurationAggregator(object):
+    """Summarize time durations, added one at a time or in batches.
+
+    Durations are counted in a fixed set of histogram buckets, so memory
+    use does not grow with the number of durations, and percentiles are
+    estimated from the bucket counts (to within a small relative error),
+    rather than by sorting every duration. The count, sum, minimum, and
+    maximum are exact.
+
+    The bucket edges line up with the unit thresholds of the unit ladder
+    (see :py:meth:`PedanticTimedelta.set_unit_ladder`), and each unit's
+    range (e.g., 1 to 60 seconds, or 1 to 60 minutes) is divided into
+    *buckets_per_unit* geometrically equal buckets, so an estimate never
+    strays into a neighboring unit, and the relative error is about
+    ``(unit_ratio ** (1 / buckets_per_unit) - 1) / 2`` (e.g., about 1.6%
+    for minutes, with the default of 128 buckets per unit). Below the
+    smallest unit, and above the largest, the buckets span decades.
+
+    >>> aggregator = DurationAggregator()
+    >>> aggregator.update([0.5, 2, 3, 90, timedelta(hours=2)])
+    >>> aggregator.format_summary(percentiles=(50,), precision=1)
+    'count: 5, min: 0.5 sec., mean: 24.3 mins., p50: 3.0 secs., max: 2.0 hours'
+
+    Aggregators are not thread-safe, but those with the same options (e.g.,
+    one per worker) can be combined using :py:meth:`merge`.
+
+    :param buckets_per_unit: Number of buckets per unit (and per decade,
+        outside the ladder's units).
+    :param min_seconds: Lower edge of the smallest bucket. Smaller
+        durations (including zero, and negative durations) share a bucket
+        (see :py:meth:`percentile`).
+    :param max_seconds: Upper edge of the largest bucket. Larger durations
+        share a bucket. Defaults to 10000 of the ladder's largest unit.
+
+    :type buckets_per_unit: int
+    :type min_seconds: float
+    :type max_seconds: float
+    """
+
+    DEFAULT_PERCENTILES = (50, 95, 99)
+    """Percentiles reported by :py:meth:`summary`, unless specified."""
+
+    def __init__(self, buckets_per_unit=128, min_seconds=1e-6, max_seconds=None):
+        """Create an empty aggregator, with the bucket edges for the current ladder."""
+        if buckets_per_unit < 1:
+            raise ValueError('pedantic_timedelta: buckets_per_unit must be 1 or more')
+        s_scales = PedanticTimedelta._UNIT_LADDER.s_scales
+        if max_seconds is None:
+            max_seconds = 10000 * s_scales[-1]
+        if not 0 < min_seconds < max_seconds:
+            raise ValueError(
+                'pedantic_timedelta: min_seconds must be positive,'
+                ' and less than max_seconds'
+            )
+        self.buckets_per_unit = buckets_per_unit
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self._ladder = PedanticTimedelta._UNIT_LADDER
+        self._edges = _bucket_edges(s_scales, buckets_per_unit, min_seconds, max_seconds)
+        # One count per bucket, plus one for the durations below the first
+        # edge (index 0), and one for those from the last edge on (index -1).
+        self._counts = array.array('Q', bytes(8 * (len(self._edges) + 1)))
+        # How many of the first bucket's durations are negative, and zero.
+        self._negatives = 0
+        self._zeros = 0
+        self.count = 0
+        self._sum = 0.0
+        # Compensation for the float rounding error of _sum (Neumaier).
+        self._sum_error = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __repr__(self):
+        """Return the constructor call, with the bucket options."""
+        return (
+            '{}(buckets_per_unit={!r}, min_seconds={!r}, max_seconds={!r})'
+        ).format(
+            type(self).__name__,
+            self.buckets_per_unit,
+            self.min_seconds,
+            self.max_seconds,
+        )
+
+    def __len__(self):
+        """Return the number of durations added."""
+        return self.count
+
+    # ***
+
+    def add(self, duration):
+        """Add one time duration. NaN (missing) durations are ignored.
+
+        :param duration: Number of seconds, or a :class:`datetime.timedelta`.
+        :type duration: float or datetime.timedelta
+        """
+        if isinstance(duration, timedelta):
+            secs = duration.total_seconds()
+        else:
+            secs = float(duration)
+            if secs != secs:
+                return
+        self._counts[bisect_right(self._edges, secs)] += 1
+        if secs <= 0:
+            if secs < 0:
+                self._negatives += 1
+            else:
+                self._zeros += 1
+        self.count += 1
+        self._add_to_sum(secs)
+        if secs < self.min:
+            self.min = secs
+        if secs > self.max:
+            self.max = secs
+
+    def update(self, durations):
+        """Add many time durations. NaN (and NaT) durations are ignored.
+
+        If NumPy is installed, and *durations* is a list, a tuple, an
+        :class:`array.array`, or a NumPy array of numbers or of
+        ``timedelta64``, the durations are bucketed all at once.
+
+        :param durations: Numbers of seconds, or :class:`datetime.timedelta`
+            objects.
+        :type durations: iterable
+        """
+        if isinstance(durations, (list, tuple, array.array)) or (
+            hasattr(durations, '__array_interface__')
+        ):
+            try:
+                import numpy as np
+            except ImportError:  # pragma: no cover
+                pass
+            else:
+                if self._update_numpy(np, np.asarray(durations)):
+                    return
+        add = self.add
+        for duration in durations:
+            add(duration)
+
+    def _update_numpy(self, np, durations):
+        kind = durations.dtype.kind
+        if kind == 'm':
+            missing = np.isnat(durations)
+            secs = durations.astype('timedelta64[ns]').astype(np.int64) / 1e9
+            secs = secs[~missing]
+        elif kind in 'biuf':
+            secs = durations.astype(np.float64).ravel()
+            secs = secs[~np.isnan(secs)]
+        else:
+            # E.g., timedelta objects.
+            return False
+        if not secs.size:
+            return True
+        unit_indices = np.searchsorted(np.array(self._edges), secs, side='right')
+        batch_counts = np.bincount(unit_indices, minlength=len(self._counts))
+        counts = np.frombuffer(self._counts, dtype=np.uint64)
+        counts += batch_counts.astype(np.uint64)
+        self._negatives += int(np.count_nonzero(secs < 0))
+        self._zeros += int(np.count_nonzero(secs == 0))
+        self.count += int(secs.size)
+        self._add_to_sum(math.fsum(secs.tolist()))
+        self.min = min(self.min, float(secs.min()))
+        self.max = max(self.max, float(secs.max()))
+        return True
+
+    def _add_to_sum(self, secs):
+        total = self._sum + secs
+        if abs(self._sum) >= abs(secs):
+            self._sum_error += (self._sum - total) + secs
+        else:
+            self._sum_error += (secs - total) + self._sum
+        self._sum = total
+
+    def merge(self, other):
+        """Add the durations counted by another aggregator to this one.
+
+        :param other: An aggregator made with the same options (and the
+            same unit ladder).
+        :type other: DurationAggregator
+
+        :raises ValueError: if the aggregators' buckets differ.
+        """
+        if other._edges != self._edges:
+            raise ValueError(
+                'pedantic_timedelta: Cannot merge aggregators with different buckets'
+            )
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        self._negatives += other._negatives
+        self._zeros += other._zeros
+        self.count += other.count
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._sum_error)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    # ***
+
+    @property
+    def sum(self):
+        """Sum of the durations, in seconds."""
+        return self._sum + self._sum_error
+
+    def mean(self):
+        """Return the mean of the durations, in seconds.
+
+        :raises ValueError: if no durations were added.
+        """
+        self._check_not_empty()
+        return self.sum / self.count
+
+    def percentile(self, percent):
+        """Estimate the given percentile of the durations, in seconds.
+
+        The estimate is of the nearest-rank percentile, i.e., the smallest
+        duration that is greater than or equal to *percent* percent of the
+        durations, interpolated within its bucket. A percentile that falls
+        on the first or the last duration (e.g., the 0th or the 100th) is
+        the (exact) minimum or maximum.
+
+        Durations less than *min_seconds* share a bucket, but its negative
+        and zero durations are counted apart: a percentile that falls on a
+        zero duration is exactly zero, and one that falls on a negative
+        duration is interpolated between the minimum and zero.
+
+        :param percent: Percentile, from 0 to 100.
+        :type percent: float
+
+        :raises ValueError: if no durations were added, or if *percent*
+            is out of range.
+        """
+        self._check_not_empty()
+        if not 0 <= percent <= 100:
+            raise ValueError('pedantic_timedelta: percent must be from 0 to 100')
+        rank = max(1, math.ceil(percent * self.count / 100))
+        if rank == 1:
+            return self.min
+        if rank == self.count:
+            return self.max
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if seen + count >= rank:
+                break
+            seen += count
+        edges = self._edges
+        lower = edges[index - 1] if index else self.min
+        upper = edges[index] if index < len(edges) else self.max
+        if not index:
+            # The first bucket's negative and zero durations are counted apart.
+            negatives = self._negatives
+            zeros = self._zeros
+            if rank <= negatives:
+                upper = 0.0
+                count = negatives
+            elif rank <= negatives + zeros:
+                return 0.0
+            else:
+                lower = max(lower, 0.0)
+                seen += negatives + zeros
+                count -= negatives + zeros
+        # Place the rank within the bucket, as though the bucket's durations
+        # were spread out evenly (on a log scale, but for the first bucket,
+        # whose durations might not be positive).
+        fraction = (rank - seen - 0.5) / count
+        if index and lower > 0:
+            estimate = lower * (upper / lower) ** fraction
+        else:
+            estimate = lower + (upper - lower) * fraction
+        return min(max(estimate, self.min), self.max)
+
+    def unit_counts(self, abbreviate=None):
+        """Return the number of durations of each unit of the unit ladder.
+
+        A duration is counted under the unit with which it would be
+        formatted (see :py:meth:`PedanticTimedelta.time_format_scaled`).
+
+        :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+        :return: list of (time unit, count), smallest unit first
+        :rtype: list(tuple(str, int))
+        """
+        lkup_units, _s_scales, thresholds = self._ladder[:3]
+        unit_counts = [0] * len(lkup_units)
+        lower_edges = (-math.inf, ) + self._edges
+        for lower, count in zip(lower_edges, self._counts):
+            if count:
+                unit_counts[bisect_right(thresholds, lower)] += count
+        abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        unit_names = PedanticTimedelta.UNIT_NAMES
+        return [
+            (unit_names[lkup_unit][abbreviate], count)
+            for lkup_unit, count in zip(lkup_units, unit_counts)
+        ]
+
+    def summary(
+        self,
+        percentiles=None,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+        na_rep=None,
+    ):
+        """Return the count, and formatted min, mean, percentiles, and max.
+
+        :param percentiles: Percentiles to include, e.g., ``(50, 99.9)``.
+            Defaults to :py:attr:`DEFAULT_PERCENTILES`.
+        :param field_width: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param precision: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param na_rep: Value used for the statistics (all but count) when
+            no durations were added.
+
+        :type percentiles: sequence(float)
+        :type field_width: int
+        :type precision: int
+        :type abbreviate: int
+
+        :return: mapping of label (e.g., ``'count'``, ``'min'``, ``'p50'``)
+            to the formatted statistic
+        :rtype: collections.OrderedDict
+        """
+        if percentiles is None:
+            percentiles = self.DEFAULT_PERCENTILES
+        summary = OrderedDict()
+        summary['count'] = str(self.count)
+        labels = ['min', 'mean'] + ['p{:g}'.format(percent) for percent in percentiles]
+        labels.append('max')
+        if not self.count:
+            for label in labels:
+                summary[label] = na_rep
+            return summary
+        values = [self.min, self.mean()]
+        values.extend(self.percentile(percent) for percent in percentiles)
+        values.append(self.max)
+        format_seconds = PedanticTimedelta.format_seconds
+        for label, secs in zip(labels, values):
+            summary[label] = format_seconds(secs, field_width, precision, abbreviate)[0]
+        return summary
+
+    def format_summary(self, separator=', ', **kwargs):
+        """Return :py:meth:`summary` as a single string.
+
+        E.g., ``'count: 3, min: 1.00 sec., mean: ...'``.
+
+        :param separator: String used to join the statistics.
+        :type separator: str
+
+        See :py:meth:`summary` for the other parameters.
+
+        :rtype: str
+        """
+        kwargs.setdefault('na_rep', '-')
+        return separator.join(
+            '{}: {}'.format(label, value)
+            for label, value in self.summary(**kwargs).items()
+        )
+
+    def _check_not_empty(self):
+        if not self.count:
+            raise ValueError('pedantic_timedelta: No durations were added')
+
+
+def _bucket_edges(s_scales, buckets_per_unit, min_seconds, max_seconds):
+    # Each unit's scale is an edge, as are the decades below the smallest
+    # unit and above the largest, and each span between edges is divided
+    # geometrically into buckets_per_unit buckets.
+    # (Each decade is scaled from the unit, so float error does not build up.)
+    smallest, largest = s_scales[0], s_scales[-1]
+    decades_below = 0
+    while smallest / 10 ** decades_below > min_seconds:
+        decades_below += 1
+    decades_above = 0
+    while largest * 10 ** decades_above < max_seconds:
+        decades_above += 1
+    boundaries = [smallest / 10 ** power for power in range(decades_below, 0, -1)]
+    boundaries.extend(s_scales)
+    boundaries.extend(largest * 10 ** power for power in range(1, decades_above + 1))
+    edges = []
+    for lower, upper in zip(boundaries, boundaries[1:]):
+        ratio = upper / lower
+        edges.append(lower)
+        edges.extend(
+            lower * ratio ** (step / buckets_per_unit)
+            for step in range(1, buckets_per_unit)
+        )
+    edges.append(boundaries[-1])
+    return tuple(edges)
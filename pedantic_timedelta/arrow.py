@@ -0,0 +1,155 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Format Apache Arrow ``duration`` arrays.
+
+Requires PyArrow and NumPy, e.g.,
+``pip install human-friendly_pedantic-timedelta[arrow]``.
+"""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'FUNCTION_NAME',
+    'format_durations',
+    'register_compute_function',
+)
+
+FUNCTION_NAME = 'pedantic_format'
+"""The default name used by :py:func:`register_compute_function`."""
+
+# Nanoseconds in each Arrow duration unit.
+_NS_PER_UNIT = {
+    's': 1000000000,
+    'ms': 1000000,
+    'us': 1000,
+    'ns': 1,
+}
+
+
+def format_durations(durations, field_width=0, precision=2, abbreviate=None):
+    """Format an Arrow ``duration`` array, like :py:meth:`PedanticTimedelta.format_many`.
+
+    The durations are read straight from the array's ``int64`` data buffer
+    (without a copy, or a :class:`datetime.timedelta` per value), and the
+    units are chosen by :py:meth:`PedanticTimedelta.format_many_ns`.
+    Null durations are formatted as null.
+
+    >>> format_durations(pa.array([90, None], pa.duration('s'))).to_pylist()
+    ['1.50 mins.', None]
+
+    :param durations: The durations to format.
+    :type durations: pyarrow.Array or pyarrow.ChunkedArray
+
+    See :py:meth:`PedanticTimedelta.time_format_scaled` for the other
+    parameters.
+
+    :return: The formatted times.
+    :rtype: pyarrow.StringArray or pyarrow.ChunkedArray
+    """
+    if isinstance(durations, pa.ChunkedArray):
+        return pa.chunked_array(
+            [
+                format_durations(chunk, field_width, precision, abbreviate)
+                for chunk in durations.chunks
+            ],
+            type=pa.string(),
+        )
+    if not pa.types.is_duration(durations.type):
+        raise TypeError(
+            'pedantic_timedelta: Expected a duration array, not {}'.format(
+                durations.type,
+            )
+        )
+    if not len(durations):
+        return pa.array([], type=pa.string())
+    values = np.frombuffer(
+        durations.buffers()[1],
+        dtype=np.int64,
+        count=len(durations),
+        offset=durations.offset * 8,
+    )
+    mask = None
+    if durations.null_count:
+        mask = durations.is_null().to_numpy(zero_copy_only=False)
+        values = np.where(mask, 0, values)
+    # Pass the unit along, rather than scaling the values up to nanoseconds,
+    # which overflows int64 for coarser units (e.g., 300 years in seconds).
+    times_fmtd, _scales, _tm_units = PedanticTimedelta.format_many_ns(
+        values,
+        field_width,
+        precision,
+        abbreviate,
+        ns_per_value=_NS_PER_UNIT[durations.type.unit],
+    )
+    return pa.array(times_fmtd, type=pa.string(), mask=mask)
+
+
+def register_compute_function(
+    name=FUNCTION_NAME,
+    field_width=0,
+    precision=2,
+    abbreviate=None,
+    unit='ns',
+):
+    """Register :py:func:`format_durations` as an Arrow compute function.
+
+    Arrow compute functions take no options, so the formatting options
+    are fixed when the function is registered (register more than one
+    name for more than one set of options). The function accepts one
+    ``duration`` unit: cast other units first, e.g.,
+    ``pc.cast(durations, pa.duration('ns'))``.
+
+    >>> register_compute_function('pedantic_format_doctest', unit='s')
+    >>> durations = pa.array([36 * 3600], pa.duration('s'))
+    >>> pc.call_function('pedantic_format_doctest', [durations]).to_pylist()
+    ['1.50 days']
+
+    :param name: The compute function name.
+    :param unit: The ``duration`` unit that the function accepts.
+
+    See :py:meth:`PedanticTimedelta.time_format_scaled` for the other
+    parameters.
+    """
+    def pedantic_format(_context, durations):
+        return format_durations(durations, field_width, precision, abbreviate)
+
+    pc.register_scalar_function(
+        pedantic_format,
+        name,
+        {
+            'summary': 'Format durations using the largest sensible time unit.',
+            'description': (
+                'Format durations like PedanticTimedelta.time_format_scaled,'
+                ' e.g., "1.50 mins.".'
+            ),
+        },
+        {'durations': pa.duration(unit)},
+        pa.string(),
+    )
@@ -0,0 +1,412 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Time durations of any size, including eons and gigaannums.
+
+:class:`datetime.timedelta` (and so :class:`PedanticTimedelta`) stores
+days in a C int, which caps durations at 999999999 days (about 2.7
+million years). :class:`BigTimedelta` stores a single Python int of
+microseconds instead, which has no upper bound, and offers the same
+formatting methods as :class:`PedanticTimedelta`.
+
+>>> big = BigTimedelta(gigaannums=1.5)
+>>> big.time_format_scaled()
+('1500000000.00 years', 31556925.1296, 'year')
+>>> (big * 2 - BigTimedelta(eons=1)).time_format_scaled(abbreviate=5)
+('2500000000.00 yrs.', 31556925.1296, 'yr')
+"""
+
+from datetime import timedelta
+from functools import total_ordering
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'BigTimedelta',
+)
+
+_US_IN_DAY = PedanticTimedelta._US_IN_DAY
+
+
+@total_ordering
+class BigTimedelta(object):
+    """An immutable time duration, stored as (unbounded) integer microseconds.
+
+    Arithmetic is plain integer arithmetic, so there are no overflow
+    checks, and no precision is lost, no matter how large the duration.
+    (The extended units, such as years, are not whole numbers of
+    microseconds, so converting from those involves float math, as it
+    does for :class:`PedanticTimedelta`, and then rounds to the nearest
+    microsecond.)
+
+    Instances can be added to, subtracted from, and compared with other
+    instances and with :class:`datetime.timedelta` objects; multiplied and
+    divided by numbers; and divided by other durations.
+    """
+
+    __slots__ = ('_microseconds',)
+
+    def __new__(
+        cls,
+        days=0,
+        seconds=0,
+        microseconds=0,
+        milliseconds=0,
+        minutes=0,
+        hours=0,
+        weeks=0,
+        fortnights=0,
+        months=0,
+        seasons=0,
+        years=0,
+        bienniums=0,
+        decades=0,
+        jubilees=0,
+        centuries=0,
+        millenniums=0,
+        ages=0,
+        megaannums=0,
+        epochs=0,
+        eras=0,
+        eons=0,
+        gigaannums=0,
+    ):
+        """Create new BigTimedelta instance.
+
+        Accepts the same arguments as :py:meth:`PedanticTimedelta.__new__`,
+        but without the 999999999 days limit. Arguments may be integers,
+        floats, :class:`fractions.Fraction`, or :class:`decimal.Decimal`.
+        Honors :py:attr:`PedanticTimedelta.EXACT_UNIT_CONVERSION`.
+
+        :raises OverflowError: if an argument is infinite.
+        :raises ValueError: if an argument is not a number (NaN).
+        """
+        if PedanticTimedelta.EXACT_UNIT_CONVERSION:
+            return cls._from_microseconds(PedanticTimedelta._exact_microseconds((
+                days, seconds, microseconds, milliseconds, minutes, hours,
+                weeks, fortnights, months, seasons, years, bienniums,
+                decades, jubilees, centuries, millenniums, ages,
+                megaannums, epochs, eras, eons, gigaannums,
+            )))
+        total = (
+            microseconds
+            + milliseconds * 1000
+            + seconds * 1000000
+            + minutes * 60000000
+            + hours * 3600000000
+            + days * _US_IN_DAY
+            + weeks * (7 * _US_IN_DAY)
+        )
+        if (
+            fortnights or months or seasons or years or bienniums or decades
+            or jubilees or centuries or millenniums or ages or megaannums
+            or epochs or eras or eons or gigaannums
+        ):
+            total += _US_IN_DAY * PedanticTimedelta._extended_as_days(
+                fortnights, months, seasons, years, bienniums, decades,
+                jubilees, centuries, millenniums, ages, megaannums,
+                epochs, eras, eons, gigaannums,
+            )
+        return cls._from_microseconds(total if type(total) is int else round(total))
+
+    @classmethod
+    def _from_microseconds(cls, microseconds):
+        self = object.__new__(cls)
+        object.__setattr__(self, '_microseconds', microseconds)
+        return self
+
+    @classmethod
+    def from_microseconds(cls, microseconds):
+        """Create a new instance from an integer number of microseconds.
+
+        :param microseconds: Time duration in microseconds.
+        :type microseconds: int
+
+        :rtype: BigTimedelta
+        """
+        return cls._from_microseconds(int(microseconds))
+
+    @classmethod
+    def from_timedelta(cls, delta):
+        """Create a new instance from a :class:`datetime.timedelta`.
+
+        :type delta: datetime.timedelta
+
+        :rtype: BigTimedelta
+        """
+        return cls._from_microseconds(_timedelta_microseconds(delta))
+
+    def to_timedelta(self):
+        """Convert to a :class:`PedanticTimedelta`.
+
+        :raises ValueError: if the duration exceeds what
+            :class:`datetime.timedelta` can represent.
+
+        :rtype: PedanticTimedelta
+        """
+        try:
+            return timedelta.__new__(PedanticTimedelta, 0, 0, self._microseconds)
+        except OverflowError:
+            raise ValueError(
+                'pedantic_timedelta:'
+                ' That many days is not supported by timedelta.'
+                ' Try <= 999999999'
+            )
+
+    # ***
+
+    @property
+    def days(self):
+        """Return the whole days, as for timedelta: possibly negative."""
+        return self._microseconds // _US_IN_DAY
+
+    @property
+    def seconds(self):
+        """Return the seconds after :py:attr:`days`, from 0 to 86399."""
+        return self._microseconds % _US_IN_DAY // 1000000
+
+    @property
+    def microseconds(self):
+        """Return the microseconds after :py:attr:`seconds`, from 0 to 999999."""
+        return self._microseconds % 1000000
+
+    def total_microseconds(self):
+        """Return the total number of microseconds in the duration (an int)."""
+        return self._microseconds
+
+    def total_seconds(self):
+        """Return the total number of seconds in the duration (a float)."""
+        # Int true division is correctly rounded, even for huge values.
+        return self._microseconds / 1000000
+
+    # ***
+
+    def time_format_scaled(self, field_width=0, precision=2, abbreviate=None):
+        """Format time duration using appropriate precision and time unit.
+
+        See :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+        >>> BigTimedelta(eons=2).time_format_scaled(precision=0)
+        ('1000000000 years', 31556925.1296, 'year')
+        """
+        cache = PedanticTimedelta.FORMAT_CACHE
+        if cache is not None:
+            return cache.format_seconds(
+                self.total_seconds(), field_width, precision, abbreviate,
+            )
+        return PedanticTimedelta.format_seconds(
+            self.total_seconds(), field_width, precision, abbreviate,
+        )
+
+    def time_format_composite(self, max_units=3, abbreviate=None, separator=' '):
+        """Format the duration using multiple units, largest first.
+
+        See :py:meth:`PedanticTimedelta.format_composite`.
+        """
+        return PedanticTimedelta.format_composite(
+            self._microseconds,
+            max_units=max_units,
+            abbreviate=abbreviate,
+            separator=separator,
+        )
+
+    # ***
+
+    def __setattr__(self, name, value):
+        """Raise AttributeError: instances are immutable."""
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        """Raise AttributeError: instances are immutable."""
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__name__)
+        )
+
+    def __reduce__(self):
+        """Pickle as the total microseconds."""
+        return (type(self).from_microseconds, (self._microseconds, ))
+
+    def __copy__(self):
+        """Return self: instances are immutable."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return self: instances are immutable."""
+        return self
+
+    def __repr__(self):
+        """Return the constructor call that recreates the duration."""
+        return '{}(microseconds={!r})'.format(type(self).__name__, self._microseconds)
+
+    def __str__(self):
+        """Format like timedelta, e.g., "-1 day, 23:59:59.500000"."""
+        days, remainder = divmod(self._microseconds, _US_IN_DAY)
+        seconds, microseconds = divmod(remainder, 1000000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        text = '{}:{:02}:{:02}'.format(hours, minutes, seconds)
+        if microseconds:
+            text += '.{:06}'.format(microseconds)
+        if days:
+            text = '{} day{}, {}'.format(days, '' if abs(days) == 1 else 's', text)
+        return text
+
+    def __hash__(self):
+        """Hash the same as an equal timedelta."""
+        # Equal timedeltas must hash equal, and timedelta hashes its
+        # normalized (days, seconds, microseconds).
+        return hash((self.days, self.seconds, self.microseconds))
+
+    def __bool__(self):
+        """Return whether the duration is nonzero."""
+        return self._microseconds != 0
+
+    def __eq__(self, other):
+        """Compare with another BigTimedelta or a timedelta."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._microseconds == other_us
+
+    def __lt__(self, other):
+        """Compare with another BigTimedelta or a timedelta."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._microseconds < other_us
+
+    # ***
+
+    def __neg__(self):
+        """Return the negated duration."""
+        return self._from_microseconds(-self._microseconds)
+
+    def __pos__(self):
+        """Return the duration, unchanged."""
+        return self
+
+    def __abs__(self):
+        """Return the absolute duration."""
+        return self._from_microseconds(abs(self._microseconds))
+
+    def __add__(self, other):
+        """Add a BigTimedelta or a timedelta."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._from_microseconds(self._microseconds + other_us)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract a BigTimedelta or a timedelta."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._from_microseconds(self._microseconds - other_us)
+
+    def __rsub__(self, other):
+        """Subtract from a BigTimedelta or a timedelta."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._from_microseconds(other_us - self._microseconds)
+
+    def __mul__(self, other):
+        """Multiply by an int or float, rounding half to even, like timedelta."""
+        if isinstance(other, int):
+            return self._from_microseconds(self._microseconds * other)
+        if isinstance(other, float):
+            numerator, denominator = other.as_integer_ratio()
+            return self._from_microseconds(
+                _divide_and_round(self._microseconds * numerator, denominator),
+            )
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """Divide by a number (rounding like timedelta), or by a duration."""
+        if isinstance(other, int):
+            return self._from_microseconds(_divide_and_round(self._microseconds, other))
+        if isinstance(other, float):
+            numerator, denominator = other.as_integer_ratio()
+            return self._from_microseconds(
+                _divide_and_round(self._microseconds * denominator, numerator),
+            )
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._microseconds / other_us
+
+    def __floordiv__(self, other):
+        """Floor-divide by an int, or by a duration."""
+        if isinstance(other, int):
+            return self._from_microseconds(self._microseconds // other)
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._microseconds // other_us
+
+    def __mod__(self, other):
+        """Return the remainder after dividing by a duration."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        return self._from_microseconds(self._microseconds % other_us)
+
+    def __divmod__(self, other):
+        """Return the (quotient, remainder) after dividing by a duration."""
+        other_us = _microseconds_of(other)
+        if other_us is None:
+            return NotImplemented
+        quotient, remainder = divmod(self._microseconds, other_us)
+        return quotient, self._from_microseconds(remainder)
+
+
+def _timedelta_microseconds(delta):
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _microseconds_of(other):
+    if isinstance(other, BigTimedelta):
+        return other._microseconds
+    if isinstance(other, timedelta):
+        return _timedelta_microseconds(other)
+    return None
+
+
+def _divide_and_round(numerator, denominator):
+    # Round half to even, as timedelta does (see datetime._divide_and_round).
+    quotient, remainder = divmod(numerator, denominator)
+    remainder *= 2
+    greater_than_half = (
+        remainder > denominator if denominator > 0 else remainder < denominator
+    )
+    if greater_than_half or (remainder == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
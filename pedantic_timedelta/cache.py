@@ -0,0 +1,206 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Memoize formatted time durations, for workloads that repeat themselves."""
+
+import threading
+from collections import namedtuple
+from datetime import timedelta
+from functools import lru_cache
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'CacheInfo',
+    'FormatCache',
+    'disable_format_cache',
+    'enable_format_cache',
+)
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+"""Cache statistics, as returned by :py:meth:`FormatCache.cache_info`."""
+
+
+class FormatCache(object):
+    """A bounded, thread-safe, least recently used cache of formatted durations.
+
+    Results are keyed on the duration, in (integer) microseconds, and the
+    formatting options: *field_width*, *precision*, *abbreviate*, and
+    *locale*. Once *maxsize* results are cached, the least recently used
+    one is discarded to make room for another.
+
+    The cache is a :py:func:`functools.lru_cache`, whose (C) implementation
+    is thread-safe, with or without the GIL. (On a free-threaded build, it
+    takes a brief internal lock on every lookup, hit or miss. Two threads
+    that miss the same new duration at once might both format it, but they
+    store the same result.)
+
+    The cache empties itself, and resets its statistics, if the unit
+    ladder or :py:attr:`PedanticTimedelta.UNIT_NAMES` is replaced (or the
+    plural forms are refreshed).
+
+    The cache is opt-in: pass one to
+    :py:class:`pedantic_timedelta.formatter.DurationFormatter`, call
+    :py:meth:`format_seconds` directly, or use :py:func:`enable_format_cache`
+    to cache :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+    >>> cache = FormatCache(maxsize=2)
+    >>> cache.format_seconds(30)
+    ('30.00 secs.', 1.0, 'sec')
+    >>> cache.format_seconds(timedelta(seconds=30))
+    ('30.00 secs.', 1.0, 'sec')
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    :param maxsize: Maximum number of results to keep.
+    :type maxsize: int
+    """
+
+    __slots__ = (
+        'maxsize',
+        '_format',
+        '_lock',
+        '_generation',
+    )
+
+    def __init__(self, maxsize=1024):
+        """Create an empty cache; raise ValueError if *maxsize* is less than 1."""
+        if maxsize < 1:
+            raise ValueError('pedantic_timedelta: maxsize must be 1 or more')
+        self.maxsize = maxsize
+        self._format = lru_cache(maxsize=maxsize)(_format_microseconds)
+        self._lock = threading.Lock()
+        self._generation = (None, None, None)
+
+    def __len__(self):
+        """Return the number of cached results."""
+        return self._format.cache_info().currsize
+
+    def __repr__(self):
+        """Return the constructor call, with the maxsize."""
+        return '{}(maxsize={!r})'.format(type(self).__name__, self.maxsize)
+
+    def format_seconds(
+        self,
+        duration,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+        locale=None,
+        localedir=None,
+    ):
+        """Format a duration, like :py:meth:`PedanticTimedelta.format_seconds`.
+
+        Note that a number of seconds is rounded to microseconds first,
+        as it would be by :class:`datetime.timedelta`.
+
+        :param duration: Number of seconds, or a :class:`datetime.timedelta`.
+        :param locale: Language code, or None for English. See
+            :py:mod:`pedantic_timedelta.locales`.
+        :param localedir: See :py:class:`pedantic_timedelta.locales.LocaleFormat`.
+
+        See :py:meth:`PedanticTimedelta.time_format_scaled` for the other
+        parameters and the return value.
+        """
+        if isinstance(duration, timedelta):
+            microseconds = (
+                (duration.days * 86400 + duration.seconds) * 1000000
+                + duration.microseconds
+            )
+        else:
+            microseconds = round(duration * 1000000)
+        # Normalized, so that equivalent values share cache entries.
+        abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        generation = self._generation
+        if (
+            generation[0] is not PedanticTimedelta._UNIT_LADDER
+            or generation[1] is not PedanticTimedelta.UNIT_NAMES
+            or generation[2] is not PedanticTimedelta._PLURAL_FORMS
+        ):
+            self._check_generation()
+        return self._format(
+            microseconds, field_width, precision, abbreviate, locale, localedir,
+        )
+
+    def _check_generation(self):
+        # Empty the cache if the unit names or ladder were replaced.
+        # The plural forms table is built first, as formatting would.
+        PedanticTimedelta._plural_forms('second', PedanticTimedelta.UNIT_NAME_FULL)
+        with self._lock:
+            generation = (
+                PedanticTimedelta._UNIT_LADDER,
+                PedanticTimedelta.UNIT_NAMES,
+                PedanticTimedelta._PLURAL_FORMS,
+            )
+            if any(was is not now for was, now in zip(self._generation, generation)):
+                self._format.cache_clear()
+                self._generation = generation
+
+    def cache_info(self):
+        """Return the cache's hit and miss statistics.
+
+        :rtype: CacheInfo
+        """
+        return CacheInfo(*self._format.cache_info())
+
+    def cache_clear(self):
+        """Discard all cached results, and reset the statistics."""
+        self._format.cache_clear()
+
+
+def _format_microseconds(
+    microseconds,
+    field_width,
+    precision,
+    abbreviate,
+    locale,
+    localedir,
+):
+    secs = microseconds / 1000000
+    if locale is None:
+        return PedanticTimedelta.format_seconds(secs, field_width, precision, abbreviate)
+    from .locales import get_locale_format
+    return get_locale_format(locale, localedir).format_seconds(
+        secs, field_width, precision, abbreviate,
+    )
+
+
+def enable_format_cache(maxsize=1024):
+    """Cache the results of :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+    :param maxsize: Maximum number of results to keep.
+    :type maxsize: int
+
+    :return: The new cache (see :py:attr:`PedanticTimedelta.FORMAT_CACHE`).
+    :rtype: FormatCache
+    """
+    cache = FormatCache(maxsize)
+    PedanticTimedelta.FORMAT_CACHE = cache
+    return cache
+
+
+def disable_format_cache():
+    """Stop caching the results of :py:meth:`PedanticTimedelta.time_format_scaled`."""
+    PedanticTimedelta.FORMAT_CACHE = None
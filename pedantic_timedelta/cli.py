@@ -0,0 +1,227 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+"""The ``pedantic-timedelta`` bulk duration formatter command."""
+
+import argparse
+import sys
+import time
+from collections import deque
+from functools import partial
+from itertools import islice
+
+from . import PedanticTimedelta
+
+CHUNK_LINES = 10000
+"""Number of input lines formatted per task when ``--jobs`` is used."""
+
+
+def main(argv=None):
+    """Format the durations read from files (or stdin), one per line.
+
+    Each input line is either a number of seconds, or two numbers,
+    ``secs_then`` and ``secs_now`` (separated by whitespace or a comma),
+    in which case the elapsed time between the two is formatted (as
+    :py:meth:`PedanticTimedelta.time_format_elapsed` would).
+    Blank lines are ignored.
+
+    An unparseable line is reported (with its file name and line number)
+    on stderr, after the lines before it are output, and formatting stops,
+    unless ``--skip-invalid`` is used, in which case the line is reported,
+    and skipped.
+
+    :param argv: Command line arguments (defaults to ``sys.argv[1:]``).
+    :return: Exit status.
+    :rtype: int
+    """
+    args = _parse_args(argv)
+    formatter = partial(
+        _format_lines,
+        field_width=args.field_width,
+        precision=args.precision,
+        abbreviate=args.abbreviate,
+        secs_now=time.time() if args.elapsed else None,
+    )
+    # The (name, first line number, number of lines) of each input file
+    # in each chunk, in chunk order, so that errors can be located.
+    segments = deque()
+    chunks = _iter_chunks(_iter_lines(args.files), CHUNK_LINES, segments)
+    if args.jobs == 1:
+        return _write_chunks(map(formatter, chunks), segments, args.skip_invalid)
+    # Defer the import, as most invocations do not need it.
+    from multiprocessing import Pool
+    with Pool(args.jobs or None) as pool:
+        # Pool.imap yields results in input order.
+        return _write_chunks(
+            pool.imap(formatter, chunks), segments, args.skip_invalid,
+        )
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='pedantic-timedelta',
+        description=(
+            'Format durations (in seconds, one per line) using the'
+            ' largest time unit of which there is at least one.'
+        ),
+    )
+    parser.add_argument(
+        'files', nargs='*', metavar='FILE', default=['-'],
+        help='input file(s) (default: stdin, or "-")',
+    )
+    parser.add_argument(
+        '-w', '--field-width', type=int, default=0,
+        help='total field width, including decimal point (default: 0)',
+    )
+    parser.add_argument(
+        '-p', '--precision', type=int, default=2,
+        help='number of decimal places (default: 2)',
+    )
+    parser.add_argument(
+        '-a', '--abbreviate', type=int, default=None,
+        choices=range(
+            PedanticTimedelta.UNIT_NAME_INDEX_0, PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+        ),
+        help='unit name abbreviation style (see time_format_scaled)',
+    )
+    parser.add_argument(
+        '-e', '--elapsed', action='store_true',
+        help='treat single values as epoch seconds, and format time elapsed since',
+    )
+    parser.add_argument(
+        '-s', '--skip-invalid', action='store_true',
+        help='report and skip unparseable lines, rather than stopping',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of worker processes (0 for one per CPU; default: 1)',
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error('--jobs must not be negative')
+    return args
+
+
+def _iter_lines(files):
+    # Yields (name, line number, line) tuples.
+    for path in files:
+        if path == '-':
+            for line_number, line in enumerate(sys.stdin, 1):
+                yield '<stdin>', line_number, line
+        else:
+            with open(path) as input_file:
+                for line_number, line in enumerate(input_file, 1):
+                    yield path, line_number, line
+
+
+def _iter_chunks(numbered_lines, chunk_lines, segments):
+    while True:
+        chunk = []
+        # [name, first line number, number of lines] per input file.
+        chunk_segments = []
+        for name, line_number, line in islice(numbered_lines, chunk_lines):
+            if line_number == 1 or not chunk_segments:
+                chunk_segments.append([name, line_number, 0])
+            chunk_segments[-1][2] += 1
+            chunk.append(line)
+        if not chunk:
+            return
+        segments.append(chunk_segments)
+        yield chunk
+
+
+def _format_lines(lines, field_width, precision, abbreviate, secs_now):
+    # Returns (formatted times, errors), where each error is a
+    # (line index, number of formatted times before it, message) tuple.
+    seconds = []
+    errors = []
+    for index, line in enumerate(lines):
+        try:
+            secs = _parse_line(line, secs_now)
+        except ValueError as err:
+            errors.append((index, len(seconds), 'Not a duration: {!r} ({})'.format(
+                line.strip(), err,
+            )))
+        else:
+            if secs is not None:
+                seconds.append(secs)
+    formatted = list(PedanticTimedelta.iter_format(
+        seconds,
+        field_width=field_width,
+        precision=precision,
+        abbreviate=abbreviate,
+    ))
+    return formatted, errors
+
+
+def _parse_line(line, secs_now):
+    values = line.replace(',', ' ').split()
+    if not values:
+        return None
+    if len(values) == 2:
+        secs_then, secs_now = values
+        return _elapsed_seconds(float(secs_then), float(secs_now))
+    if len(values) == 1:
+        if secs_now is not None:
+            return _elapsed_seconds(float(values[0]), secs_now)
+        return float(values[0])
+    raise ValueError('Expected 1 or 2 values per line')
+
+
+def _elapsed_seconds(secs_then, secs_now):
+    # Round to whole microseconds, as time_format_elapsed does.
+    return round(secs_now - secs_then, 6) + 0.0
+
+
+def _write_chunks(results, segments, skip_invalid):
+    write = sys.stdout.write
+    for formatted, errors in results:
+        chunk_segments = segments.popleft()
+        n_written = 0
+        for index, n_formatted, message in errors:
+            # Output the valid lines before the error.
+            _write(write, formatted[n_written:n_formatted])
+            n_written = n_formatted
+            _report_error(chunk_segments, index, message)
+            if not skip_invalid:
+                return 1
+        _write(write, formatted[n_written:])
+    return 0
+
+
+def _write(write, formatted):
+    if formatted:
+        write('\n'.join(formatted))
+        write('\n')
+
+
+def _report_error(chunk_segments, index, message):
+    for name, first_line_number, n_lines in chunk_segments:
+        if index < n_lines:
+            break
+        index -= n_lines
+    sys.stdout.flush()
+    sys.stderr.write('pedantic-timedelta: {}:{}: {}\n'.format(
+        name, first_line_number + index, message,
+    ))
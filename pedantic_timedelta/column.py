@@ -0,0 +1,195 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Compact storage for many time durations."""
+
+from array import array
+from datetime import timedelta
+
+from . import PedanticTimedelta
+
+
+class DurationColumn(object):
+    """A sequence of time durations stored in one contiguous int64 buffer.
+
+    Each duration is stored as a whole number of microseconds (the same
+    resolution as :class:`datetime.timedelta`) in an ``array('q')``, which
+    uses 8 bytes per duration, rather than a :class:`PedanticTimedelta`
+    object per duration.
+
+    Durations may be added as seconds (``int`` or ``float``) or as
+    :class:`datetime.timedelta` objects, and are read back as
+    :class:`PedanticTimedelta` objects (or in bulk, as seconds or
+    formatted strings).
+
+    The underlying buffer is exported without copying via the buffer
+    protocol (e.g., ``memoryview(column)`` on Python 3.12 and later,
+    or :py:meth:`memoryview` on any version), such as for
+    ``numpy.frombuffer(column.memoryview(), dtype='int64')``.
+    Note that the column cannot grow while a view of it exists.
+
+    >>> column = DurationColumn([90, 1.5, timedelta(days=2)])
+    >>> column.max().time_format_scaled()[0]
+    '2.00 days'
+    >>> column.format_scaled(abbreviate=PedanticTimedelta.UNIT_NAME_FOURWIDE)
+    ['1.50 mins', '1.50 secs', '2.00 days']
+    """
+
+    __slots__ = ('_microseconds', )
+
+    TYPECODE = 'q'
+    """Array typecode of the underlying buffer (signed 64-bit integers)."""
+
+    def __init__(self, durations=()):
+        """Create a new column, optionally populated with *durations*.
+
+        :param durations: Iterable of seconds or :class:`datetime.timedelta`.
+        """
+        self._microseconds = array(DurationColumn.TYPECODE)
+        self.extend(durations)
+
+    @classmethod
+    def from_microseconds(cls, microseconds):
+        """Create a new column from int64 microseconds.
+
+        :param microseconds: Iterable of int, or any buffer-protocol object
+            of native int64 values (e.g., from :py:meth:`tobytes`, or
+            :py:meth:`memoryview`, or a NumPy ``int64`` array).
+        """
+        column = cls()
+        try:
+            buffer = memoryview(microseconds)
+        except TypeError:
+            column._microseconds.extend(microseconds)
+        else:
+            column._microseconds.frombytes(buffer.cast('B'))
+        return column
+
+    @staticmethod
+    def _as_microseconds(duration):
+        if isinstance(duration, timedelta):
+            return (
+                (duration.days * 86400 + duration.seconds) * 1000000
+                + duration.microseconds
+            )
+        return round(duration * 1000000)
+
+    # *** Sequence methods.
+
+    def append(self, duration):
+        """Add a duration (seconds or :class:`datetime.timedelta`)."""
+        self._microseconds.append(DurationColumn._as_microseconds(duration))
+
+    def extend(self, durations):
+        """Add many durations (seconds or :class:`datetime.timedelta`)."""
+        self._microseconds.extend(map(DurationColumn._as_microseconds, durations))
+
+    def __len__(self):
+        """Return the number of durations."""
+        return len(self._microseconds)
+
+    def __getitem__(self, index):
+        """Return a duration as a PedanticTimedelta, or a slice as a new column."""
+        if isinstance(index, slice):
+            column = DurationColumn()
+            column._microseconds = self._microseconds[index]
+            return column
+        return PedanticTimedelta(microseconds=self._microseconds[index])
+
+    def __iter__(self):
+        """Generate each duration as a PedanticTimedelta."""
+        for microseconds in self._microseconds:
+            yield PedanticTimedelta(microseconds=microseconds)
+
+    def __eq__(self, other):
+        """Compare the durations with another column."""
+        if not isinstance(other, DurationColumn):
+            return NotImplemented
+        return self._microseconds == other._microseconds
+
+    def __repr__(self):
+        """Return the from_microseconds() call that recreates the column."""
+        return '{}.from_microseconds({!r})'.format(
+            type(self).__name__, self._microseconds.tolist(),
+        )
+
+    # *** Bulk access.
+
+    def iter_seconds(self):
+        """Generate each duration as (float) seconds."""
+        for microseconds in self._microseconds:
+            yield microseconds / 1000000
+
+    def format_scaled(self, field_width=0, precision=2, abbreviate=None):
+        """Format every duration, per :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+        :return: The formatted durations.
+        :rtype: list of str
+        """
+        return list(PedanticTimedelta.iter_format(
+            self.iter_seconds(),
+            field_width=field_width,
+            precision=precision,
+            abbreviate=abbreviate,
+        ))
+
+    def memoryview(self):
+        """Return a zero-copy view of the underlying int64 microseconds."""
+        return memoryview(self._microseconds)
+
+    def __buffer__(self, flags):
+        """Return a view of the int64 microseconds, for PEP 688 (Python 3.12+)."""
+        return memoryview(self._microseconds)
+
+    def tobytes(self):
+        """Return a copy of the underlying int64 microseconds as bytes."""
+        return self._microseconds.tobytes()
+
+    # *** Aggregates.
+
+    def sum(self):
+        """Return the total duration (computed exactly, in microseconds)."""
+        return PedanticTimedelta(microseconds=sum(self._microseconds))
+
+    def mean(self):
+        """Return the mean duration, or ``None`` if the column is empty."""
+        if not self._microseconds:
+            return None
+        return PedanticTimedelta(
+            microseconds=sum(self._microseconds) / len(self._microseconds),
+        )
+
+    def min(self):
+        """Return the shortest duration, or ``None`` if the column is empty."""
+        if not self._microseconds:
+            return None
+        return PedanticTimedelta(microseconds=min(self._microseconds))
+
+    def max(self):
+        """Return the longest duration, or ``None`` if the column is empty."""
+        if not self._microseconds:
+            return None
+        return PedanticTimedelta(microseconds=max(self._microseconds))
+
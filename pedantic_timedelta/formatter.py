@@ -0,0 +1,197 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Reusable time duration formatters, for when the options never change."""
+
+from bisect import bisect_right
+from datetime import timedelta
+
+from . import PedanticTimedelta
+
+
+class DurationFormatter(object):
+    """Format time durations, with the formatting options prepared up front.
+
+    Equivalent to calling :py:meth:`PedanticTimedelta.format_seconds`, but
+    *abbreviate* is validated, the format template is built, and the unit
+    names are looked up just once, when the formatter is created (and again
+    only if the unit ladder or :py:attr:`PedanticTimedelta.UNIT_NAMES` is
+    replaced), rather than on every call.
+
+    >>> format_duration = DurationFormatter(precision=1)
+    >>> format_duration(90)
+    '1.5 mins.'
+    >>> format_duration.map([timedelta(hours=36), 0.25])
+    ['1.5 days', '0.2 sec.']
+
+    :param field_width: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param precision: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param locale: Language code, to format using a translated catalog
+        (see :py:mod:`pedantic_timedelta.locales`), or None for English.
+    :param localedir: See :py:class:`pedantic_timedelta.locales.LocaleFormat`.
+    :param cache: A :py:class:`pedantic_timedelta.cache.FormatCache` in which
+        to memoize results (which may be shared by many formatters), or None.
+
+    :type field_width: int
+    :type precision: int
+    :type abbreviate: int
+    :type locale: str
+    :type localedir: str
+    :type cache: pedantic_timedelta.cache.FormatCache
+    """
+
+    __slots__ = (
+        'field_width',
+        'precision',
+        'abbreviate',
+        'locale',
+        'localedir',
+        'cache',
+        '_template',
+        '_compiled',
+        '_locale_format',
+    )
+
+    def __init__(
+        self,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+        locale=None,
+        localedir=None,
+        cache=None,
+    ):
+        """Validate the options, and prepare the format template."""
+        self.field_width = field_width
+        self.precision = precision
+        self.abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        self.locale = locale
+        self.localedir = localedir
+        self.cache = cache
+        self._template = '{{:{}.{}f}} {{}}'.format(field_width, precision).format
+        # (ladder, unit_names, plural_forms, [(singular, plural), ...]),
+        # with one pair of names per ladder unit.
+        self._compiled = (None, None, None, None)
+        self._locale_format = None
+        if locale is not None:
+            self._get_locale_format()
+
+    def __repr__(self):
+        """Return the constructor call, with the formatting options."""
+        return (
+            '{}(field_width={!r}, precision={!r}, abbreviate={!r}, locale={!r})'
+        ).format(
+            type(self).__name__,
+            self.field_width,
+            self.precision,
+            self.abbreviate,
+            self.locale,
+        )
+
+    def __call__(self, duration):
+        """Format a time duration.
+
+        :param duration: Number of seconds, or a :class:`datetime.timedelta`.
+        :type duration: float or datetime.timedelta
+
+        :return: formatted time
+        :rtype: str
+        """
+        if self.cache is not None:
+            return self.cache.format_seconds(
+                duration,
+                self.field_width,
+                self.precision,
+                self.abbreviate,
+                self.locale,
+                self.localedir,
+            )[0]
+        if isinstance(duration, timedelta):
+            duration = duration.total_seconds()
+        if self.locale is not None:
+            return self._get_locale_format().format_seconds(
+                duration, self.field_width, self.precision, self.abbreviate,
+            )[0]
+        ladder, _unit_names, _plural_forms, all_forms = self._compile()
+        unit_index = bisect_right(ladder.thresholds, duration)
+        adj_time = duration / ladder.s_scales[unit_index]
+        singular, plural = all_forms[unit_index]
+        return self._template(adj_time, plural if adj_time > 1 else singular)
+
+    def map(self, durations):
+        """Format many time durations.
+
+        :param durations: Iterable of seconds and/or
+            :class:`datetime.timedelta` objects.
+
+        :return: The formatted times.
+        :rtype: list of str
+        """
+        if self.locale is not None or self.cache is not None:
+            return [self(duration) for duration in durations]
+        ladder, _unit_names, _plural_forms, all_forms = self._compile()
+        thresholds = ladder.thresholds
+        s_scales = ladder.s_scales
+        template = self._template
+        formatted = []
+        append = formatted.append
+        for duration in durations:
+            if isinstance(duration, timedelta):
+                duration = duration.total_seconds()
+            unit_index = bisect_right(thresholds, duration)
+            adj_time = duration / s_scales[unit_index]
+            singular, plural = all_forms[unit_index]
+            append(template(adj_time, plural if adj_time > 1 else singular))
+        return formatted
+
+    def _compile(self):
+        compiled = self._compiled
+        if (
+            compiled[0] is not PedanticTimedelta._UNIT_LADDER
+            or compiled[1] is not PedanticTimedelta.UNIT_NAMES
+            or compiled[2] is not PedanticTimedelta._PLURAL_FORMS
+        ):
+            ladder = PedanticTimedelta._UNIT_LADDER
+            unit_names = PedanticTimedelta.UNIT_NAMES
+            all_forms = [
+                (singular, plural)
+                for _tm_unit, singular, plural in PedanticTimedelta._ladder_plural_forms(
+                    ladder.lkup_units, self.abbreviate,
+                )
+            ]
+            # Read after _ladder_plural_forms, which may rebuild the table.
+            compiled = (ladder, unit_names, PedanticTimedelta._PLURAL_FORMS, all_forms)
+            self._compiled = compiled
+        return compiled
+
+    def _get_locale_format(self):
+        locale_format = self._locale_format
+        if locale_format is None or locale_format.is_stale():
+            # Deferred, so English-only callers never load gettext.
+            from .locales import get_locale_format
+            locale_format = get_locale_format(self.locale, self.localedir)
+            self._locale_format = locale_format
+        return locale_format
@@ -0,0 +1,256 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Format time durations in any locale, with per-locale compiled tables."""
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'CACHE_SIZE',
+    'DOMAIN',
+    'LocaleFormat',
+    'clear_cache',
+    'format_seconds',
+    'get_locale_format',
+)
+
+DOMAIN = 'pedantic_timedelta'
+"""The gettext domain of the unit name translations."""
+
+CACHE_SIZE = 32
+"""Maximum number of compiled locales kept by :py:func:`get_locale_format`."""
+
+# Compiled LocaleFormat objects, keyed by (locale, localedir, decimal_point),
+# least recently used first.
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+class LocaleFormat(object):
+    """Format time durations using one locale's unit names and plural rules.
+
+    Each unit name is translated (using :py:func:`gettext.translation` for
+    the :py:data:`DOMAIN` domain) once, when the object is created, and the
+    plural forms of each name are translated once per plural category, the
+    first time they are needed, so formatting never consults the catalog
+    again. Use :py:func:`get_locale_format` to share objects between calls.
+
+    The English names in :py:attr:`PedanticTimedelta.UNIT_NAMES`, and the
+    singular and plural forms that :py:meth:`PedanticTimedelta.format_seconds`
+    outputs, are the catalog's msgids (the plural forms via ``ngettext``).
+    Untranslated names are output in English.
+
+    As in English, a value of 1 or less uses the singular form (plural
+    category of 1). A larger value uses the plural category of the value
+    rounded up to a whole number.
+
+    :param locale: Language code(s), e.g., ``'de'`` or ``'pt_BR'``.
+    :param localedir: Directory containing the catalogs, i.e.,
+        ``<localedir>/<locale>/LC_MESSAGES/pedantic_timedelta.mo``.
+        Defaults to the system directory.
+    :param decimal_point: The decimal separator. Defaults to the
+        locale's, if Babel is installed (``pip install
+        human-friendly_pedantic-timedelta[locale]``), otherwise ``'.'``.
+
+    :type locale: str
+    :type localedir: str
+    :type decimal_point: str
+    """
+
+    __slots__ = (
+        'locale',
+        'decimal_point',
+        '_unit_names',
+        '_ladder',
+        '_ngettext',
+        '_plural',
+        '_forms',
+    )
+
+    def __init__(self, locale, localedir=None, decimal_point=None):
+        """Load the catalog for *locale*, and translate every unit name."""
+        import gettext
+
+        self.locale = locale
+        translation = gettext.translation(
+            DOMAIN, localedir=localedir, languages=[locale], fallback=True,
+        )
+        self._ngettext = translation.ngettext
+        # Only a GNUTranslations (i.e., a catalog was found) knows the
+        # language's plural rule; otherwise, fallback to English's.
+        self._plural = getattr(translation, 'plural', _english_plural)
+        if decimal_point is None:
+            decimal_point = _babel_decimal_point(locale)
+        self.decimal_point = decimal_point
+        self._unit_names = PedanticTimedelta.UNIT_NAMES
+        self._ladder = PedanticTimedelta._UNIT_LADDER
+        gettext_ = translation.gettext
+        # Maps (lkup_unit, abbreviate) → [tm_unit, singular msgid, plural msgid,
+        # {plural category: translated form}].
+        forms = {}
+        for lkup_unit in self._unit_names:
+            for abbreviate in range(
+                PedanticTimedelta.UNIT_NAME_INDEX_0,
+                PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+            ):
+                _tm_unit, singular, plural = PedanticTimedelta._plural_forms(
+                    lkup_unit, abbreviate,
+                )
+                untranslated = _untranslated_name(lkup_unit, abbreviate)
+                forms[(lkup_unit, abbreviate)] = (
+                    gettext_(untranslated), singular, plural, {},
+                )
+        self._forms = forms
+
+    def __repr__(self):
+        """Return the constructor call, with just the locale."""
+        return '{}({!r})'.format(type(self).__name__, self.locale)
+
+    def is_stale(self):
+        """Return True if the unit names or ladder changed since compiled.
+
+        :rtype: bool
+        """
+        return (
+            self._unit_names is not PedanticTimedelta.UNIT_NAMES
+            or self._ladder is not PedanticTimedelta._UNIT_LADDER
+        )
+
+    def format_seconds(self, secs, field_width=0, precision=2, abbreviate=None):
+        """Format a number of seconds, like :py:meth:`PedanticTimedelta.format_seconds`.
+
+        :return: tuple containing (formatted time, seconds in unit,
+            translated time unit)
+        :rtype: tuple(string, seconds-per-unit, time-unit)
+        """
+        abbreviate = PedanticTimedelta._validate_abbreviate(abbreviate)
+        ladder = self._ladder
+        unit_index = bisect_right(ladder.thresholds, secs)
+        lkup_unit = ladder.lkup_units[unit_index]
+        s_scale = ladder.s_scales[unit_index]
+        adj_time = secs / s_scale
+        tm_unit, singular, plural, by_category = self._forms[(lkup_unit, abbreviate)]
+        count = -int(-adj_time // 1) if adj_time > 1 else 1
+        category = self._plural(count)
+        tm_units = by_category.get(category)
+        if tm_units is None:
+            tm_units = self._ngettext(singular, plural, count)
+            by_category[category] = tm_units
+        adj_fmtd = '{:{}.{}f}'.format(adj_time, field_width, precision)
+        if self.decimal_point != '.':
+            adj_fmtd = adj_fmtd.replace('.', self.decimal_point)
+        return '{} {}'.format(adj_fmtd, tm_units), s_scale, tm_unit
+
+
+def get_locale_format(locale, localedir=None, decimal_point=None):
+    """Return the (cached) :py:class:`LocaleFormat` for a locale.
+
+    Up to :py:data:`CACHE_SIZE` compiled locales are kept, and the least
+    recently used one is discarded to make room for another. A locale is
+    recompiled if :py:attr:`PedanticTimedelta.UNIT_NAMES` or the unit
+    ladder (see :py:meth:`PedanticTimedelta.set_unit_ladder`) is replaced.
+
+    Safe to call from multiple threads.
+
+    See :py:class:`LocaleFormat` for the parameters.
+
+    :rtype: LocaleFormat
+    """
+    key = (locale.replace('-', '_'), localedir, decimal_point)
+    with _CACHE_LOCK:
+        locale_format = _CACHE.get(key)
+        if locale_format is not None:
+            if not locale_format.is_stale():
+                _CACHE.move_to_end(key)
+                return locale_format
+            del _CACHE[key]
+    # Compile outside the lock, so other locales are not held up. Two
+    # threads might compile the same locale at once, but that is harmless.
+    locale_format = LocaleFormat(key[0], localedir, decimal_point)
+    with _CACHE_LOCK:
+        _CACHE[key] = locale_format
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return locale_format
+
+
+def clear_cache():
+    """Discard all compiled locales, e.g., after updating a catalog."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def format_seconds(
+    secs,
+    locale,
+    field_width=0,
+    precision=2,
+    abbreviate=None,
+    localedir=None,
+):
+    """Format a number of seconds in the specified locale.
+
+    Equivalent to ``get_locale_format(locale, localedir).format_seconds(...)``.
+
+    :param secs: Time duration in seconds.
+    :param locale: Language code, e.g., ``'de'`` or ``'pt_BR'``.
+
+    See :py:meth:`PedanticTimedelta.time_format_scaled` for the other
+    parameters, and :py:class:`LocaleFormat` for *localedir*.
+
+    :return: tuple containing (formatted time, seconds in unit,
+        translated time unit)
+    :rtype: tuple(string, seconds-per-unit, time-unit)
+    """
+    return get_locale_format(locale, localedir).format_seconds(
+        secs, field_width, precision, abbreviate,
+    )
+
+
+def _english_plural(count):
+    return int(count != 1)
+
+
+def _untranslated_name(lkup_unit, abbreviate):
+    # The msgid of a unit name, i.e., before _LazyUnitNames translates it.
+    unit_names = PedanticTimedelta.UNIT_NAMES
+    untranslated = getattr(unit_names, '_untranslated', unit_names)
+    return untranslated[lkup_unit][abbreviate]
+
+
+def _babel_decimal_point(locale):
+    try:
+        from babel.core import UnknownLocaleError
+        from babel.numbers import get_decimal_symbol
+    except ImportError:
+        return '.'
+    try:
+        return get_decimal_symbol(locale)
+    except (UnknownLocaleError, ValueError):
+        return '.'
@@ -0,0 +1,149 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""A ``Series.pedantic`` accessor for pandas timedelta columns.
+
+Importing this module registers the accessor (and requires pandas, e.g.,
+``pip install human-friendly_pedantic-timedelta[pandas]``):
+
+.. code-block:: python
+
+    import pedantic_timedelta.pandas_accessor  # noqa: F401
+
+    df['took'].pedantic.format(precision=1)
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'PedanticAccessor',
+)
+
+# Nanoseconds in each numpy timedelta64 unit that pandas uses.
+_NS_PER_UNIT = {
+    's': 1000000000,
+    'ms': 1000000,
+    'us': 1000,
+    'ns': 1,
+}
+
+
+@pd.api.extensions.register_series_accessor('pedantic')
+class PedanticAccessor(object):
+    """Format a ``timedelta64`` Series, like :py:meth:`PedanticTimedelta.format_many`.
+
+    The durations are formatted straight from the Series' ``int64`` data
+    (see :py:meth:`PedanticTimedelta.format_many_ns`), without creating a
+    :class:`datetime.timedelta` per value.
+
+    >>> durations = pd.Series(pd.to_timedelta(['90s', '36h', None]))
+    >>> durations.pedantic.format().tolist()
+    ['1.50 mins.', '1.50 days', None]
+    """
+
+    def __init__(self, series):
+        """Wrap *series*; raise AttributeError unless it holds timedelta64 values."""
+        if not pd.api.types.is_timedelta64_dtype(series.dtype):
+            raise AttributeError(
+                'pedantic_timedelta: Can only use .pedantic with timedelta64 values'
+            )
+        self._series = series
+
+    def nanoseconds(self):
+        """Return the durations as ``int64`` nanoseconds, and the missing values.
+
+        :raises OverflowError: If a duration is too long for ``int64``
+            nanoseconds (about 292 years), e.g., in a ``timedelta64[s]`` Series.
+
+        :return: tuple containing (nanoseconds, is-missing), as NumPy arrays.
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        values, ns_per_value, missing = self._values()
+        if ns_per_value == 1:
+            return values, missing
+        limit = np.iinfo(np.int64).max // ns_per_value
+        if np.any((np.abs(values) > limit) & ~missing):
+            raise OverflowError(
+                'pedantic_timedelta: Durations too long for int64 nanoseconds'
+            )
+        return values * ns_per_value, missing
+
+    def _values(self):
+        values = self._series.to_numpy()
+        if values.dtype.kind != 'm':
+            # E.g., an Arrow-backed duration column.
+            values = values.astype('timedelta64[ns]')
+        missing = np.isnat(values)
+        unit, _count = np.datetime_data(values.dtype)
+        return values.view(np.int64), _NS_PER_UNIT[unit], missing
+
+    def format(self, field_width=0, precision=2, abbreviate=None, na_rep=None):
+        """Format the durations.
+
+        :param field_width: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param precision: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+        :param na_rep: Value for missing (``NaT``) durations.
+
+        :return: The formatted times, with the same index and name.
+        :rtype: pandas.Series
+        """
+        times_fmtd, _scales, _tm_units, missing = self._format_scaled(
+            field_width, precision, abbreviate,
+        )
+        return self._as_series(times_fmtd, missing, na_rep)
+
+    def unit(self, abbreviate=None):
+        """Return each duration's (singular) unit name.
+
+        :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+
+        :rtype: pandas.Series
+        """
+        _times_fmtd, _scales, tm_units, missing = self._format_scaled(0, 0, abbreviate)
+        return self._as_series(tm_units, missing, None)
+
+    def _format_scaled(self, field_width, precision, abbreviate):
+        # Pass the unit along, rather than scaling up to nanoseconds, which
+        # overflows int64 for coarser units (see nanoseconds()).
+        values, ns_per_value, missing = self._values()
+        times_fmtd, scales, tm_units = PedanticTimedelta.format_many_ns(
+            np.where(missing, 0, values),
+            field_width,
+            precision,
+            abbreviate,
+            ns_per_value=ns_per_value,
+        )
+        return times_fmtd, scales, tm_units, missing
+
+    def _as_series(self, values, missing, na_rep):
+        values = values.astype(object)
+        values[missing] = na_rep
+        return pd.Series(
+            values, dtype=object, index=self._series.index, name=self._series.name,
+        )
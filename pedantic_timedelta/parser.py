@@ -0,0 +1,247 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Parse formatted time durations, e.g., "2.50 mins.", back into objects."""
+
+import math
+import re
+from datetime import timedelta
+
+from . import PedanticTimedelta
+
+__all__ = (
+    'parse',
+    'parse_many',
+    'parse_seconds',
+)
+
+# A number followed by a unit name, e.g., "2.5mins." or ", 3 days". A unit
+# name starts with a letter (which includes 'µ') and runs until the next
+# whitespace, comma, or digit. Only used when a string is not a simple
+# "value unit".
+_VALUE_UNIT_RE = re.compile(
+    r'[\s,]*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*([^\W\d_][^\s\d,]*)'
+)
+
+# Skip PedanticTimedelta.__new__'s extended units handling, which
+# parsed seconds never need.
+_new_timedelta = timedelta.__new__
+
+# Cached (plural_forms, ladder, unit_seconds, folded_seconds), rebuilt by
+# _unit_tokens() when the plural forms table or the unit ladder is replaced.
+_UNIT_TOKENS = (None, None, None, None)
+
+
+def parse(text):
+    """Parse a formatted time duration into a :class:`PedanticTimedelta`.
+
+    Recognizes every name in :py:attr:`PedanticTimedelta.UNIT_NAMES`, for
+    every *abbreviate* index, in singular and plural form, and with or
+    without a trailing period, i.e., anything that
+    :py:meth:`PedanticTimedelta.time_format_scaled` or
+    :py:meth:`PedanticTimedelta.time_format_composite` outputs.
+
+    >>> parse('2.50 mins.').total_seconds()
+    150.0
+    >>> parse('1 day 2 hrs.') == PedanticTimedelta(hours=26)
+    True
+
+    :param text: Formatted time duration.
+    :type text: str
+
+    :return: The time duration (rounded to microseconds).
+    :rtype: PedanticTimedelta
+
+    :raises ValueError: If the text is not a time duration, or if the
+        duration is too long for a :class:`datetime.timedelta`.
+    """
+    return _as_timedelta(parse_seconds(text))
+
+
+def parse_seconds(text):
+    """Parse a formatted time duration into seconds.
+
+    Fast path equivalent of ``parse(text).total_seconds()`` that does not
+    create a ``timedelta`` object (nor round to microseconds).
+
+    :param text: Formatted time duration.
+    :type text: str
+
+    :return: Number of seconds.
+    :rtype: float
+
+    :raises ValueError: If the text is not a time duration, or if the
+        duration is not finite (e.g., ``'1e400 secs.'``).
+    """
+    _plural_forms, _ladder, unit_seconds, folded_seconds = _unit_tokens()
+    return _parse_seconds(text, unit_seconds, folded_seconds)
+
+
+def parse_many(texts, as_seconds=False):
+    """Parse many formatted time durations, collecting errors as it goes.
+
+    The unit names are looked up in the same table as :py:func:`parse`,
+    which is fetched once for the whole batch.
+
+    >>> durations, errors = parse_many(['1.50 hours', 'ago', '2 s.'], as_seconds=True)
+    >>> durations
+    [5400.0, None, 2.0]
+    >>> errors
+    [(1, 'ago', "pedantic_timedelta: Not a time duration: 'ago'")]
+
+    :param texts: Iterable of formatted time durations.
+    :param as_seconds: If True, return the number of seconds as floats,
+        rather than as :class:`PedanticTimedelta` objects.
+
+    :type texts: iterable of str
+    :type as_seconds: bool
+
+    :return: tuple containing (parsed durations, errors), where the
+        durations list has one item per text (None for those that
+        could not be parsed), and errors is a list of (index, text,
+        error message) for each text that could not be parsed.
+    :rtype: tuple(list, list)
+    """
+    _plural_forms, _ladder, unit_seconds, folded_seconds = _unit_tokens()
+    durations = []
+    errors = []
+    append = durations.append
+    for index, text in enumerate(texts):
+        try:
+            secs = _parse_seconds(text, unit_seconds, folded_seconds)
+            append(secs if as_seconds else _as_timedelta(secs))
+        except ValueError as err:
+            append(None)
+            errors.append((index, text, str(err)))
+    return durations, errors
+
+
+def _as_timedelta(secs):
+    try:
+        return _new_timedelta(PedanticTimedelta, 0, secs)
+    except OverflowError:
+        raise ValueError(
+            'pedantic_timedelta:'
+            ' That many days is not supported by timedelta.'
+            ' Try <= 999999999'
+        )
+
+
+def _parse_seconds(text, unit_seconds, folded_seconds):
+    # Fast path: "value unit", as formatted by time_format_scaled.
+    parts = text.split()
+    secs = None
+    if len(parts) == 2:
+        value, unit = parts
+        try:
+            secs = float(value) * unit_seconds[unit]
+        except (KeyError, ValueError):
+            pass
+    if secs is None:
+        secs = _parse_seconds_slow(text, unit_seconds, folded_seconds)
+    # E.g., "nan secs." (which float() parses), or "1e400 secs.".
+    if not math.isfinite(secs):
+        raise ValueError(
+            'pedantic_timedelta: Not a finite time duration: {!r}'.format(text)
+        )
+    return secs
+
+
+def _parse_seconds_slow(text, unit_seconds, folded_seconds):
+    # Slow path: one or more "value unit" pairs, with or without whitespace
+    # between the value and the unit, and with unit names in any case. As
+    # output by format_composite, a leading minus sign negates every pair.
+    secs = 0.0
+    negate = False
+    end = 0
+    for match in _VALUE_UNIT_RE.finditer(text):
+        if match.start() != end:
+            break
+        value, unit = match.groups()
+        s_scale = unit_seconds.get(unit)
+        if s_scale is None:
+            s_scale = folded_seconds.get(unit.lower())
+            if s_scale is None:
+                raise ValueError(
+                    'pedantic_timedelta: Unknown unit: {}'.format(unit)
+                )
+        amount = float(value) * s_scale
+        if not end:
+            negate = value[0] == '-'
+        elif negate and value[0] not in '+-':
+            amount = -amount
+        secs += amount
+        end = match.end()
+    if not end or text[end:].strip():
+        raise ValueError(
+            'pedantic_timedelta: Not a time duration: {!r}'.format(text)
+        )
+    return secs
+
+
+def _unit_tokens():
+    global _UNIT_TOKENS
+    unit_names, plural_forms = PedanticTimedelta._PLURAL_FORMS
+    if unit_names is not PedanticTimedelta.UNIT_NAMES:
+        plural_forms = PedanticTimedelta.refresh_plural_forms()
+    ladder = PedanticTimedelta._UNIT_LADDER
+    unit_tokens = _UNIT_TOKENS
+    if unit_tokens[0] is not plural_forms or unit_tokens[1] is not ladder:
+        unit_tokens = (plural_forms, ladder) + _build_unit_tokens(plural_forms, ladder)
+        _UNIT_TOKENS = unit_tokens
+    return unit_tokens
+
+
+def _build_unit_tokens(plural_forms, ladder):
+    # Map every unit name to the unit's seconds. The names the formatter
+    # outputs are claimed first; then the (+'s', +'.', +'s.') variants
+    # of each name, unless another unit already claimed the same text
+    # (e.g., "m." is the minute, and not a month, "m", with a period).
+    s_scales = dict(PedanticTimedelta.UNIT_SECONDS)
+    s_scales.update(zip(ladder.lkup_units, ladder.s_scales))
+    unit_seconds = {}
+    for (lkup_unit, _abbreviate), forms in plural_forms.items():
+        s_scale = s_scales.get(lkup_unit)
+        if s_scale is not None:
+            for form in forms:
+                unit_seconds.setdefault(form, s_scale)
+    for (lkup_unit, _abbreviate), (tm_unit, _singular, _plural) in (
+        plural_forms.items()
+    ):
+        s_scale = s_scales.get(lkup_unit)
+        if s_scale is not None:
+            for form in (tm_unit + 's', tm_unit + '.', tm_unit + 's.'):
+                unit_seconds.setdefault(form, s_scale)
+    # Case-insensitive fallback, for names that are not ambiguous when
+    # folded (e.g., not "m" and "M", which are a month and a minute).
+    folded_seconds = {}
+    ambiguous = set()
+    for form, s_scale in unit_seconds.items():
+        folded = form.lower()
+        if folded_seconds.setdefault(folded, s_scale) != s_scale:
+            ambiguous.add(folded)
+    for folded in ambiguous:
+        del folded_seconds[folded]
+    return unit_seconds, folded_seconds
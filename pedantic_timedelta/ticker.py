@@ -0,0 +1,304 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Live, asyncio-driven elapsed time strings for many tasks at once."""
+
+import asyncio
+import heapq
+import math
+import struct
+import time
+from bisect import bisect_right
+
+from . import PedanticTimedelta
+
+# How many representable floats past a change time to wake, to allow for
+# the float rounding in adding the start time to the elapsed time.
+_WAKE_ULPS = 4
+
+
+def _next_up(value, ulps=1):
+    # Return the float *ulps* representable values above *value*, like
+    # math.nextafter(value, math.inf) (new in Python 3.9), for finite values.
+    bits = struct.unpack('<q', struct.pack('<d', value))[0]
+    if bits < 0:
+        # Negative floats' bit patterns (as signed ints) count down from -0.0.
+        bits = -(bits & 0x7fffffffffffffff)
+    bits += ulps
+    if bits < 0:
+        bits = -bits | -0x8000000000000000
+    return struct.unpack('<d', struct.pack('<q', bits))[0]
+
+
+class ElapsedTicker(object):
+    """Track the elapsed time of many tasks, and report when its text changes.
+
+    Rather than formatting every task's elapsed time on every refresh, the
+    ticker works out when each task's formatted text will next change --
+    e.g., at precision 2, about every 36 seconds once the unit is hours,
+    or on the next unit threshold -- and only re-formats the tasks that
+    are due, which are kept in a heap ordered by that time.
+
+    Iterate the ticker (in a coroutine) to receive a dict of the texts
+    that changed, keyed by task, each time any of them changes. Iteration
+    ends when the ticker is closed, e.g., on leaving its ``async with``
+    block.
+
+    .. code-block:: python
+
+        async with ElapsedTicker() as ticker:
+            ticker.track('build', time.time())
+            async for changes in ticker:
+                for key, text in changes.items():
+                    print(key, text)
+
+    The ticker is not thread-safe: call :py:meth:`track`, :py:meth:`untrack`
+    and :py:meth:`close` from the event loop's thread (e.g., via
+    ``loop.call_soon_threadsafe``).
+
+    :param field_width: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param precision: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param abbreviate: See :py:meth:`PedanticTimedelta.time_format_scaled`.
+    :param min_interval: Minimum number of seconds between refreshes.
+    :param clock: Function that returns the current time, in the same
+        terms as the start times passed to :py:meth:`track`. Defaults to
+        ``time.time``, as used by
+        :py:meth:`PedanticTimedelta.time_format_elapsed`.
+
+    :type field_width: int
+    :type precision: int
+    :type abbreviate: int
+    :type min_interval: float
+    :type clock: callable
+    """
+
+    def __init__(
+        self,
+        field_width=0,
+        precision=2,
+        abbreviate=None,
+        min_interval=0.1,
+        clock=time.time,
+    ):
+        """Create a new ticker, with no tasks, per the formatting options."""
+        self.field_width = field_width
+        self.precision = precision
+        self.abbreviate = abbreviate
+        self.min_interval = min_interval
+        self.clock = clock
+        # The displayed value changes each time the scaled time crosses
+        # the midpoint between two multiples of this step.
+        self._step = 10.0 ** -precision
+        # Maps key → [secs_then, text, generation].
+        self._tracked = {}
+        # Heap of (secs_due, generation, key); entries whose generation
+        # no longer matches the tracked task's are stale, and skipped.
+        self._due = []
+        self._generation = 0
+        self._wakeup = None
+        self._closed = False
+
+    def __len__(self):
+        """Return the number of tracked tasks."""
+        return len(self._tracked)
+
+    def __contains__(self, key):
+        """Return whether a task is tracked."""
+        return key in self._tracked
+
+    def track(self, key, secs_then=None):
+        """Start (or restart) tracking the elapsed time for a task.
+
+        :param key: Any hashable that identifies the task.
+        :param secs_then: The task's start time (per the ticker's *clock*).
+            Defaults to now.
+
+        :return: The task's elapsed time, formatted.
+        :rtype: str
+        """
+        secs_now = self.clock()
+        if secs_then is None:
+            secs_then = secs_now
+        self._generation += 1
+        text = self._render(key, secs_then, secs_now, self._generation)
+        if self._wakeup is not None:
+            # The new task may be due before the current sleep ends.
+            self._wakeup.set()
+        return text
+
+    def untrack(self, key):
+        """Stop tracking a task.
+
+        :param key: The task's key, as passed to :py:meth:`track`.
+
+        :raises KeyError: If the task is not tracked.
+        """
+        del self._tracked[key]
+
+    def text(self, key):
+        """Return the last reported text for a task.
+
+        :param key: The task's key, as passed to :py:meth:`track`.
+        :rtype: str
+        """
+        return self._tracked[key][1]
+
+    def texts(self):
+        """Return the last reported text for every task.
+
+        :return: Mapping of key → text.
+        :rtype: dict
+        """
+        return {key: tracked[1] for key, tracked in self._tracked.items()}
+
+    def next_due(self):
+        """Return the time when the next text will change, or None.
+
+        :rtype: float
+        """
+        due = self._due
+        tracked = self._tracked
+        while due:
+            secs_due, generation, key = due[0]
+            if key in tracked and tracked[key][2] == generation:
+                return secs_due
+            heapq.heappop(due)
+        return None
+
+    def refresh(self, secs_now=None):
+        """Re-format the tasks whose text is due to change.
+
+        Called by the async iterator, but may also be called directly,
+        e.g., from an existing render loop.
+
+        :param secs_now: The current time (per the ticker's *clock*).
+            Defaults to now.
+
+        :return: Mapping of key → text, for each task whose text changed.
+        :rtype: dict
+        """
+        if secs_now is None:
+            secs_now = self.clock()
+        due = self._due
+        tracked = self._tracked
+        popped = []
+        while due and due[0][0] <= secs_now:
+            popped.append(heapq.heappop(due))
+        changes = {}
+        # Each task is re-formatted at most once per refresh, even if its
+        # next change is (due to float rounding) already due.
+        for _secs_due, generation, key in popped:
+            task = tracked.get(key)
+            if task is None or task[2] != generation:
+                continue
+            secs_then, text, _generation = task
+            new_text = self._render(key, secs_then, secs_now, generation)
+            if new_text != text:
+                changes[key] = new_text
+        return changes
+
+    def close(self):
+        """Stop iteration (but keep the tracked tasks' texts)."""
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _render(self, key, secs_then, secs_now, generation):
+        # Rounded as format_seconds does, so that the next change is
+        # computed from the value that is formatted.
+        secs_elapsed = round(secs_now - secs_then, 6) + 0.0
+        text = PedanticTimedelta.format_seconds(
+            secs_elapsed, self.field_width, self.precision, self.abbreviate,
+        )[0]
+        self._tracked[key] = [secs_then, text, generation]
+        # Nudge the sum, too, in case adding secs_then loses the nudge.
+        secs_due = _next_up(secs_then + self._secs_to_change(secs_elapsed), _WAKE_ULPS)
+        if secs_due <= secs_now:
+            # Always wake later, rather than repeatedly right now.
+            secs_due = _next_up(secs_now, _WAKE_ULPS)
+        heapq.heappush(self._due, (secs_due, generation, key))
+        return text
+
+    def _secs_to_change(self, secs_elapsed):
+        # Return the elapsed time at which the formatted text next changes.
+        ladder = PedanticTimedelta._UNIT_LADDER
+        unit_index = bisect_right(ladder.thresholds, secs_elapsed)
+        s_scale = ladder.s_scales[unit_index]
+        step = self._step
+        adj_time = secs_elapsed / s_scale
+        # The first midpoint at or after now (if now is a midpoint, the
+        # value may not have been rounded up, due to float rounding).
+        adj_change = (math.ceil(adj_time / step - 0.5) + 0.5) * step
+        if adj_time <= 1 < adj_change:
+            # The unit name is pluralized after 1.
+            adj_change = 1
+        # The elapsed time is rounded to whole microseconds before it is
+        # formatted, so wake at the first microsecond at least half a
+        # microsecond past the midpoint (allowing for the float rounding in
+        # computing the midpoint), and not a fraction of a step after it
+        # (which, e.g., in days at precision 0, would leave the text stale
+        # for over a minute).
+        us_change = math.floor(adj_change * s_scale * 1000000 + 0.5) + 1
+        if unit_index < len(ladder.thresholds):
+            us_change = min(
+                us_change, math.ceil(ladder.thresholds[unit_index] * 1000000),
+            )
+        return us_change / 1000000
+
+    def __aiter__(self):
+        """Return self: the ticker is its own async iterator."""
+        return self
+
+    async def __anext__(self):
+        """Wait until any formatted text changes, and return the changes."""
+        while not self._closed:
+            changes = self.refresh()
+            if changes:
+                return changes
+            await self._sleep()
+        raise StopAsyncIteration
+
+    async def _sleep(self):
+        if self._wakeup is None:
+            # Created here, and not in __init__, so that it binds to the
+            # running loop (on Python < 3.10).
+            self._wakeup = asyncio.Event()
+        self._wakeup.clear()
+        timeout = None
+        secs_due = self.next_due()
+        if secs_due is not None:
+            timeout = max(self.min_interval, secs_due - self.clock())
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def __aenter__(self):
+        """Return self."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the ticker."""
+        self.close()
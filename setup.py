@@ -14,7 +14,10 @@ Refs:
   https://github.com/pypa/sampleproject
 """
 
-from setuptools import find_packages, setup
+import os
+import platform
+
+from setuptools import Extension, find_packages, setup
 
 # *** Package requirements.
 
@@ -24,6 +27,42 @@ requirements = [
     'Inflector >= 3.0.1, < 4',
 ]
 
+# *** Optional requirements.
+
+extras_requirements = {
+    # Vectorized batch formatting, i.e., PedanticTimedelta.format_many.
+    #  https://numpy.org/
+    'numpy': ['numpy'],
+    # Localized decimal separator, i.e., pedantic_timedelta.locales.
+    #  http://babel.pocoo.org/
+    'locale': ['Babel'],
+    # Series accessor, i.e., pedantic_timedelta.pandas_accessor.
+    #  https://pandas.pydata.org/
+    'pandas': ['numpy', 'pandas'],
+    # Duration arrays, i.e., pedantic_timedelta.arrow.
+    #  https://arrow.apache.org/docs/python/
+    'arrow': ['numpy', 'pyarrow'],
+}
+
+# *** Optional compiled accelerator.
+
+# The C extension speeds up formatting and construction, but the package
+# works without it (pedantic_timedelta uses its pure-Python equivalents).
+# - The build is optional, so a missing compiler is not an install error.
+# - Set PEDANTIC_TIMEDELTA_PURE_PYTHON to skip building it, e.g., to test
+#   the pure-Python code (though setting it at runtime also suffices).
+# - Other Pythons (e.g., PyPy) would not benefit.
+ext_modules = []
+if (
+    platform.python_implementation() == 'CPython'
+    and not os.environ.get('PEDANTIC_TIMEDELTA_PURE_PYTHON')
+):
+    ext_modules.append(Extension(
+        'pedantic_timedelta._speedups',
+        sources=['pedantic_timedelta/_speedups.c'],
+        optional=True,
+    ))
+
 # *** Minimal setup() function -- Prefer using config where possible.
 
 # (lb): Most settings are in setup.cfg, except identifying packages.
@@ -35,12 +74,19 @@ setup(
     #   https://packaging.python.org/en/latest/requirements.html
     install_requires=requirements,
 
+    # Optional dependencies, installed on, e.g.,
+    #   pip install human-friendly_pedantic-timedelta[numpy]
+    extras_require=extras_requirements,
+
     # Specify which package(s) to install.
     # - Without any rules, find_packages returns, e.g.,
-    #     ['pedantic_timedelta', 'tests', 'tests.pedantic_timedelta']
-    # - With the 'exclude*' rule, this call is essentially:
+    #     ['pedantic_timedelta', 'tests', 'tests.pedantic_timedelta', 'benchmarks']
+    # - With the 'exclude*' rules, this call is essentially:
     #     packages=['pedantic_timedelta']
-    packages=find_packages(exclude=['tests*']),
+    packages=find_packages(exclude=['tests*', 'benchmarks*']),
+
+    # Build the optional accelerator (see above).
+    ext_modules=ext_modules,
 
     # Tell setuptools to determine the version
     # from the latest SCM (git) version tag.
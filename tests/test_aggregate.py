@@ -0,0 +1,201 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.aggregate``."""
+
+import array
+import datetime
+import math
+import random
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.aggregate import DurationAggregator
+
+
+def nearest_rank(sorted_secs, percent):
+    return sorted_secs[max(1, math.ceil(percent * len(sorted_secs) / 100)) - 1]
+
+
+@pytest.fixture
+def durations():
+    rnd = random.Random(23)
+    return [rnd.lognormvariate(4, 2.5) for _ in range(20000)]
+
+
+class TestDurationAggregator(object):
+    @pytest.mark.parametrize('buckets_per_unit', [32, 128])
+    def test_percentiles_within_relative_error(self, durations, buckets_per_unit):
+        """Ensure estimates are within the advertised relative error."""
+        aggregator = DurationAggregator(buckets_per_unit=buckets_per_unit)
+        for secs in durations:
+            aggregator.add(secs)
+        # The widest ratio, a decade, bounds the relative error.
+        bound = 10 ** (1 / buckets_per_unit) - 1
+        durations.sort()
+        for percent in (1, 10, 50, 90, 95, 99, 99.9):
+            exact = nearest_rank(durations, percent)
+            assert aggregator.percentile(percent) == pytest.approx(exact, rel=bound)
+        assert aggregator.percentile(0) == durations[0] == aggregator.min
+        assert aggregator.percentile(100) == durations[-1] == aggregator.max
+        assert aggregator.mean() == pytest.approx(math.fsum(durations) / len(durations))
+        assert len(aggregator) == aggregator.count == len(durations)
+
+    def test_estimates_stay_within_unit(self):
+        """Ensure an estimate is never formatted with a neighboring unit."""
+        aggregator = DurationAggregator(buckets_per_unit=2)
+        aggregator.update([59.9] * 10 + [3599.9] * 10 + [86399.0])
+        assert aggregator.percentile(25) < 60
+        assert aggregator.percentile(75) < 3600
+        assert aggregator.unit_counts() == [
+            ('sec', 10), ('min', 10), ('hour', 1), ('day', 0), ('month', 0), ('year', 0),
+        ]
+
+    def test_update_matches_add(self, durations):
+        """Ensure batches are counted as one at a time."""
+        batched = DurationAggregator()
+        batched.update(durations[:100])
+        batched.update(tuple(durations[100:200]))
+        batched.update(array.array('d', durations[200:]))
+        batched.update(iter([float('nan')]))
+        added = DurationAggregator()
+        for secs in durations:
+            added.add(secs)
+        added.add(float('nan'))
+        assert list(batched._counts) == list(added._counts)
+        assert batched.count == added.count
+        assert batched.sum == pytest.approx(added.sum, rel=1e-15)
+        assert (batched.min, batched.max) == (added.min, added.max)
+
+    def test_update_numpy(self):
+        """Ensure NumPy number and timedelta64 arrays are counted at once."""
+        np = pytest.importorskip('numpy')
+        aggregator = DurationAggregator()
+        aggregator.update(np.array([1.5, np.nan, 90]))
+        aggregator.update(np.array([2, 'NaT'], dtype='timedelta64[h]'))
+        aggregator.update(np.array([], dtype=np.float64))
+        assert aggregator.count == 3
+        assert aggregator.sum == 7291.5
+        assert aggregator.unit_counts(abbreviate=0)[:3] == [
+            ('second', 1), ('minute', 1), ('hour', 1),
+        ]
+
+    def test_timedeltas_and_small_values(self):
+        """Ensure timedeltas, zero, and negative durations are counted."""
+        aggregator = DurationAggregator()
+        aggregator.update([datetime.timedelta(seconds=-1), 0, PedanticTimedelta(days=2)])
+        assert (aggregator.min, aggregator.max) == (-1, 172800)
+        # Both share the first bucket, but zeros are counted apart.
+        assert -1 <= aggregator.percentile(34) <= aggregator.min_seconds
+        assert -1 <= aggregator.percentile(50) <= aggregator.min_seconds
+        assert aggregator.percentile(34) == aggregator.percentile(50) == 0
+        huge = DurationAggregator(max_seconds=1000)
+        huge.update([1, 10 ** 6, 2 * 10 ** 6])
+        assert 1000 <= huge.percentile(50) <= 2 * 10 ** 6
+
+    @pytest.mark.parametrize('batch', [True, False])
+    def test_percentiles_not_positive(self, batch):
+        """Ensure zero and negative durations are not interpolated together."""
+        aggregator = DurationAggregator()
+        if batch:
+            aggregator.update([-5, 0, 3])
+        else:
+            for duration in (-5, 0, 3):
+                aggregator.add(duration)
+        assert aggregator.percentile(50) == 0
+        assert aggregator.percentile(20) == -5
+        other = DurationAggregator()
+        other.update([-4, -2, 0, 0, 1e-8, 0.5])
+        other.merge(aggregator)
+        assert (other._negatives, other._zeros) == (3, 3)
+        assert -5 < other.percentile(30) < 0
+        assert other.percentile(40) == other.percentile(60) == 0
+        assert 0 < other.percentile(70) <= other.min_seconds
+
+    def test_merge(self, durations):
+        """Ensure merged aggregators count everything."""
+        whole = DurationAggregator()
+        whole.update(durations)
+        first, second = DurationAggregator(), DurationAggregator()
+        first.update(durations[:5000])
+        second.update(durations[5000:])
+        first.merge(second)
+        assert list(first._counts) == list(whole._counts)
+        assert first.summary() == whole.summary()
+        with pytest.raises(ValueError):
+            first.merge(DurationAggregator(buckets_per_unit=8))
+
+    def test_summary(self):
+        """Ensure summaries are formatted."""
+        aggregator = DurationAggregator()
+        assert aggregator.format_summary() == (
+            'count: 0, min: -, mean: -, p50: -, p95: -, p99: -, max: -'
+        )
+        assert list(aggregator.summary().values()) == ['0'] + [None] * 6
+        aggregator.update([1, 2, 3, 4, 120])
+        summary = aggregator.summary(percentiles=(50, 99.9), precision=1, abbreviate=0)
+        assert list(summary.items()) == [
+            ('count', '5'),
+            ('min', '1.0 second'),
+            ('mean', '26.0 seconds'),
+            ('p50', '3.0 seconds'),
+            ('p99.9', '2.0 minutes'),
+            ('max', '2.0 minutes'),
+        ]
+
+    def test_custom_unit_ladder(self):
+        """Ensure the buckets follow the unit ladder in effect."""
+        try:
+            PedanticTimedelta.set_unit_ladder(('millisecond', 'second', 'hour'))
+            aggregator = DurationAggregator()
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+        assert aggregator._edges[0] == aggregator.min_seconds
+        assert 0.001 in aggregator._edges and 3600.0 in aggregator._edges
+        assert 86400 not in aggregator._edges
+        aggregator.update([0.002, 1800, 7200])
+        assert [count for _unit, count in aggregator.unit_counts()] == [1, 1, 1]
+
+    @pytest.mark.parametrize('kwargs', [
+        {'buckets_per_unit': 0},
+        {'min_seconds': 0},
+        {'min_seconds': 10, 'max_seconds': 1},
+    ])
+    def test_invalid_options(self, kwargs):
+        """Ensure bad bucket options are rejected."""
+        with pytest.raises(ValueError):
+            DurationAggregator(**kwargs)
+
+    @pytest.mark.parametrize('percent', [-1, 101])
+    def test_invalid_percentile(self, percent):
+        """Ensure percentiles must be from 0 to 100, and need durations."""
+        aggregator = DurationAggregator()
+        with pytest.raises(ValueError):
+            aggregator.percentile(50)
+        with pytest.raises(ValueError):
+            aggregator.mean()
+        aggregator.add(1)
+        with pytest.raises(ValueError):
+            aggregator.percentile(percent)
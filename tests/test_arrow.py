@@ -0,0 +1,92 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.arrow``."""
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+
+pa = pytest.importorskip('pyarrow')
+pytest.importorskip('numpy')
+arrow = pytest.importorskip('pedantic_timedelta.arrow')
+pc = pytest.importorskip('pyarrow.compute')
+
+SECONDS = [-5, 0, 1, 90, 3600, 129600, 86400 * 40, 94670775]
+
+
+class TestArrow(object):
+    @pytest.mark.parametrize('unit', ['s', 'ms', 'us', 'ns'])
+    def test_format_durations(self, unit):
+        """Ensure output matches time_format_scaled, per element."""
+        scale = {'s': 1, 'ms': 10 ** 3, 'us': 10 ** 6, 'ns': 10 ** 9}[unit]
+        durations = pa.array(
+            [seconds * scale for seconds in SECONDS], pa.duration(unit),
+        )
+        formatted = arrow.format_durations(durations, precision=3, abbreviate=0)
+        assert formatted.type == pa.string()
+        assert formatted.to_pylist() == [
+            PedanticTimedelta(seconds=seconds).time_format_scaled(
+                precision=3, abbreviate=0,
+            )[0]
+            for seconds in SECONDS
+        ]
+
+    def test_nulls_slices_and_chunks(self):
+        """Ensure nulls, offsets, and chunks are honored."""
+        durations = pa.array([None, 90, 5400, None], pa.duration('s'))
+        assert arrow.format_durations(durations).to_pylist() == [
+            None, '1.50 mins.', '1.50 hours', None,
+        ]
+        assert arrow.format_durations(durations[2:]).to_pylist() == [
+            '1.50 hours', None,
+        ]
+        chunked = pa.chunked_array([durations[1:2], durations[:0], durations[2:]])
+        formatted = arrow.format_durations(chunked)
+        assert isinstance(formatted, pa.ChunkedArray)
+        assert formatted.to_pylist() == ['1.50 mins.', '1.50 hours', None]
+
+    def test_beyond_int64_nanoseconds(self):
+        """Ensure coarse units are not scaled up to (overflowing) nanoseconds."""
+        seconds = 10 ** 10
+        assert seconds * 10 ** 9 > 2 ** 63
+        durations = pa.array([seconds], pa.duration('s'))
+        assert arrow.format_durations(durations).to_pylist() == [
+            PedanticTimedelta(seconds=seconds).time_format_scaled()[0],
+        ]
+        assert arrow.format_durations(durations).to_pylist() == ['316.89 years']
+
+    def test_not_durations(self):
+        """Ensure other types are rejected."""
+        with pytest.raises(TypeError):
+            arrow.format_durations(pa.array([1, 2]))
+
+    def test_register_compute_function(self):
+        """Ensure the compute function formats with its options."""
+        arrow.register_compute_function(
+            'pedantic_format_test', precision=1, abbreviate=0, unit='ms',
+        )
+        durations = pa.array([1500, None], pa.duration('ms'))
+        formatted = pc.call_function('pedantic_format_test', [durations])
+        assert formatted.to_pylist() == ['1.5 seconds', None]
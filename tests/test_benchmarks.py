@@ -0,0 +1,69 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Smoke tests for the benchmark suite (so it does not rot)."""
+
+import json
+
+import pytest
+from benchmarks import run
+
+
+class TestBenchmarksRun(object):
+    def test_collect_and_call_benchmarks(self):
+        """Ensure every benchmark is found and runs."""
+        collected = run.collect_benchmarks()
+        names = [name for name, _setup, _func, _teardown in collected]
+        assert 'bench_construct.time_new_extended_units' in names
+        assert 'bench_format.TimeFormatScaled.time_format_scaled(abbreviate=6)' in names
+        for _name, setup, func, teardown in collected:
+            if setup is not None:
+                setup()
+            func()
+            if teardown is not None:
+                teardown()
+
+    def test_main_output_and_compare(self, tmp_path, capsys):
+        """Ensure results are saved, and regressions are detected."""
+        output = tmp_path / 'results.json'
+        argv = ['-k', 'timedelta_baseline', '-r', '1', '-o', str(output)]
+        assert run.main(argv) == 0
+        results = json.loads(output.read_text())
+        assert list(results['results']) == ['bench_construct.time_timedelta_baseline']
+        # Pretend the baseline was much faster than it was.
+        results['results']['bench_construct.time_timedelta_baseline']['seconds'] /= 100
+        output.write_text(json.dumps(results))
+        assert run.main(['-k', 'timedelta_baseline', '-r', '1', '-c', str(output)]) == 1
+        assert 'REGRESSION' in capsys.readouterr().out
+
+    @pytest.mark.parametrize(('seconds', 'expectation'), [
+        (1.5e-7, '150.00 ns'),
+        (2.5e-6, '2.50 µs'),
+        (0.25, '250.00 ms'),
+        (3, '3.00 s'),
+    ])
+    def test_format_time(self, seconds, expectation):
+        """Ensure times are reported in readable units."""
+        assert run.format_time(seconds) == expectation
@@ -0,0 +1,191 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.big``."""
+
+import copy
+import datetime
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.big import BigTimedelta
+
+
+class TestBigTimedelta(object):
+    @pytest.mark.parametrize('kwargs', [
+        {},
+        {'days': 3, 'hours': 4, 'minutes': 12},
+        {'days': -1, 'microseconds': 1},
+        {'seconds': 1.5, 'milliseconds': 0.5},
+        {'weeks': 2, 'fortnights': 1},
+        {'years': 1, 'months': 2, 'seasons': 1},
+        {'megaannums': 2},
+        {'days': 999999999, 'seconds': 86399, 'microseconds': 999999},
+    ])
+    def test_matches_pedantic_timedelta(self, kwargs):
+        """Ensure small durations behave just like PedanticTimedelta."""
+        big = BigTimedelta(**kwargs)
+        ptd = PedanticTimedelta(**kwargs)
+        assert big == ptd
+        assert ptd == big
+        assert hash(big) == hash(ptd)
+        assert (big.days, big.seconds, big.microseconds) == (
+            ptd.days, ptd.seconds, ptd.microseconds,
+        )
+        assert str(big) == str(ptd)
+        assert big.total_seconds() == ptd.total_seconds()
+        for abbreviate in (0, 5, None):
+            assert big.time_format_scaled(precision=3, abbreviate=abbreviate) == (
+                ptd.time_format_scaled(precision=3, abbreviate=abbreviate)
+            )
+        assert big.time_format_composite(max_units=6) == (
+            ptd.time_format_composite(max_units=6)
+        )
+        assert big.to_timedelta() == ptd
+        assert isinstance(big.to_timedelta(), PedanticTimedelta)
+        assert BigTimedelta.from_timedelta(ptd) == big
+
+    @pytest.mark.parametrize(('kwargs', 'exp_fmmtd'), [
+        ({'epochs': 1}, '10000000.00 years'),
+        ({'eras': 1}, '100000000.00 years'),
+        ({'eons': 1}, '500000000.00 years'),
+        ({'gigaannums': 13.8}, '13800000000.00 years'),
+    ])
+    def test_geological_units(self, kwargs, exp_fmmtd):
+        """Ensure durations beyond 999999999 days can be made and formatted."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta(**kwargs)
+        big = BigTimedelta(**kwargs)
+        assert big.time_format_scaled(abbreviate=0)[0] == exp_fmmtd
+        assert (-big).time_format_scaled(abbreviate=0)[0] == (
+            PedanticTimedelta.format_seconds(-big.total_seconds(), abbreviate=0)[0]
+        )
+
+    def test_exact_integer_arithmetic(self):
+        """Ensure huge values do not lose microseconds."""
+        big = BigTimedelta(days=10 ** 30, microseconds=1)
+        assert big.total_microseconds() == 10 ** 30 * 86400 * 10 ** 6 + 1
+        assert (big + big - big).total_microseconds() == big.total_microseconds()
+        assert (big * 3).total_microseconds() == 3 * big.total_microseconds()
+        assert (big * 3) // 3 == big
+        assert big / big == 1.0
+        assert big // BigTimedelta(days=1) == 10 ** 30
+        assert big % BigTimedelta(days=1) == datetime.timedelta(microseconds=1)
+        assert divmod(big, BigTimedelta(days=1)) == (
+            10 ** 30, BigTimedelta(microseconds=1),
+        )
+        assert -big < big
+        assert abs(-big) == big
+        assert +big is big
+
+    @pytest.mark.parametrize('factor', [0.5, 1.5, 2.5, -0.25, 1 / 3])
+    @pytest.mark.parametrize('microseconds', [1, 3, 5, 999999, -7])
+    def test_float_mul_div_round_like_timedelta(self, microseconds, factor):
+        """Ensure multiplying/dividing by floats rounds as timedelta does."""
+        big = BigTimedelta(microseconds=microseconds)
+        delta = datetime.timedelta(microseconds=microseconds)
+        assert big * factor == delta * factor
+        assert factor * big == factor * delta
+        assert big / factor == delta / factor
+        assert big / 2 == delta / 2
+
+    def test_mixed_timedelta_arithmetic(self):
+        """Ensure timedeltas can be added to and subtracted from big ones."""
+        big = BigTimedelta(eons=1)
+        delta = datetime.timedelta(days=1)
+        assert isinstance(big + delta, BigTimedelta)
+        assert isinstance(delta + big, BigTimedelta)
+        assert (big + delta) - big == delta
+        assert delta - (big + delta) == -big
+        assert big / delta == big.total_seconds() / 86400
+        assert delta < big
+        assert big > delta
+        assert big != 1
+        with pytest.raises(TypeError):
+            big + 1
+        with pytest.raises(TypeError):
+            big < 1
+
+    @pytest.mark.parametrize('value', [Fraction(1, 3), Decimal('0.5'), 2.5])
+    def test_number_types(self, value):
+        """Ensure non-int arguments are rounded to microseconds."""
+        assert BigTimedelta(seconds=value) == (
+            datetime.timedelta(seconds=float(value))
+        )
+
+    @pytest.mark.parametrize(('value', 'error'), [
+        (float('inf'), OverflowError),
+        (float('nan'), ValueError),
+    ])
+    def test_not_finite(self, value, error):
+        """Ensure infinite and NaN durations are rejected."""
+        with pytest.raises(error):
+            BigTimedelta(years=value)
+
+    def test_to_timedelta_too_big(self):
+        """Ensure converting to a timedelta fails helpfully."""
+        with pytest.raises(ValueError):
+            BigTimedelta(days=10 ** 9).to_timedelta()
+
+    def test_immutable_and_picklable(self):
+        """Ensure instances are immutable values."""
+        big = BigTimedelta(gigaannums=1, microseconds=1)
+        with pytest.raises(AttributeError):
+            big._microseconds = 0
+        with pytest.raises(AttributeError):
+            del big._microseconds
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(big, protocol)) == big
+        assert copy.copy(big) is big
+        assert copy.deepcopy(big) is big
+        assert eval(repr(big)) == big
+        assert not BigTimedelta()
+        assert BigTimedelta.from_microseconds(5.0) == BigTimedelta(microseconds=5)
+
+    def test_format_cache(self):
+        """Ensure the format cache is used, if enabled."""
+        from pedantic_timedelta.cache import disable_format_cache, enable_format_cache
+        big = BigTimedelta(eons=1)
+        expected = big.time_format_scaled()
+        cache = enable_format_cache()
+        try:
+            assert big.time_format_scaled() == expected
+            assert big.time_format_scaled() == expected
+            assert cache.cache_info().hits == 1
+        finally:
+            disable_format_cache()
+
+    def test_exact_unit_conversion(self, monkeypatch):
+        """Ensure the exact conversion mode is honored."""
+        monkeypatch.setattr(PedanticTimedelta, 'EXACT_UNIT_CONVERSION', True)
+        assert BigTimedelta(gigaannums=1, months=-1).total_microseconds() == (
+            10 ** 9 * 31556925129600 - 2629743760800
+        )
+        assert BigTimedelta(months=1, days=1.5) == (
+            PedanticTimedelta(months=1, days=1.5)
+        )
@@ -0,0 +1,142 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.cache``."""
+
+import datetime
+import threading
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta, cache
+from pedantic_timedelta.formatter import DurationFormatter
+
+
+class TestFormatCache(object):
+    def test_hits_and_misses(self):
+        """Ensure repeats are served from the cache, per option set."""
+        format_cache = cache.FormatCache(maxsize=10)
+        assert format_cache.format_seconds(90) == ('1.50 mins.', 60.0, 'min')
+        assert format_cache.format_seconds(datetime.timedelta(seconds=90)) == (
+            '1.50 mins.', 60.0, 'min',
+        )
+        assert format_cache.format_seconds(90, abbreviate=6)[0] == '1.50 mins.'
+        assert format_cache.format_seconds(90, precision=1)[0] == '1.5 mins.'
+        assert format_cache.format_seconds(90, locale='xx')[0] == '1.50 mins.'
+        assert format_cache.cache_info() == cache.CacheInfo(
+            hits=2, misses=3, maxsize=10, currsize=3,
+        )
+        format_cache.cache_clear()
+        assert format_cache.cache_info() == cache.CacheInfo(0, 0, 10, 0)
+
+    def test_abbreviate_normalized(self):
+        """Ensure equivalent abbreviate values share a cache entry."""
+        format_cache = cache.FormatCache(maxsize=10)
+        full = PedanticTimedelta.UNIT_NAME_FULL
+        for abbreviate in (full, 99, -3):
+            assert format_cache.format_seconds(90, abbreviate=abbreviate)[0] == (
+                '1.50 minutes'
+            )
+        assert format_cache.cache_info().currsize == 1
+
+    def test_lru_eviction(self):
+        """Ensure the least recently used result is discarded first."""
+        format_cache = cache.FormatCache(maxsize=2)
+        format_cache.format_seconds(1)
+        format_cache.format_seconds(2)
+        format_cache.format_seconds(1)
+        format_cache.format_seconds(3)
+        assert len(format_cache) == 2
+        format_cache.format_seconds(1)
+        assert format_cache.cache_info().hits == 2
+        format_cache.format_seconds(2)
+        assert format_cache.cache_info().misses == 4
+
+    def test_invalid_maxsize(self):
+        """Ensure a cache must hold something."""
+        with pytest.raises(ValueError):
+            cache.FormatCache(maxsize=0)
+
+    def test_ladder_change_empties_cache(self):
+        """Ensure stale results are not served."""
+        format_cache = cache.FormatCache()
+        assert format_cache.format_seconds(86400 * 14)[0] == '14.00 days'
+        try:
+            PedanticTimedelta.set_unit_ladder(('second', 'day', 'fortnight'))
+            assert format_cache.format_seconds(86400 * 14)[0] == '1.00 fortnight'
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+        assert format_cache.format_seconds(86400 * 14)[0] == '14.00 days'
+        assert format_cache.cache_info().hits == 0
+
+    def test_enable_format_cache(self):
+        """Ensure time_format_scaled uses the opt-in cache."""
+        try:
+            format_cache = cache.enable_format_cache(maxsize=100)
+            assert PedanticTimedelta.FORMAT_CACHE is format_cache
+            for _ in range(3):
+                assert PedanticTimedelta(days=0.33).time_format_scaled() == (
+                    '7.92 hours', 3600.0, 'hour',
+                )
+            assert format_cache.cache_info().hits == 2
+        finally:
+            cache.disable_format_cache()
+        assert PedanticTimedelta.FORMAT_CACHE is None
+
+    def test_formatter_cache(self):
+        """Ensure formatters may share a cache."""
+        format_cache = cache.FormatCache()
+        brief = DurationFormatter(abbreviate=5, cache=format_cache)
+        full = DurationFormatter(abbreviate=0, cache=format_cache)
+        assert brief.map([90, 90]) == ['1.50 mins.', '1.50 mins.']
+        assert full(90) == '1.50 minutes'
+        assert format_cache.cache_info() == cache.CacheInfo(1, 2, 1024, 2)
+
+    def test_threads(self):
+        """Ensure the cache stays consistent when shared by threads."""
+        format_cache = cache.FormatCache(maxsize=50)
+        seconds = [secs * 7.5 for secs in range(100)]
+        expected = {
+            secs: PedanticTimedelta.format_seconds(secs) for secs in seconds
+        }
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def hammer(offset):
+            barrier.wait()
+            for round_ in range(20):
+                for index in range(len(seconds)):
+                    secs = seconds[(index + offset * round_) % len(seconds)]
+                    if format_cache.format_seconds(secs) != expected[secs]:
+                        errors.append(secs)
+
+        threads = [threading.Thread(target=hammer, args=(n, )) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        info = format_cache.cache_info()
+        assert info.hits + info.misses == 8 * 20 * len(seconds)
+        assert info.currsize == 50
@@ -0,0 +1,106 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for the ``pedantic-timedelta`` command."""
+
+import io
+import sys
+
+import pytest
+from freezegun import freeze_time
+from pedantic_timedelta import cli
+
+
+class TestPedanticTimedeltaCli(object):
+    @pytest.mark.parametrize(('argv', 'stdin', 'expectation'), [
+        ([], '1.5\n\n90,240\n86400 172800\n', '1.50 secs.\n2.50 mins.\n1.00 day\n'),
+        (['-a', '4', '-p', '1', '-w', '6'], '7200\n', '   2.0 hrs.\n'),
+        (['-'], '', ''),
+        # Elapsed times are rounded to microseconds, as time_format_elapsed does.
+        ([], '0 59.9999996\n0,-3e-07\n', '1.00 min.\n0.00 sec.\n'),
+    ])
+    def test_main_stdin(self, monkeypatch, capsys, argv, stdin, expectation):
+        """Ensure stdin lines are formatted with the given options."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(stdin))
+        assert cli.main(argv) == 0
+        assert capsys.readouterr().out == expectation
+
+    @freeze_time('2015-12-10 12:30')
+    def test_main_elapsed(self, monkeypatch, capsys):
+        """Ensure single values are elapsed from now with --elapsed."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('1449750450\n'))
+        assert cli.main(['--elapsed']) == 0
+        assert capsys.readouterr().out == '2.50 mins.\n'
+
+    def test_main_files_jobs(self, monkeypatch, capsys, tmp_path):
+        """Ensure parallel output is in the same order as the input."""
+        monkeypatch.setattr(cli, 'CHUNK_LINES', 7)
+        paths = []
+        for n_file in range(2):
+            path = tmp_path / 'input-{}.csv'.format(n_file)
+            path.write_text(''.join(
+                '{}\n'.format(n_file * 100000 + secs) for secs in range(50)
+            ))
+            paths.append(str(path))
+        assert cli.main(paths) == 0
+        serial = capsys.readouterr().out
+        assert cli.main(['--jobs', '3'] + paths) == 0
+        assert capsys.readouterr().out == serial
+        assert serial.splitlines()[-1] == '1.16 days'
+        assert len(serial.splitlines()) == 100
+
+    def test_main_bad_input(self, monkeypatch, capsys):
+        """Ensure unparseable input is reported."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('1 2 3\n'))
+        assert cli.main([]) == 1
+        assert 'Expected 1 or 2 values' in capsys.readouterr().err
+
+    @pytest.mark.parametrize('jobs', ['1', '2'])
+    def test_main_bad_line_located(self, monkeypatch, capsys, tmp_path, jobs):
+        """Ensure a bad line is located, after the lines before it are output."""
+        monkeypatch.setattr(cli, 'CHUNK_LINES', 3)
+        path = tmp_path / 'input.csv'
+        path.write_text('60\n\n3600\n7200\nbogus\n86400\n')
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('1\n'))
+        assert cli.main(['--jobs', jobs, '-', str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out == '1.00 sec.\n1.00 min.\n1.00 hour\n2.00 hours\n'
+        assert captured.err == (
+            "pedantic-timedelta: {}:5: Not a duration: 'bogus'"
+            " (could not convert string to float: 'bogus')\n".format(path)
+        )
+
+    def test_main_skip_invalid(self, monkeypatch, capsys):
+        """Ensure --skip-invalid reports and skips bad lines, e.g., a header."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('then,now\n0,90\n1 2 3\n5\n'))
+        assert cli.main(['--skip-invalid']) == 0
+        captured = capsys.readouterr()
+        assert captured.out == '1.50 mins.\n5.00 secs.\n'
+        assert captured.err.splitlines() == [
+            "pedantic-timedelta: <stdin>:1: Not a duration: 'then,now'"
+            " (could not convert string to float: 'then')",
+            "pedantic-timedelta: <stdin>:3: Not a duration: '1 2 3'"
+            " (Expected 1 or 2 values per line)",
+        ]
@@ -0,0 +1,116 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.column``."""
+
+import datetime
+import sys
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.column import DurationColumn
+
+
+class TestDurationColumn(object):
+    def test_append_extend_and_index(self):
+        """Ensure seconds and timedeltas are stored as microseconds."""
+        column = DurationColumn([1.5, datetime.timedelta(days=1, microseconds=7)])
+        column.append(-0.000001)
+        column.extend([PedanticTimedelta(minutes=3)])
+        assert len(column) == 4
+        assert column[0] == PedanticTimedelta(seconds=1.5)
+        assert column[1] == datetime.timedelta(days=1, microseconds=7)
+        assert column[-2] == datetime.timedelta(microseconds=-1)
+        assert isinstance(column[-1], PedanticTimedelta)
+        assert list(column.memoryview()) == [
+            1500000, 86400000007, -1, 180000000,
+        ]
+
+    def test_slice_and_iterate(self):
+        """Ensure slices are columns, and iteration yields durations."""
+        column = DurationColumn(range(10))
+        assert column[2:5] == DurationColumn([2, 3, 4])
+        assert list(column[::4]) == [
+            PedanticTimedelta(seconds=seconds) for seconds in (0, 4, 8)
+        ]
+        assert list(column[8:].iter_seconds()) == [8.0, 9.0]
+
+    def test_aggregates(self):
+        """Ensure sum, mean, min and max are exact."""
+        column = DurationColumn([0.1] * 10 + [3600, -5])
+        assert column.sum() == datetime.timedelta(seconds=3596)
+        assert column.mean() == datetime.timedelta(microseconds=3596000000 / 12)
+        assert column.min() == datetime.timedelta(seconds=-5)
+        assert column.max() == datetime.timedelta(hours=1)
+
+    def test_empty_aggregates(self):
+        """Ensure an empty column has no mean, min nor max."""
+        column = DurationColumn()
+        assert column.sum() == datetime.timedelta(0)
+        assert column.mean() is None
+        assert column.min() is None
+        assert column.max() is None
+
+    def test_format_scaled(self):
+        """Ensure bulk formatting matches time_format_scaled."""
+        seconds = [0.25, 90, 86400 * 40, 31556925.1296 * 2]
+        column = DurationColumn(seconds)
+        assert column.format_scaled(field_width=8, precision=1, abbreviate=2) == [
+            PedanticTimedelta(seconds=secs).time_format_scaled(
+                field_width=8, precision=1, abbreviate=2,
+            )[0]
+            for secs in seconds
+        ]
+
+    def test_bytes_round_trip(self):
+        """Ensure columns can be rebuilt from their raw bytes."""
+        column = DurationColumn([1, 2.5, -3])
+        assert DurationColumn.from_microseconds(column.tobytes()) == column
+        assert DurationColumn.from_microseconds(column.memoryview()) == column
+        assert DurationColumn.from_microseconds([1000000]) == DurationColumn([1])
+
+    def test_zero_copy_buffer(self):
+        """Ensure the exported buffer is a view, not a copy."""
+        column = DurationColumn([1, 2])
+        view = column.memoryview()
+        assert view.format == 'q'
+        assert view.itemsize == 8
+        if sys.version_info >= (3, 12):
+            assert memoryview(column).tolist() == view.tolist()
+        # The buffer cannot be resized while it is exported.
+        with pytest.raises(BufferError):
+            column.append(3)
+        view.release()
+        column.append(3)
+        assert len(column) == 3
+
+    def test_numpy_frombuffer(self):
+        """Ensure NumPy can read the column without copying."""
+        np = pytest.importorskip('numpy')
+        column = DurationColumn([1, 2])
+        microseconds = np.frombuffer(column.memoryview(), dtype=np.int64)
+        assert microseconds.tolist() == [1000000, 2000000]
+        times_fmtd, _, _ = PedanticTimedelta.format_many(microseconds / 1e6)
+        assert times_fmtd.tolist() == column.format_scaled()
@@ -0,0 +1,90 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.formatter``."""
+
+import datetime
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.formatter import DurationFormatter
+
+SECONDS = [-5, 0, 0.25, 1, 1.5, 60, 90, 86400 / 2, 86400 * 40, 31556925.1296 * 3]
+
+
+class TestDurationFormatter(object):
+    @pytest.mark.parametrize('abbreviate', [None, -1, 0, 1, 4, 5, 6, 7])
+    @pytest.mark.parametrize('seconds', SECONDS)
+    def test_call(self, seconds, abbreviate):
+        """Ensure output matches format_seconds, for seconds and timedeltas."""
+        formatter = DurationFormatter(field_width=9, precision=3, abbreviate=abbreviate)
+        expected = PedanticTimedelta.format_seconds(
+            seconds, field_width=9, precision=3, abbreviate=abbreviate,
+        )[0]
+        assert formatter(seconds) == expected
+        assert formatter(PedanticTimedelta(seconds=seconds)) == (
+            PedanticTimedelta(seconds=seconds).time_format_scaled(
+                field_width=9, precision=3, abbreviate=abbreviate,
+            )[0]
+        )
+
+    def test_map(self):
+        """Ensure batches match the single value output."""
+        formatter = DurationFormatter(precision=1)
+        durations = SECONDS + [datetime.timedelta(hours=36)]
+        assert formatter.map(iter(durations)) == [
+            formatter(duration) for duration in durations
+        ]
+        assert formatter.map([]) == []
+
+    def test_recompiles_on_ladder_change(self):
+        """Ensure a new unit ladder is noticed."""
+        formatter = DurationFormatter()
+        assert formatter(86400 * 14) == '14.00 days'
+        try:
+            PedanticTimedelta.set_unit_ladder(('second', 'day', 'fortnight'))
+            assert formatter(86400 * 14) == '1.00 fortnight'
+            assert formatter.map([86400 * 28]) == ['2.00 fortnights']
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+        assert formatter(86400 * 14) == '14.00 days'
+
+    def test_recompiles_on_unit_names_change(self, monkeypatch):
+        """Ensure replaced unit names are noticed."""
+        formatter = DurationFormatter()
+        assert formatter(86400 * 3) == '3.00 days'
+        unit_names = dict(PedanticTimedelta.UNIT_NAMES)
+        unit_names['day'] = ('sol', 'd', 'sl', 'sol', 'sols', 'sol', 'sol')
+        monkeypatch.setattr(PedanticTimedelta, 'UNIT_NAMES', unit_names)
+        assert formatter(86400 * 3) == '3.00 sols'
+
+    def test_locale(self):
+        """Ensure a locale without a catalog formats in English."""
+        formatter = DurationFormatter(locale='xx', abbreviate=0)
+        assert formatter(90) == '1.50 minutes'
+        assert formatter.map([1, 7200]) == ['1.00 second', '2.00 hours']
+        assert repr(formatter) == (
+            "DurationFormatter(field_width=0, precision=2, abbreviate=0, locale='xx')"
+        )
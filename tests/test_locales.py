@@ -0,0 +1,153 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.locales``."""
+
+import struct
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta, locales
+
+RU_PLURAL_FORMS = (
+    'nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4'
+    ' && (n%100<10 || n%100>=20) ? 1 : 2);'
+)
+
+RU_MESSAGES = {
+    'minute': 'минута',
+    'min': 'мин',
+    ('minute', 'minutes'): ('минута', 'минуты', 'минут'),
+    ('sec.', 'secs.'): ('сек.', 'сек.', 'сек.'),
+}
+
+
+def write_mo(path, messages, plural_forms):
+    """Write a GNU gettext .mo catalog of *messages*."""
+    catalog = {
+        '': 'Content-Type: text/plain; charset=UTF-8\nPlural-Forms: {}\n'.format(
+            plural_forms,
+        ),
+    }
+    for msgid, msgstr in messages.items():
+        if isinstance(msgid, tuple):
+            catalog['\0'.join(msgid)] = '\0'.join(msgstr)
+        else:
+            catalog[msgid] = msgstr
+    msgids = sorted(catalog)
+    ids = b''
+    strs = b''
+    id_offsets = []
+    str_offsets = []
+    for msgid in msgids:
+        id_offsets.append((len(msgid.encode()), len(ids)))
+        ids += msgid.encode() + b'\0'
+        str_offsets.append((len(catalog[msgid].encode()), len(strs)))
+        strs += catalog[msgid].encode() + b'\0'
+    ids_start = 7 * 4 + 16 * len(msgids)
+    strs_start = ids_start + len(ids)
+    table = b''
+    for length, offset in id_offsets:
+        table += struct.pack('<2I', length, ids_start + offset)
+    for length, offset in str_offsets:
+        table += struct.pack('<2I', length, strs_start + offset)
+    header = struct.pack(
+        '<7I', 0x950412de, 0, len(msgids), 7 * 4, 7 * 4 + 8 * len(msgids), 0, 0,
+    )
+    path.parent.mkdir(parents=True)
+    path.write_bytes(header + table + ids + strs)
+
+
+class TestLocales(object):
+    @pytest.fixture(autouse=True)
+    def localedir(self, tmp_path):
+        write_mo(
+            tmp_path / 'ru' / 'LC_MESSAGES' / 'pedantic_timedelta.mo',
+            RU_MESSAGES,
+            RU_PLURAL_FORMS,
+        )
+        locales.clear_cache()
+        yield str(tmp_path)
+        locales.clear_cache()
+
+    @pytest.mark.parametrize(('seconds', 'exp_fmmtd'), [
+        (60, '1.00 минута'),
+        (90, '1.50 минуты'),
+        (120, '2.00 минуты'),
+        (60 * 4.5, '4.50 минут'),
+        (60 * 21, '21.00 минута'),
+        (60 * 25, '25.00 минут'),
+        (30, '30.00 seconds'),
+        (7200, '2.00 hours'),
+    ])
+    def test_format_seconds(self, localedir, seconds, exp_fmmtd):
+        """Ensure names and plural categories come from the catalog."""
+        assert locales.format_seconds(
+            seconds, 'ru', abbreviate=0, localedir=localedir,
+        )[0] == exp_fmmtd
+
+    def test_abbreviated_and_unit(self, localedir):
+        """Ensure abbreviated names, and the unit name, are translated."""
+        locale_format = locales.get_locale_format('ru', localedir)
+        assert locale_format.format_seconds(30) == ('30.00 сек.', 1.0, 'sec')
+        assert locale_format.format_seconds(150, abbreviate=5) == (
+            '2.50 mins.', 60.0, 'мин',
+        )
+
+    def test_decimal_point(self, localedir):
+        """Ensure the decimal separator may be localized."""
+        locale_format = locales.get_locale_format('ru', localedir, decimal_point=',')
+        assert locale_format.format_seconds(90, abbreviate=0)[0] == '1,50 минуты'
+
+    def test_untranslated_locale(self, localedir):
+        """Ensure locales without a catalog format in English."""
+        for seconds in (0.5, 1, 90, 86400 * 40):
+            assert locales.format_seconds(seconds, 'xx', localedir=localedir) == (
+                PedanticTimedelta.format_seconds(seconds)
+            )
+
+    def test_cache(self, localedir, monkeypatch):
+        """Ensure locales are compiled once, and the cache is bounded."""
+        monkeypatch.setattr(locales, 'CACHE_SIZE', 2)
+        ru = locales.get_locale_format('ru', localedir)
+        assert locales.get_locale_format('ru', localedir) is ru
+        de = locales.get_locale_format('de', localedir)
+        assert locales.get_locale_format('ru', localedir) is ru
+        locales.get_locale_format('fr', localedir)
+        # The least recently used locale was discarded.
+        assert locales.get_locale_format('de', localedir) is not de
+        assert len(locales._CACHE) == 2
+
+    def test_cache_follows_unit_ladder(self, localedir):
+        """Ensure a locale is recompiled when the unit ladder changes."""
+        ru = locales.get_locale_format('ru', localedir)
+        try:
+            PedanticTimedelta.set_unit_ladder(('second', 'minute'))
+            ru_minutes = locales.get_locale_format('ru', localedir)
+            assert ru_minutes is not ru
+            assert ru_minutes.format_seconds(7200, abbreviate=0)[0] == (
+                '120.00 минут'
+            )
+        finally:
+            PedanticTimedelta.set_unit_ladder()
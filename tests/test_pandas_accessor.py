@@ -0,0 +1,89 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.pandas_accessor``."""
+
+import datetime
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+pytest.importorskip('pedantic_timedelta.pandas_accessor')
+
+SECONDS = [-5, 0, 0.25, 1.5, 90, 3600, 86400 * 1.5, 86400 * 40, 31556925.1296 * 3]
+
+
+class TestPedanticAccessor(object):
+    @pytest.mark.parametrize('abbreviate', [None, 0, 5])
+    def test_format(self, abbreviate):
+        """Ensure output matches time_format_scaled, per element."""
+        series = pd.Series(
+            pd.to_timedelta(SECONDS, unit='s'), index=list('abcdefghi'), name='took',
+        )
+        formatted = series.pedantic.format(precision=3, abbreviate=abbreviate)
+        assert formatted.index.equals(series.index)
+        assert formatted.name == 'took'
+        assert formatted.tolist() == [
+            PedanticTimedelta(seconds=seconds).time_format_scaled(
+                precision=3, abbreviate=abbreviate,
+            )[0]
+            for seconds in SECONDS
+        ]
+        assert series.pedantic.unit(abbreviate=0).tolist()[-3:] == [
+            'day', 'month', 'year',
+        ]
+
+    @pytest.mark.parametrize('unit', ['s', 'ms', 'us', 'ns'])
+    def test_timedelta64_units(self, unit):
+        """Ensure non-nanosecond resolutions are scaled."""
+        values = np.array([90, 36 * 3600], dtype='timedelta64[s]').astype(
+            'timedelta64[{}]'.format(unit),
+        )
+        series = pd.Series(values)
+        assert series.pedantic.format().tolist() == ['1.50 mins.', '1.50 days']
+
+    def test_beyond_int64_nanoseconds(self):
+        """Ensure coarse units are not scaled up to (overflowing) nanoseconds."""
+        seconds = 10 ** 10
+        assert seconds * 10 ** 9 > 2 ** 63
+        series = pd.Series(np.array([seconds, 90], dtype='timedelta64[s]'))
+        if series.dtype != np.dtype('timedelta64[s]'):
+            pytest.skip('pandas only supports timedelta64[ns]')
+        assert series.pedantic.format().tolist() == ['316.89 years', '1.50 mins.']
+        with pytest.raises(OverflowError):
+            series.pedantic.nanoseconds()
+
+    def test_missing(self):
+        """Ensure NaT is formatted as na_rep."""
+        series = pd.Series([datetime.timedelta(seconds=90), pd.NaT])
+        assert series.pedantic.format().tolist() == ['1.50 mins.', None]
+        assert series.pedantic.format(na_rep='-').tolist() == ['1.50 mins.', '-']
+
+    def test_not_timedelta(self):
+        """Ensure the accessor is only available for timedelta columns."""
+        with pytest.raises(AttributeError):
+            pd.Series([1.5]).pedantic
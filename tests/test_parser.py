@@ -0,0 +1,142 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.parser``."""
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.parser import parse, parse_many, parse_seconds
+
+
+class TestParser(object):
+    @pytest.fixture(autouse=True)
+    def restore_unit_ladder(self, monkeypatch):
+        unit_names = PedanticTimedelta.UNIT_NAMES
+        monkeypatch.setattr(PedanticTimedelta, 'UNIT_NAMES', unit_names)
+        yield
+        PedanticTimedelta.set_unit_ladder()
+
+    @pytest.mark.parametrize(('text', 'exp_seconds'), [
+        ('2.50 mins.', 150.0),
+        ('1.31 months', 1.31 * 2629743.7608),
+        ('3.33 S', 3.33),
+        ('1 M', 60.0),
+        ('1 m', 2629743.7608),
+        ('1.00 m.', 60.0),
+        ('0.50 ms.', 0.0005),
+        ('2 centuries', 200 * 31556925.1296),
+        ('-1.5 hrs.', -5400.0),
+        ('  12 HOURS\n', 43200.0),
+        ('1e3 ms', 1.0),
+        ('5secs', 5.0),
+        ('3 days 4 hours 12 mins.', 3 * 86400 + 4 * 3600 + 12 * 60),
+        ('-1 day 2 hours', -93600.0),
+        ('1 day, 2 hrs., 3 s.', 93603.0),
+    ])
+    def test_parse_seconds(self, text, exp_seconds):
+        """Ensure names, plurals, and periods are recognized."""
+        assert parse_seconds(text) == pytest.approx(exp_seconds)
+        assert parse(text) == PedanticTimedelta(seconds=exp_seconds)
+        assert type(parse(text)) is PedanticTimedelta
+
+    @pytest.mark.parametrize('abbreviate', range(
+        PedanticTimedelta.UNIT_NAME_INDEX_0, PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+    ))
+    @pytest.mark.parametrize('lkup_unit', sorted(PedanticTimedelta.UNIT_SECONDS))
+    @pytest.mark.parametrize('count', [1, 2])
+    def test_parse_formatted(self, abbreviate, lkup_unit, count):
+        """Ensure every name the formatter outputs is parsed."""
+        s_scale = PedanticTimedelta.UNIT_SECONDS[lkup_unit]
+        PedanticTimedelta.set_unit_ladder((lkup_unit, ))
+        text = PedanticTimedelta.format_seconds(
+            count * s_scale, precision=6, abbreviate=abbreviate,
+        )[0]
+        assert parse_seconds(text) == pytest.approx(count * s_scale)
+
+    def test_parse_composite_round_trip(self):
+        """Ensure composite output is parsed back exactly."""
+        ptd = PedanticTimedelta(days=3, hours=4, minutes=12, seconds=7)
+        assert parse(ptd.time_format_composite(max_units=4)) == ptd
+
+    def test_parse_custom_unit(self):
+        """Ensure units registered with set_unit_ladder are recognized."""
+        assert parse_seconds('1 sec.') == 1.0
+        PedanticTimedelta.set_unit_ladder(
+            ('second', ('shift', 8 * 3600.0)),
+            unit_names={
+                'shift': ('shift', 'ŝ', 'sh', 'shf', 'shfs', 'shf', 'shift'),
+            },
+        )
+        assert parse_seconds('1.50 shifts') == 43200.0
+
+    @pytest.mark.parametrize('text', [
+        '',
+        'soon',
+        '5',
+        '5 jiffies',
+        'mins. 5',
+        '2 mins. later',
+        '1..5 mins',
+    ])
+    def test_parse_invalid(self, text):
+        """Ensure non-durations are rejected."""
+        with pytest.raises(ValueError):
+            parse(text)
+
+    @pytest.mark.parametrize('text', [
+        'nan secs.',
+        'inf secs.',
+        '-inf days',
+        '1e400 secs.',
+        '1e305 years',
+        '1 day 1e400 secs.',
+    ])
+    def test_parse_seconds_not_finite(self, text):
+        """Ensure non-finite durations are rejected."""
+        with pytest.raises(ValueError, match='^pedantic_timedelta: Not a finite'):
+            parse_seconds(text)
+
+    def test_parse_out_of_range(self):
+        """Ensure durations too long for a timedelta raise ValueError."""
+        assert parse_seconds('1e12 days') == 8.64e16
+        with pytest.raises(ValueError, match='^pedantic_timedelta: '):
+            parse('1e12 days')
+        _durations, errors = parse_many(['1e12 days', 'nan secs.'])
+        assert [error.startswith('pedantic_timedelta: ') for _, _, error in errors] == [
+            True, True,
+        ]
+
+    def test_parse_many(self):
+        """Ensure errors are reported per item, and parsing continues."""
+        durations, errors = parse_many(iter(['1.50 hours', 'soon', '2 secs.', '1 day']))
+        assert durations == [
+            PedanticTimedelta(minutes=90), None, PedanticTimedelta(seconds=2),
+            PedanticTimedelta(days=1),
+        ]
+        assert [(index, text) for index, text, _error in errors] == [(1, 'soon')]
+        assert parse_many(['5 min', '1e999 years'])[0] == [
+            PedanticTimedelta(minutes=5), None,
+        ]
+        assert parse_many(['5 min', '5 mins'], as_seconds=True) == ([300.0, 300.0], [])
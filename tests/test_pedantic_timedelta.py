@@ -24,13 +24,28 @@
 
 """Tests for ``human-friendly_pedantic-timedelta``."""
 
+import array
+import copy
 import datetime
+import io
+import pickle
+import subprocess
+import sys
+import time
+import types
+from decimal import Decimal
+from fractions import Fraction
 
 import pytest
 from freezegun import freeze_time
 from pedantic_timedelta import PedanticTimedelta
 
 
+class SubTimedelta(PedanticTimedelta):
+    # Module-level, so that it pickles.
+    __slots__ = ()
+
+
 @freeze_time('2015-12-10 12:30')
 class TestPedanticTimedeltaTimeFormatElapsed(object):
     @pytest.mark.parametrize(('secs_then', 'secs_now', 'expectation'), [
@@ -60,6 +75,22 @@ class TestPedanticTimedeltaTimeFormatElapsed(object):
         formatted = PedanticTimedelta.time_format_elapsed(secs_then, secs_now)
         assert formatted == expectation
 
+    @pytest.mark.parametrize(('secs_elapsed', 'expectation'), [
+        (59.9999996, '1.00 min.'),
+        (3599.9999997, '1.00 hour'),
+        (-3e-07, '0.00 sec.'),
+        (86400 * 1.5, '1.50 days'),
+    ])
+    def test_time_format_elapsed_rounds_to_microseconds(
+        self, secs_elapsed, expectation,
+    ):
+        """Ensure the elapsed time is rounded like a timedelta, then formatted."""
+        formatted = PedanticTimedelta.time_format_elapsed(0, secs_elapsed)
+        assert formatted == expectation
+        assert formatted == PedanticTimedelta(
+            seconds=secs_elapsed,
+        ).time_format_scaled()[0]
+
 
 @freeze_time('2015-12-10 12:30')
 class TestPedanticTimedeltaTimeFormatScaledSeconds(object):
@@ -152,3 +183,585 @@ class TestPedanticTimedeltaTimeFormatScaledOptions(object):
         assert tm_scale == exp_scale
         assert tm_units == exp_units
 
+
+class TestPedanticTimedeltaPluralForms(object):
+    @pytest.mark.parametrize('adj_time', [0, 0.5, 1, 1.001, 2, 1000])
+    @pytest.mark.parametrize('abbreviate', range(
+        PedanticTimedelta.UNIT_NAME_INDEX_0, PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+    ))
+    @pytest.mark.parametrize('lkup_unit', sorted(PedanticTimedelta.UNIT_NAMES))
+    def test_plural_forms_match_inflector(self, lkup_unit, abbreviate, adj_time):
+        """Ensure memoized plural forms match live Inflector pluralization."""
+        ptd = PedanticTimedelta()
+        tm_unit = PedanticTimedelta.UNIT_NAMES[lkup_unit][abbreviate]
+        memoized = ptd._pluralize_periodify(adj_time, tm_unit, lkup_unit, abbreviate)
+        inflected = ptd._pluralize_periodify_inflector(
+            adj_time, tm_unit, lkup_unit, abbreviate,
+        )
+        assert memoized == inflected
+
+    def test_plural_forms_custom_unit_names(self, monkeypatch):
+        """Ensure swapped-in UNIT_NAMES fall back on Inflector."""
+        unit_names = dict(PedanticTimedelta.UNIT_NAMES)
+        unit_names['hour'] = ('hour', 'h', 'hr', 'hor', 'hrs.', 'hr', 'hr')
+        monkeypatch.setattr(PedanticTimedelta, 'UNIT_NAMES', unit_names)
+        tm_fmttd, _, _ = PedanticTimedelta(hours=3).time_format_scaled()
+        assert tm_fmttd == '3.00 hrs.'
+
+    def test_plural_forms_switch(self, mocker):
+        """Ensure PLURALIZE_WITH_INFLECTOR bypasses the memoized table."""
+        mocker.patch.object(PedanticTimedelta, 'PLURALIZE_WITH_INFLECTOR', True)
+        spy = mocker.spy(PedanticTimedelta, '_pluralize_periodify_inflector')
+        tm_fmttd, _, _ = PedanticTimedelta(days=2).time_format_scaled()
+        assert tm_fmttd == '2.00 days'
+        assert spy.call_count == 1
+
+
+class TestPedanticTimedeltaFormatMany(object):
+    SECONDS = [
+        -5, 0, 0.25, 1, 1.5, 59.999, 60, 90, 3599, 3600, 86400 / 2, 86400,
+        86400 * 40, 31556925.1296, 31556925.1296 * 3,
+    ]
+
+    def expectations(self, field_width=0, precision=2, abbreviate=None):
+        return [
+            PedanticTimedelta(seconds=seconds).time_format_scaled(
+                field_width=field_width, precision=precision, abbreviate=abbreviate,
+            )
+            for seconds in self.SECONDS
+        ]
+
+    @pytest.mark.parametrize('abbreviate', [None, -1] + list(range(
+        PedanticTimedelta.UNIT_NAME_INDEX_0, PedanticTimedelta.UNIT_NAME_INDEX_N + 1,
+    )))
+    def test_format_many_numpy(self, abbreviate):
+        """Ensure vectorized output matches time_format_scaled."""
+        np = pytest.importorskip('numpy')
+        times_fmtd, scales, tm_units = PedanticTimedelta.format_many(
+            np.array(self.SECONDS), field_width=8, precision=3, abbreviate=abbreviate,
+        )
+        expected = self.expectations(8, 3, abbreviate)
+        assert times_fmtd.tolist() == [exp[0] for exp in expected]
+        assert scales.tolist() == [exp[1] for exp in expected]
+        assert tm_units.tolist() == [exp[2] for exp in expected]
+
+    def test_format_many_buffer(self):
+        """Ensure buffer-protocol objects are accepted."""
+        np = pytest.importorskip('numpy')
+        times_fmtd, _, _ = PedanticTimedelta.format_many(
+            array.array('d', self.SECONDS),
+        )
+        assert isinstance(times_fmtd, np.ndarray)
+        assert times_fmtd.tolist() == [exp[0] for exp in self.expectations()]
+
+    @pytest.mark.parametrize('abbreviate', [None, 0, 5])
+    def test_format_many_ns(self, abbreviate):
+        """Ensure integer nanoseconds are formatted like seconds."""
+        np = pytest.importorskip('numpy')
+        ns = [round(seconds * 10 ** 9) for seconds in self.SECONDS]
+        times_fmtd, scales, tm_units = PedanticTimedelta.format_many_ns(
+            np.array(ns, dtype=np.int64), precision=3, abbreviate=abbreviate,
+        )
+        expected = [
+            PedanticTimedelta.format_nanoseconds(ns_, precision=3, abbreviate=abbreviate)
+            for ns_ in ns
+        ]
+        assert times_fmtd.tolist() == [exp[0] for exp in expected]
+        assert scales.tolist() == [exp[1] for exp in expected]
+        assert tm_units.tolist() == [exp[2] for exp in expected]
+
+    def test_format_many_ns_huge_units(self):
+        """Ensure units larger than the int64 range are handled."""
+        pytest.importorskip('numpy')
+        PedanticTimedelta.set_unit_ladder(('second', 'year', 'millennium'))
+        try:
+            times_fmtd, scales, _ = PedanticTimedelta.format_many_ns(
+                [10 ** 9, 2 ** 63 - 1],
+            )
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+        assert times_fmtd.tolist() == ['1.00 sec.', '292.28 years']
+        assert scales.tolist() == [10 ** 9, 31556925129600000]
+
+    def test_format_many_without_numpy(self):
+        """Ensure pure-Python fallback output matches time_format_scaled."""
+        times_fmtd, scales, tm_units = PedanticTimedelta._format_many_iter(
+            self.SECONDS, 0, 2, None,
+        )
+        expected = self.expectations()
+        assert times_fmtd == [exp[0] for exp in expected]
+        assert scales == [exp[1] for exp in expected]
+        assert tm_units == [exp[2] for exp in expected]
+
+
+class TestPedanticTimedeltaFormatSeconds(object):
+    @pytest.mark.parametrize('abbreviate', [None, 0, 1, 4, 5])
+    @pytest.mark.parametrize('seconds', [
+        -5, 0, 0.5, 1, 10 / 3, 60, 150, 86400 / 2, 86400 * 40, 31556925.1296 * 2,
+        # Rounded to microseconds, as a timedelta is.
+        1.0000001, 59.9999996, -3e-07,
+    ])
+    def test_format_seconds(self, seconds, abbreviate):
+        """Ensure fast path output matches time_format_scaled."""
+        formatted = PedanticTimedelta.format_seconds(
+            seconds, field_width=7, precision=1, abbreviate=abbreviate,
+        )
+        expected = PedanticTimedelta(seconds=seconds).time_format_scaled(
+            field_width=7, precision=1, abbreviate=abbreviate,
+        )
+        assert formatted == expected
+
+    def test_format_seconds_no_timedelta(self, mocker):
+        """Ensure time_format_elapsed does not construct a timedelta."""
+        spy = mocker.spy(PedanticTimedelta, '__new__')
+        formatted = PedanticTimedelta.time_format_elapsed(100.0, 250.0)
+        assert formatted == '2.50 mins.'
+        assert spy.call_count == 0
+
+
+class TestPedanticTimedeltaNanoseconds(object):
+    @pytest.mark.parametrize('abbreviate', [None, 0, 1, 5])
+    @pytest.mark.parametrize('seconds', [
+        -5, 0, 0.5, 1, 60, 150, 86400 // 2, 86400 * 40, 86400 * 365 * 3,
+    ])
+    def test_format_nanoseconds(self, seconds, abbreviate):
+        """Ensure integer nanoseconds are formatted like seconds."""
+        formatted = PedanticTimedelta.format_nanoseconds(
+            int(seconds * 10 ** 9), field_width=7, precision=3, abbreviate=abbreviate,
+        )
+        expected = PedanticTimedelta.format_seconds(
+            seconds, field_width=7, precision=3, abbreviate=abbreviate,
+        )
+        assert formatted[0] == expected[0]
+        assert formatted[1] == round(expected[1] * 10 ** 9)
+        assert formatted[2] == expected[2]
+
+    def test_large_timestamps_keep_precision(self):
+        """Ensure nanoseconds are exact even for epoch timestamps."""
+        ns_then = 1600000000 * 10 ** 9 + 1
+        assert float(ns_then + 1500) - float(ns_then) != 1500
+        PedanticTimedelta.set_unit_ladder(('microsecond', 'second'))
+        try:
+            assert PedanticTimedelta.time_format_elapsed_ns(
+                ns_then, ns_then + 1500, precision=3,
+            ) == '1.500 µs.'
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+
+    def test_time_format_elapsed_clocks(self):
+        """Ensure now is read from the chosen clock."""
+        assert PedanticTimedelta.time_format_elapsed_ns(
+            10 ** 9, clock=lambda: 10 ** 9 + 90 * 10 ** 9,
+        ) == '1.50 mins.'
+        assert PedanticTimedelta.time_format_elapsed(
+            100.0, clock=lambda: 250.0,
+        ) == '2.50 mins.'
+        ns_then = time.perf_counter_ns()
+        assert PedanticTimedelta.time_format_elapsed_ns(ns_then).endswith('sec.')
+
+
+class TestPedanticTimedeltaInstanceCache(object):
+    def test_no_instance_dict(self):
+        """Ensure instances use slots and not a per-instance __dict__."""
+        assert not hasattr(PedanticTimedelta(hours=1), '__dict__')
+
+    def test_immutable(self):
+        """Ensure instances cannot be modified, like timedelta."""
+        ptd = PedanticTimedelta(hours=1)
+        ptd.time_format_scaled()
+        with pytest.raises(AttributeError):
+            ptd.days = 3
+        with pytest.raises(AttributeError):
+            ptd._total_seconds = 3
+        with pytest.raises(AttributeError):
+            del ptd._unit_and_scale
+        assert ptd.total_seconds() == 3600
+
+    def test_hashable(self):
+        """Ensure instances hash and compare like timedelta."""
+        ptd = PedanticTimedelta(hours=1)
+        ptd.time_format_scaled()
+        assert hash(ptd) == hash(datetime.timedelta(hours=1))
+        assert {ptd: True}[datetime.timedelta(seconds=3600)]
+
+    def test_unit_decision_cached(self, mocker):
+        """Ensure repeat formatting reuses the seconds value and unit choice."""
+        ptd = PedanticTimedelta(days=0.33)
+        spy = mocker.spy(PedanticTimedelta, '_choose_unit')
+        formatted = [
+            ptd.time_format_scaled(field_width=field_width, abbreviate=abbreviate)[0]
+            for field_width, abbreviate in ((0, None), (6, 1), (8, 4))
+        ]
+        assert formatted == ['7.92 hours', '  7.92 H', '    7.92 hrs.']
+        assert spy.call_count == 1
+        assert ptd._total_seconds == 28512.0
+        assert ptd._determine_unit_and_scale() == ('hour', 3600.0)
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_and_copy(self, protocol):
+        """Ensure cached instances still pickle and copy."""
+        ptd = PedanticTimedelta(days=40)
+        ptd.time_format_scaled()
+        for other in (pickle.loads(pickle.dumps(ptd, protocol)), copy.deepcopy(ptd)):
+            assert isinstance(other, PedanticTimedelta)
+            assert other == ptd
+            assert other.time_format_scaled() == ptd.time_format_scaled()
+
+    def test_copy_is_self(self):
+        """Ensure immutable instances are not needlessly copied."""
+        ptd = PedanticTimedelta(days=40)
+        assert copy.copy(ptd) is ptd
+        assert copy.deepcopy(ptd) is ptd
+        assert copy.deepcopy([ptd, ptd])[1] is ptd
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_skips_new(self, protocol, mocker):
+        """Ensure unpickling does not run __new__'s argument handling."""
+        ptds = [PedanticTimedelta(days=-1, microseconds=1), SubTimedelta(hours=1)]
+        pickled = pickle.dumps(ptds, protocol)
+        # (__new__ would call _exact_microseconds, whatever its arguments.)
+        mocker.patch.object(PedanticTimedelta, 'EXACT_UNIT_CONVERSION', True)
+        spy = mocker.spy(PedanticTimedelta, '_exact_microseconds')
+        others = pickle.loads(pickled)
+        assert others == ptds
+        assert [type(other) for other in others] == [PedanticTimedelta, SubTimedelta]
+        assert spy.call_count == 0
+
+
+class TestPedanticTimedeltaUnitLadder(object):
+    @pytest.fixture(autouse=True)
+    def restore_unit_ladder(self, monkeypatch):
+        unit_names = PedanticTimedelta.UNIT_NAMES
+        monkeypatch.setattr(PedanticTimedelta, 'UNIT_NAMES', unit_names)
+        yield
+        PedanticTimedelta.set_unit_ladder()
+
+    def test_default_unit_ladder(self):
+        """Ensure the default ladder matches the stock units."""
+        assert PedanticTimedelta.get_unit_ladder() == (
+            ('second', 1.0),
+            ('minute', 60.0),
+            ('hour', 3600.0),
+            ('day', 86400),
+            ('month', 2629743.7608),
+            ('year', 31556925.1296),
+        )
+
+    @pytest.mark.parametrize(('seconds', 'exp_fmmtd'), [
+        (0, '0.00 ms.'),
+        (0.0005, '0.50 ms.'),
+        (0.25, '250.00 ms.'),
+        (1.5, '1.50 secs.'),
+        (86400 * 6, '6.00 days'),
+        (86400 * 7, '1.00 week'),
+        (86400 * 40, '5.71 weeks'),
+        (31556925.1296 * 2, '2.00 years'),
+        (31556925.1296 * 20, '2.00 decades'),
+    ])
+    def test_custom_unit_ladder(self, seconds, exp_fmmtd):
+        """Ensure units may be added to and removed from the ladder."""
+        PedanticTimedelta.set_unit_ladder((
+            'decade', 'year', 'week', 'day', 'hour', 'minute', 'second', 'millisecond',
+        ))
+        assert PedanticTimedelta(seconds=seconds).time_format_scaled()[0] == exp_fmmtd
+        assert PedanticTimedelta.format_seconds(seconds)[0] == exp_fmmtd
+        assert PedanticTimedelta._format_many_iter([seconds], 0, 2, None)[0] == [
+            exp_fmmtd,
+        ]
+
+    def test_custom_unit_names(self):
+        """Ensure custom units may be registered with their names."""
+        PedanticTimedelta.set_unit_ladder(
+            ('second', ('shift', 8 * 3600.0)),
+            unit_names={
+                'shift': ('shift', 'ŝ', 'sh', 'shf', 'shfs', 'shf', 'shift'),
+            },
+        )
+        assert PedanticTimedelta(hours=12).time_format_scaled() == (
+            '1.50 shifts', 28800.0, 'shift',
+        )
+
+    def test_ladder_change_invalidates_instance_cache(self):
+        """Ensure instances choose a new unit after the ladder changes."""
+        ptd = PedanticTimedelta(days=14)
+        assert ptd.time_format_scaled()[0] == '14.00 days'
+        PedanticTimedelta.set_unit_ladder(('second', 'day', 'fortnight'))
+        assert ptd.time_format_scaled()[0] == '1.00 fortnight'
+
+    def test_subclass_unit_ladder(self):
+        """Ensure a subclass sets the (shared) ladder that formatting uses."""
+        assert SubTimedelta(days=45).time_format_scaled()[0] == '1.48 months'
+        SubTimedelta.set_unit_ladder(('second', 'minute', 'hour', 'day', 'week'))
+        assert SubTimedelta(days=45).time_format_scaled()[0] == '6.43 weeks'
+        assert SubTimedelta.get_unit_ladder()[-1] == ('week', 604800)
+        assert PedanticTimedelta.get_unit_ladder() == SubTimedelta.get_unit_ladder()
+        assert '_UNIT_LADDER' not in vars(SubTimedelta)
+
+    def test_subclass_refresh_plural_forms(self):
+        """Ensure a subclass refreshes the (shared) pluralization table."""
+        plural_forms = SubTimedelta.refresh_plural_forms()
+        assert PedanticTimedelta._PLURAL_FORMS[1] is plural_forms
+        assert '_PLURAL_FORMS' not in vars(SubTimedelta)
+
+    @pytest.mark.parametrize('units', [
+        (),
+        ('second', 'jiffy'),
+        (('second', 1.0), ('sec', 1.0)),
+        (('second', 0), ),
+        (('lustrum', 157784625.648), ),
+    ])
+    def test_invalid_unit_ladder(self, units):
+        """Ensure bad ladders are rejected."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta.set_unit_ladder(units)
+
+
+class TestPedanticTimedeltaConstructor(object):
+    @pytest.mark.parametrize(('kwargs', 'exp_days'), [
+        ({'fortnights': 2}, 28),
+        ({'months': 12}, 365.242189),
+        ({'seasons': 4}, 365.242189),
+        ({'years': 1}, 365.242189),
+        ({'bienniums': 1}, 365.242189 * 2),
+        ({'decades': 1}, 365.242189 * 10),
+        ({'jubilees': 1}, 365.242189 * 50),
+        ({'centuries': 1}, 365.242189 * 100),
+        ({'millenniums': 1}, 365.242189 * 1000),
+        ({'ages': 1}, 365.242189 * 1000000),
+        ({'megaannums': 1}, 365.242189 * 1000000),
+        ({'days': 1, 'weeks': 1, 'fortnights': 1}, 22),
+        ({'years': 1, 'months': -12}, 0),
+        ({'hours': 36, 'minutes': 30, 'seconds': 15, 'milliseconds': 5},
+         131415.005 / 86400),
+    ])
+    def test_extended_units(self, kwargs, exp_days):
+        """Ensure each unit is converted to days."""
+        ptd = PedanticTimedelta(**kwargs)
+        assert type(ptd) is PedanticTimedelta
+        assert ptd.total_seconds() == pytest.approx(exp_days * 86400, abs=1e-6)
+
+    @pytest.mark.parametrize('kwargs', [
+        {'megaannums': 3},
+        {'epochs': 1},
+        {'eras': 1},
+        {'eons': 1},
+        {'gigaannums': 1},
+    ])
+    def test_extended_units_overflow(self, kwargs):
+        """Ensure too many days is reported for extended units."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta(**kwargs)
+
+    def test_positional_arguments(self):
+        """Ensure timedelta's positional arguments are honored."""
+        assert PedanticTimedelta(1, 2, 3, 4, 5, 6, 7) == datetime.timedelta(
+            1, 2, 3, 4, 5, 6, 7,
+        )
+
+
+class TestPedanticTimedeltaExactUnitConversion(object):
+    @pytest.fixture(autouse=True)
+    def exact(self, monkeypatch):
+        monkeypatch.setattr(PedanticTimedelta, 'EXACT_UNIT_CONVERSION', True)
+
+    @pytest.mark.parametrize(('kwargs', 'exp_microseconds'), [
+        ({'years': 1}, 31556925129600),
+        ({'months': 1}, 2629743760800),
+        ({'seasons': 1}, 7889231282400),
+        ({'months': 12, 'years': -1}, 0),
+        ({'megaannums': 2, 'seconds': -1}, 2 * 31556925129600 * 10 ** 6 - 10 ** 6),
+        ({'days': 1, 'weeks': 1, 'fortnights': 1, 'microseconds': 7},
+         22 * 86400000000 + 7),
+        ({'hours': 1.5, 'milliseconds': 0.0015}, 5400000002),
+        ({'microseconds': 0.5}, 0),
+        ({'microseconds': 1.5}, 2),
+        ({'microseconds': -2.5}, -2),
+        ({'months': Fraction(1, 3)}, 876581253600),
+        ({'years': Decimal('0.1'), 'seconds': 0.25}, 3155692512960 + 250000),
+    ])
+    def test_exact_microseconds(self, kwargs, exp_microseconds):
+        """Ensure units are converted exactly and rounded half to even, once."""
+        ptd = PedanticTimedelta(**kwargs)
+        assert type(ptd) is PedanticTimedelta
+        assert ptd == datetime.timedelta(microseconds=exp_microseconds)
+
+    def test_sums_do_not_drift(self):
+        """Ensure many months sum to exactly as many years."""
+        month = PedanticTimedelta(months=1)
+        assert sum([month] * 1200, datetime.timedelta()) == (
+            PedanticTimedelta(centuries=1)
+        )
+        assert PedanticTimedelta(months=0.1) * 10 == month
+
+    def test_too_many_days(self):
+        """Ensure too many days is reported, as it is otherwise."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta(megaannums=3)
+        PedanticTimedelta(days=999999999, seconds=86399, microseconds=999999)
+
+
+class TestPedanticTimedeltaIterFormat(object):
+    SECONDS = [-5, 0, 0.25, 1, 1.5, 60, 90, 86400 / 2, 86400 * 40, 31556925.1296 * 3]
+
+    def test_iter_format(self):
+        """Ensure generated strings match format_seconds."""
+        formatted = PedanticTimedelta.iter_format(
+            iter(self.SECONDS), field_width=9, precision=3, abbreviate=1,
+        )
+        assert isinstance(formatted, types.GeneratorType)
+        assert list(formatted) == [
+            PedanticTimedelta.format_seconds(
+                seconds, field_width=9, precision=3, abbreviate=1,
+            )[0]
+            for seconds in self.SECONDS
+        ]
+
+    @pytest.mark.parametrize('stream_cls, encode', [
+        (io.StringIO, lambda text: text),
+        (io.BytesIO, lambda text: text.encode()),
+    ])
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 65536])
+    def test_iter_format_stream(self, stream_cls, encode, chunk_size):
+        """Ensure numbers are read across chunk boundaries."""
+        text = '\n'.join(repr(seconds) for seconds in self.SECONDS)
+        stream = stream_cls(encode(text + '\r\n\n  12345.678\n'))
+        formatted = PedanticTimedelta.iter_format_stream(stream, chunk_size=chunk_size)
+        assert list(formatted) == list(
+            PedanticTimedelta.iter_format(self.SECONDS + [12345.678])
+        )
+
+    def test_iter_format_stream_garbage(self):
+        """Ensure non-numbers are reported."""
+        formatted = PedanticTimedelta.iter_format_stream(io.StringIO('1\nfoo\n'))
+        assert next(formatted) == '1.00 sec.'
+        with pytest.raises(ValueError):
+            next(formatted)
+
+
+class TestPedanticTimedeltaPackMany(object):
+    def test_round_trip(self):
+        """Ensure every timedelta survives packing, exactly."""
+        durations = [
+            datetime.timedelta.min,
+            datetime.timedelta(days=-1, microseconds=1),
+            datetime.timedelta(0),
+            PedanticTimedelta(days=0.33),
+            PedanticTimedelta(megaannums=2),
+            datetime.timedelta.max,
+        ]
+        packed = PedanticTimedelta.pack_many(durations)
+        assert isinstance(packed, bytes)
+        assert len(packed) == 12 + 12 * len(durations)
+        unpacked = PedanticTimedelta.unpack_many(packed)
+        assert unpacked == durations
+        assert all(type(ptd) is PedanticTimedelta for ptd in unpacked)
+        assert PedanticTimedelta.unpack_many(bytearray(packed)) == durations
+        assert PedanticTimedelta.unpack_many(memoryview(packed)) == durations
+
+    def test_iterables_and_empty(self):
+        """Ensure any iterable can be packed."""
+        assert PedanticTimedelta.unpack_many(PedanticTimedelta.pack_many(
+            PedanticTimedelta(hours=hours) for hours in range(3)
+        )) == [PedanticTimedelta(hours=hours) for hours in range(3)]
+        assert PedanticTimedelta.unpack_many(PedanticTimedelta.pack_many(())) == []
+
+    def test_portable_layout(self):
+        """Ensure the layout is little-endian, whatever the platform."""
+        packed = PedanticTimedelta.pack_many([datetime.timedelta(days=-1, seconds=1)])
+        assert packed == (
+            b'PTD\x01' + (1).to_bytes(8, 'little')
+            + (-1).to_bytes(4, 'little', signed=True)
+            + (1000000).to_bytes(8, 'little', signed=True)
+        )
+
+    @pytest.mark.parametrize('packed', [
+        b'',
+        b'PTD',
+        b'PTD\x02' + bytes(8),
+        b'PTD\x01' + (1).to_bytes(8, 'little'),
+        b'PTD\x01' + bytes(9),
+    ])
+    def test_unpack_invalid(self, packed):
+        """Ensure other bytes are rejected."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta.unpack_many(packed)
+
+
+class TestPedanticTimedeltaLazyImports(object):
+    def test_import_defers_gettext_and_inflector(self):
+        """Ensure importing the package does not load gettext nor inflector."""
+        script = (
+            'import sys; import pedantic_timedelta;'
+            ' loaded = [name for name in ("gettext", "inflector", "logging")'
+            '           if name in sys.modules];'
+            ' assert not loaded, loaded;'
+            ' pedantic_timedelta.PedanticTimedelta(hours=2).time_format_scaled();'
+            ' assert "gettext" in sys.modules and "inflector" in sys.modules'
+        )
+        subprocess.check_call([sys.executable, '-c', script])
+
+    def test_unit_names_mapping(self):
+        """Ensure the lazy UNIT_NAMES acts like a read-only dict."""
+        unit_names = PedanticTimedelta.UNIT_NAMES
+        assert 'hour' in unit_names
+        assert 'jiffy' not in unit_names
+        assert len(unit_names) == len(list(unit_names))
+        assert dict(unit_names)['minute'][PedanticTimedelta.UNIT_NAME_TREYWIDE] == 'min'
+        with pytest.raises(TypeError):
+            unit_names['hour'] = ('hour', ) * 7
+
+    def test_replaced_unit_names_rebuild_plural_forms(self, monkeypatch):
+        """Ensure the plural forms table follows a replaced UNIT_NAMES."""
+        unit_names = dict(PedanticTimedelta.UNIT_NAMES)
+        unit_names['day'] = ('sol', 'd', 'sl', 'sol', 'sols', 'sol', 'sol')
+        monkeypatch.setattr(PedanticTimedelta, 'UNIT_NAMES', unit_names)
+        assert PedanticTimedelta(days=3).time_format_scaled()[0] == '3.00 sols'
+        assert PedanticTimedelta._PLURAL_FORMS[0] is unit_names
+
+
+class TestPedanticTimedeltaComposite(object):
+    @pytest.mark.parametrize(('kwargs', 'max_units', 'exp_fmmtd'), [
+        ({'days': 3, 'hours': 4, 'minutes': 12}, 3, '3 days 4 hours 12 mins.'),
+        ({'days': 3, 'hours': 4, 'minutes': 12}, 2, '3 days 4 hours'),
+        ({'days': 3, 'hours': 4, 'minutes': 12}, 1, '3 days'),
+        ({'days': 1, 'seconds': 1}, 3, '1 day'),
+        ({'days': 1, 'seconds': 1}, 4, '1 day 1 sec.'),
+        ({'days': -1, 'hours': -2}, 3, '-1 day 2 hours'),
+        ({'seconds': 59, 'microseconds': 999999}, 3, '59 secs.'),
+        ({'microseconds': 999999}, 3, '0 sec.'),
+        ({}, 3, '0 sec.'),
+        ({'years': 1}, 6, '1 year'),
+        ({'years': 1, 'months': 1, 'seconds': 1}, 6, '1 year 1 month 1 sec.'),
+    ])
+    def test_time_format_composite(self, kwargs, max_units, exp_fmmtd):
+        """Ensure durations are broken down into several units."""
+        ptd = PedanticTimedelta(**kwargs)
+        assert ptd.time_format_composite(max_units=max_units) == exp_fmmtd
+
+    def test_format_composite_is_exact(self):
+        """Ensure integer microseconds are not subject to float drift."""
+        microseconds = 10 ** 9 * 86400 * 1000000 - 1
+        ptd_max = PedanticTimedelta(
+            days=999999999, seconds=86399, microseconds=999999,
+        )
+        assert PedanticTimedelta.format_composite(microseconds, max_units=6) == (
+            ptd_max.time_format_composite(max_units=6)
+        )
+        assert PedanticTimedelta.format_composite(
+            microseconds, max_units=6, abbreviate=0, separator=', ',
+        ) == '2737909 years, 4 months, 1 day, 19 hours, 26 minutes, 6 seconds'
+
+    def test_format_composite_custom_ladder(self):
+        """Ensure the composite units follow the unit ladder."""
+        try:
+            PedanticTimedelta.set_unit_ladder(('week', 'day', 'millisecond'))
+            assert PedanticTimedelta.format_composite(
+                (15 * 86400 + 2) * 1000000 + 5000, max_units=3,
+            ) == '2 weeks 1 day 2005 ms.'
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+
+    def test_format_composite_invalid_max_units(self):
+        """Ensure at least one unit must be allowed."""
+        with pytest.raises(ValueError):
+            PedanticTimedelta.format_composite(1, max_units=0)
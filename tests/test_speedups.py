@@ -0,0 +1,169 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for the compiled accelerator, ``pedantic_timedelta._speedups``.
+
+The rest of the test suite exercises whichever implementation is in use
+(run it with PEDANTIC_TIMEDELTA_PURE_PYTHON=1 to test the pure-Python
+functions, e.g., ``tox -e purepython``). These tests check that the two
+implementations agree, including on unusual arguments.
+"""
+
+import itertools
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+import pedantic_timedelta
+from pedantic_timedelta import PedanticTimedelta
+
+speedups = pedantic_timedelta._speedups
+requires_speedups = pytest.mark.skipif(
+    speedups is None, reason='pedantic_timedelta._speedups is not built, or is disabled',
+)
+
+
+def outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as err:
+        return type(err), str(err)
+
+
+@pytest.fixture(scope='module')
+def plural_forms():
+    PedanticTimedelta.refresh_plural_forms()
+    plural_forms = dict(PedanticTimedelta._PLURAL_FORMS[1])
+    for abbreviate in range(7):
+        plural_forms[('jiffy', abbreviate)] = ('jiffy', 'jiffy 🐇', 'jiffies 🐇🐇')
+    plural_forms[('odd', 6)] = ['odd', 'odd', 'odds']
+    return plural_forms
+
+
+class TestSpeedups(object):
+    def test_fallback(self):
+        """Ensure the pure-Python functions can be selected at import."""
+        script = (
+            'import pedantic_timedelta as ptd;'
+            ' assert ptd._speedups is None;'
+            ' assert ptd._format_scaled_core is ptd._format_scaled_py;'
+            ' assert ptd._sum_products is ptd._sum_products_py;'
+            ' print(ptd.PedanticTimedelta(years=1).time_format_scaled()[0])'
+        )
+        env = dict(os.environ, PEDANTIC_TIMEDELTA_PURE_PYTHON='1')
+        output = subprocess.check_output([sys.executable, '-c', script], env=env)
+        assert output == b'1.00 year\n'
+
+    @requires_speedups
+    def test_in_use(self):
+        """Ensure the accelerator is used, if it was built."""
+        assert pedantic_timedelta._format_scaled_core is speedups.format_scaled
+        assert pedantic_timedelta._sum_products is speedups.sum_products
+
+    @requires_speedups
+    def test_constants(self):
+        """Ensure the compiled constants match the class's."""
+        for name in (
+            'UNIT_NAME_FULL',
+            'UNIT_NAME_ABBREV',
+            'UNIT_NAME_INDEX_0',
+            'UNIT_NAME_INDEX_N',
+        ):
+            assert getattr(speedups, name) == getattr(PedanticTimedelta, name)
+
+    @requires_speedups
+    @pytest.mark.parametrize('secs', [
+        0, -0.0, 0.5, 1, 1.0, 1.5, -90, 59.999, 150, 1e300, 10 ** 400,
+        float('inf'), float('-inf'), float('nan'), Fraction(3, 2), Decimal('1.5'),
+        True, 'x',
+    ])
+    @pytest.mark.parametrize('s_scale', [1.0, 60, 0.001, 0])
+    def test_format_scaled_values(self, plural_forms, secs, s_scale):
+        """Ensure the compiled and pure-Python formatting agree on values."""
+        for args in itertools.product(['second', 'jiffy'], [0, 7], [None, 1]):
+            lkup_unit, field_width, abbreviate = args
+            args = (
+                secs, lkup_unit, s_scale, field_width, 3, abbreviate, plural_forms,
+            )
+            assert outcome(speedups.format_scaled, *args) == outcome(
+                pedantic_timedelta._format_scaled_py, *args,
+            )
+
+    @requires_speedups
+    @pytest.mark.parametrize('field_width', [
+        0, 1, 12, -3, 2000, True, 2.5, '5', None,
+    ])
+    @pytest.mark.parametrize('precision', [0, 2, 17, 200, -1, 2.0, None])
+    def test_format_scaled_options(self, plural_forms, field_width, precision):
+        """Ensure the compiled and pure-Python formatting agree on options."""
+        for secs, lkup_unit in ((1.5, 'minute'), (1, 'microsecond'), (2, 'jiffy')):
+            args = (
+                secs, lkup_unit, 1, field_width, precision, None, plural_forms,
+            )
+            assert outcome(speedups.format_scaled, *args) == outcome(
+                pedantic_timedelta._format_scaled_py, *args,
+            )
+
+    @requires_speedups
+    @pytest.mark.parametrize('abbreviate', [
+        None, -1, 0, 1, 4, 5, 6, 7, True, 2.0, 6.5, 10 ** 30, -10 ** 30, 'x',
+    ])
+    @pytest.mark.parametrize('lkup_unit', ['microsecond', 'hour', 'odd', 'nope'])
+    def test_format_scaled_abbreviate(self, plural_forms, abbreviate, lkup_unit):
+        """Ensure the compiled and pure-Python formatting agree on units."""
+        for secs in (0.5, 2):
+            args = (secs, lkup_unit, 1.0, 0, 2, abbreviate, plural_forms)
+            assert outcome(speedups.format_scaled, *args) == outcome(
+                pedantic_timedelta._format_scaled_py, *args,
+            )
+
+    @requires_speedups
+    @pytest.mark.parametrize('counts', [
+        (),
+        (0, 0, 0),
+        (1, 2, 3),
+        (1, 0.5, -2),
+        (Fraction(1, 3), 0, 1),
+        (Decimal('1.5'), 0, 0),
+        (Decimal('1.5'), 1.5, 0),
+        (1, 2),
+        (1, 2, 3, 4),
+        (None, 0, ''),
+        ('a', 0, 0),
+    ])
+    @pytest.mark.parametrize('factors', [
+        (14, 30.436849083333332, 365.242189),
+        [1, 2, 3],
+        (Fraction(1, 2), 2, 3),
+    ])
+    def test_sum_products(self, factors, counts):
+        """Ensure the compiled and pure-Python summations agree."""
+        expected = outcome(pedantic_timedelta._sum_products_py, factors, counts)
+        actual = outcome(speedups.sum_products, factors, counts)
+        assert actual == expected
+        assert type(actual) is type(expected)
@@ -0,0 +1,171 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Multithreaded stress tests (meaningful mostly on free-threaded builds)."""
+
+import os
+import sys
+import threading
+import types
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.formatter import DurationFormatter
+
+THREADS = 32
+SECONDS = [secs * 1.37 for secs in range(-10, 3000, 7)] + [
+    86400 * 40, 31556925.1296 * 3,
+]
+
+
+def run_threads(target, threads=THREADS):
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def work(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as err:  # pragma: no cover
+            errors.append(err)
+
+    workers = [
+        threading.Thread(target=work, args=(index, )) for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert not errors
+
+
+class TestThreads(object):
+    def test_shared_tables_are_read_only(self):
+        """Ensure the shared lookup tables cannot be modified in place."""
+        PedanticTimedelta.refresh_plural_forms()
+        with pytest.raises(TypeError):
+            PedanticTimedelta.UNIT_SECONDS['jiffy'] = 0.01
+        with pytest.raises(TypeError):
+            PedanticTimedelta.UNIT_NAMES['hour'] = ('hour', ) * 7
+        with pytest.raises(TypeError):
+            PedanticTimedelta._PLURAL_FORMS[1][('hour', 0)] = ('h', 'h', 'h')
+        assert isinstance(PedanticTimedelta._UNIT_LADDER, tuple)
+
+    def test_set_unit_ladder_names_read_only(self, monkeypatch):
+        """Ensure UNIT_NAMES stays read-only after units are added."""
+        monkeypatch.setattr(
+            PedanticTimedelta, 'UNIT_NAMES', PedanticTimedelta.UNIT_NAMES,
+        )
+        try:
+            PedanticTimedelta.set_unit_ladder(
+                ('second', ('shift', 8 * 3600.0)),
+                unit_names={'shift': ['shift'] * 7},
+            )
+            assert isinstance(PedanticTimedelta.UNIT_NAMES, types.MappingProxyType)
+            assert PedanticTimedelta.UNIT_NAMES['shift'] == ('shift', ) * 7
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+
+    def test_format_and_construct(self):
+        """Ensure concurrent formatting matches single-threaded formatting."""
+        formatter = DurationFormatter(precision=3, abbreviate=5)
+        expected = [
+            (
+                PedanticTimedelta(seconds=secs).time_format_scaled(),
+                PedanticTimedelta.format_seconds(secs),
+                formatter(secs),
+            )
+            for secs in SECONDS
+        ]
+        # Start cold, so the lazily built tables are built concurrently.
+        PedanticTimedelta._PLURAL_FORMS = (None, None)
+        results = [None] * THREADS
+
+        def target(index):
+            results[index] = [
+                (
+                    PedanticTimedelta(seconds=secs).time_format_scaled(),
+                    PedanticTimedelta.format_seconds(secs),
+                    formatter(secs),
+                )
+                for secs in SECONDS
+            ]
+
+        run_threads(target)
+        for result in results:
+            assert result == expected
+
+    def test_ladder_swaps_are_atomic(self):
+        """Ensure readers see one ladder or the other, never a mix."""
+        ladders = (
+            ('second', 'minute', 'hour', 'day'),
+            ('second', 'day', 'week', 'fortnight'),
+        )
+        instances = [PedanticTimedelta(seconds=secs) for secs in SECONDS]
+        allowed = []
+        try:
+            for ladder in ladders:
+                PedanticTimedelta.set_unit_ladder(ladder)
+                allowed.append([
+                    PedanticTimedelta.format_seconds(secs) for secs in SECONDS
+                ])
+            allowed = list(zip(*allowed))
+
+            def target(index):
+                if index == 0:
+                    for swap in range(200):
+                        PedanticTimedelta.set_unit_ladder(ladders[swap % 2])
+                    return
+                for _ in range(5):
+                    for secs, ptd, formats in zip(SECONDS, instances, allowed):
+                        assert PedanticTimedelta.format_seconds(secs) in formats
+                        assert ptd.time_format_scaled() in formats
+
+            run_threads(target)
+        finally:
+            PedanticTimedelta.set_unit_ladder()
+
+    @pytest.mark.skipif(
+        getattr(sys, '_is_gil_enabled', lambda: True)() or (os.cpu_count() or 1) < 4,
+        reason='threads only run in parallel on free-threaded builds (and cores)',
+    )
+    def test_scales_across_threads(self):  # pragma: no cover
+        """Ensure formatting from many threads is not serialized."""
+        import time
+
+        def timed(threads):
+            per_thread = 64000 // threads
+
+            def target(_index):
+                format_seconds = PedanticTimedelta.format_seconds
+                for secs in range(per_thread):
+                    format_seconds(secs * 1.37)
+
+            start = time.perf_counter()
+            run_threads(target, threads)
+            return time.perf_counter() - start
+
+        timed(4)
+        assert timed(4) < timed(1) * 0.75
@@ -0,0 +1,156 @@
+# This file exists within 'human-friendly_pedantic-timedelta' aka 'pedantic_timedelta':
+#
+#   https://github.com/hotoffthehamster/human-friendly_pedantic-timedelta
+#
+# Copyright © 2018-2020 Landon Bouma. All rights reserved.
+#
+# Permission is hereby granted,  free of charge,  to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge,  publish,  distribute, sublicense,
+# and/or  sell copies  of the Software,  and to permit persons  to whom the
+# Software  is  furnished  to do so,  subject  to  the following conditions:
+#
+# The  above  copyright  notice  and  this  permission  notice  shall  be
+# included  in  all  copies  or  substantial  portions  of  the  Software.
+#
+# THE  SOFTWARE  IS  PROVIDED  "AS IS",  WITHOUT  WARRANTY  OF ANY KIND,
+# EXPRESS OR IMPLIED,  INCLUDING  BUT NOT LIMITED  TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE  FOR ANY
+# CLAIM,  DAMAGES OR OTHER LIABILITY,  WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE,  ARISING FROM,  OUT OF  OR IN  CONNECTION WITH THE
+# SOFTWARE   OR   THE   USE   OR   OTHER   DEALINGS  IN   THE  SOFTWARE.
+
+
+"""Tests for ``pedantic_timedelta.ticker``."""
+
+import asyncio
+import time
+
+import pytest
+from pedantic_timedelta import PedanticTimedelta
+from pedantic_timedelta.ticker import ElapsedTicker
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestElapsedTicker(object):
+    @pytest.mark.parametrize('precision', [0, 1, 2])
+    def test_refresh_only_on_change(self, precision):
+        """Ensure each task is formatted once per change of its text."""
+        ticker = ElapsedTicker(precision=precision, clock=lambda: 0.0)
+        start_times = {'new': 0.0, 'hours': -5 * 3600.0, 'future': 10.0}
+        for key, secs_then in start_times.items():
+            assert ticker.track(key, secs_then) == PedanticTimedelta.format_seconds(
+                0.0 - secs_then, precision=precision,
+            )[0]
+        texts = {key: [ticker.text(key)] for key in start_times}
+        while ticker.next_due() <= 2 * 3600:
+            secs_now = ticker.next_due()
+            changes = ticker.refresh(secs_now)
+            # Never re-formatted for nothing.
+            assert changes
+            for key, text in changes.items():
+                assert text == PedanticTimedelta.format_seconds(
+                    secs_now - start_times[key], precision=precision,
+                )[0]
+                assert text != texts[key][-1]
+                texts[key].append(text)
+        # Once per 0.01 hours (at precision 2), and no value is skipped.
+        assert len(texts['hours']) == 2 * 10 ** precision + 1
+        assert ticker.texts() == {
+            key: PedanticTimedelta.format_seconds(
+                2 * 3600 - secs_then, precision=precision,
+            )[0]
+            for key, secs_then in start_times.items()
+        }
+
+    def test_singular_to_plural(self):
+        """Ensure the change to the plural unit name is reported."""
+        ticker = ElapsedTicker(clock=lambda: 0.0)
+        assert ticker.track('task', -3600.0) == '1.00 hour'
+        changes = [ticker.refresh(ticker.next_due()) for _ in range(2)]
+        assert changes == [{'task': '1.00 hours'}, {'task': '1.01 hours'}]
+
+    def test_wakes_just_after_change(self):
+        """Ensure the wake-up margin does not scale with the unit."""
+        ticker = ElapsedTicker(precision=0, clock=lambda: 0.0)
+        assert ticker.track('task', -2.25 * 86400) == '2 days'
+        # The text changes at 2.5 days (or rather, a microsecond later, as
+        # elapsed times are rounded to microseconds), and not (say) 86.4
+        # secs. later.
+        assert 0 < ticker.next_due() - 0.25 * 86400 < 2e-6
+        assert ticker.refresh(ticker.next_due()) == {'task': '3 days'}
+
+    @pytest.mark.parametrize('secs_then', [1.7e9, -1.7e9, 123.456])
+    def test_wakes_after_change_at_any_time(self, secs_then):
+        """Ensure each wake-up sees a change, despite float rounding."""
+        ticker = ElapsedTicker(precision=2, clock=lambda: secs_then)
+        start_times = {'task': secs_then, 'future': secs_then + 10.0}
+        for key, start_time in start_times.items():
+            ticker.track(key, start_time)
+        for _ in range(4000):
+            secs_now = ticker.next_due()
+            changes = ticker.refresh(secs_now)
+            assert changes
+            for key, text in changes.items():
+                assert text == PedanticTimedelta.format_seconds(
+                    secs_now - start_times[key],
+                )[0]
+
+    def test_untrack(self):
+        """Ensure untracked tasks are no longer reported."""
+        ticker = ElapsedTicker(clock=lambda: 0.0)
+        ticker.track('task', 0.0)
+        ticker.track('other', 0.0)
+        ticker.untrack('task')
+        assert 'task' not in ticker
+        assert len(ticker) == 1
+        assert ticker.refresh(1.0) == {'other': '1.00 sec.'}
+        with pytest.raises(KeyError):
+            ticker.untrack('task')
+
+    def test_async_iteration(self):
+        """Ensure changes are yielded until the ticker is closed."""
+        async def tick():
+            received = []
+            async with ElapsedTicker(precision=1, min_interval=0.01) as ticker:
+                ticker.track('task', time.time() - 0.5)
+                async for changes in ticker:
+                    received.append(changes['task'])
+                    if len(received) == 2:
+                        ticker.close()
+            return received
+
+        received = run(tick())
+        assert received[0] in ('0.6 sec.', '0.7 sec.')
+        assert len(received) == 2
+
+    def test_async_track_wakes_iteration(self):
+        """Ensure a newly tracked task is not stuck behind a long sleep."""
+        async def tick(ticker):
+            async for changes in ticker:
+                return changes
+
+        async def track_later(ticker):
+            await asyncio.sleep(0.05)
+            ticker.track('new', time.time() - 0.95)
+
+        async def main():
+            ticker = ElapsedTicker(precision=1, min_interval=0.01)
+            ticker.track('hours', time.time() - 7200.0)
+            changes, _ = await asyncio.wait_for(
+                asyncio.gather(tick(ticker), track_later(ticker)), 5,
+            )
+            return changes
+
+        changes = run(main())
+        assert list(changes) == ['new']
+        assert changes['new'].startswith('1.0 sec')